@@ -1,15 +1,57 @@
-from importlib import metadata
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .datainsight_loader import PolarisAIDataInsightLoader
+if TYPE_CHECKING:
+    from langchain_polaris_ai_datainsight.datainsight_directory_loader import (
+        PolarisAIDataInsightDirectoryLoader,
+    )
+    from langchain_polaris_ai_datainsight.datainsight_loader import (
+        PolarisAIDataInsightLoader,
+    )
+    from langchain_polaris_ai_datainsight.datainsight_payload_store import (
+        FilePayloadStore,
+        SQLitePayloadStore,
+    )
+
+# Public names and their modules. Modules are imported on first access, so that
+# importing the package does not load `langchain_core` or the SDK.
+_LAZY_IMPORTS = {
+    "FilePayloadStore": "datainsight_payload_store",
+    "PolarisAIDataInsightDirectoryLoader": "datainsight_directory_loader",
+    "PolarisAIDataInsightLoader": "datainsight_loader",
+    "SQLitePayloadStore": "datainsight_payload_store",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # `importlib.metadata` is slow to import, so it is resolved on access too
+        from importlib import metadata
+
+        try:
+            value = metadata.version(__package__)
+        except metadata.PackageNotFoundError:
+            # Case where package metadata is not available.
+            value = ""
+        globals()[name] = value
+        return value
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS, "__version__"])
 
-try:
-    __version__ = metadata.version(__package__)
-except metadata.PackageNotFoundError:
-    # Case where package metadata is not available.
-    __version__ = ""
-del metadata  # optional, avoids polluting the results of dir(__package__)
 
 __all__ = [
+    "FilePayloadStore",
+    "PolarisAIDataInsightDirectoryLoader",
     "PolarisAIDataInsightLoader",
+    "SQLitePayloadStore",
     "__version__",
 ]
@@ -0,0 +1,217 @@
+"""PODataInsight directory document loader."""
+
+import logging
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Sequence, get_args
+
+from langchain_core.documents import Document
+from langchain_core.stores import BaseStore
+from polaris_ai_datainsight import (
+    DataInsightClient,
+    IngestionManifest,
+    extract_many,
+)
+from polaris_ai_datainsight.datainsight_client import SupportedExtensionType
+from polaris_ai_datainsight.utils.json_utils import JSONCodec, get_json_codec
+
+from langchain_polaris_ai_datainsight.datainsight_loader import (
+    BaseDataInsightLoader,
+    DataInsightModeType,
+    StrPath,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class PolarisAIDataInsightDirectoryLoader(BaseDataInsightLoader):
+    """
+    Polaris AI DataInsight Directory Loader.
+
+    This loader extracts every supported document of a directory, several at a
+    time, and yields their Documents as each file is extracted.
+
+    Files are matched by `glob` patterns and filtered on the supported extensions:
+    `.doc`, `.docx`, `.ppt`, `.pptx`, `.xls`, `.xlsx`, `.hwp`, `.hwpx`
+
+    Instantiate:
+        ```python
+        from langchain_polaris_ai_datainsight import PolarisAIDataInsightDirectoryLoader
+
+        loader = PolarisAIDataInsightDirectoryLoader(
+            "path/to/corpus",
+            glob="**/*",
+            mode="page",
+            max_workers=16,
+            resources_dir="path/to/save/resources/"
+        )
+        ```
+
+    Lazy load:
+        ```python
+        for doc in loader.lazy_load():
+            print(doc.metadata["source"], doc.page_content[:100])
+        ```
+    """
+
+    def __init__(
+        self,
+        path: StrPath,
+        *,
+        glob: str | Sequence[str] = "**/*",
+        exclude: Sequence[str] = (),
+        api_key: Optional[str] = None,
+        resources_dir: StrPath = "app/",
+        mode: DataInsightModeType = "single",
+        max_workers: int = 8,
+        json_codec: Optional[str | JSONCodec] = None,
+        silent_errors: bool = False,
+        client: Optional[DataInsightClient] = None,
+        payload_store: Optional[BaseStore[str, Any]] = None,
+        chunk_size: int = 1000,
+        length_function: Callable[[str], int] = len,
+        manifest: Optional[IngestionManifest] = None,
+    ):
+        """
+        Initialize the instance.
+
+        Args:
+            `path` (str, Path): Directory to load the documents from.
+            `glob` (str, Sequence[str], optional): Glob patterns of the files to load,
+            relative to `path`. Defaults to "**/*" (every file, recursively).
+            `exclude` (Sequence[str], optional): Glob patterns of the files to skip.
+            `api_key` (str, optional): API authentication key. If not provided,
+            the API key will be retrieved from an environment variable.
+            `resources_dir` (str, optional): Resource directory path. If the
+            directory does not exist, it will be created. Defaults to "app/".
+            `mode` (str, optional): Document loader mode. Valid options are "element",
+            "page", "single" or "chunk". Defaults to "single".
+            `max_workers` (int, optional): Number of files extracted concurrently.
+            Defaults to 8.
+            `json_codec` (str, JSONCodec, optional): JSON backend decoding the
+            extraction results: "orjson", "msgspec" or "json".
+            Defaults to the fastest installed backend.
+            `silent_errors` (bool, optional): Log and skip the files which fail to
+            extract, instead of raising the error. Defaults to False.
+            `client` (DataInsightClient, optional): Shared client used to call the API.
+            If not provided, a client with a pool of `max_workers` connections is
+            opened for each load.
+            `payload_store` (BaseStore, optional): Store receiving the table and chart
+            data and the element list of each Document. The metadata then holds
+            `{"$ref": key}` references, resolved on demand by `get_resource_by_id()`.
+            `chunk_size` (int, optional): Maximum size of the chunks in `chunk` mode.
+            Defaults to 1000.
+            `length_function` (Callable[[str], int], optional): Function measuring the
+            size of a text in `chunk` mode, e.g. a token counter. Defaults to `len`.
+            `manifest` (IngestionManifest, optional): Record of the previous loads. Only
+            new and changed files are extracted and yielded; the unchanged and deleted
+            files are listed in `unchanged_sources` and `deleted_sources` once a load
+            completes.
+
+        Mode:
+            The mode parameter determines how each file is loaded:
+                `element`: Load each element in the pages as a separate Document object.
+                `page`: Load each page in the document as a separate Document object.
+                `single`: Load the entire document as a single Document object.
+                `chunk`: Pack consecutive elements into Document objects of at most
+                `chunk_size`, ready to embed.
+
+            The path of the file is set as `source` in the metadata of every Document.
+        """
+        self.path = Path(path)
+        if not self.path.is_dir():
+            raise ValueError(f"Directory {path} does not exist.")
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer.")
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+
+        self.glob: list[str] = [glob] if isinstance(glob, str) else list(glob)
+        self.exclude: list[str] = list(exclude)
+        self.api_key = api_key
+        self.resources_dir = resources_dir
+        self.mode = mode
+        self.max_workers = max_workers
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+        self.silent_errors = silent_errors
+        self.client = client
+        self.payload_store = payload_store
+        self.chunk_size = chunk_size
+        self.length_function = length_function
+        self.manifest = manifest
+        # Reported by the last load with a manifest
+        self.unchanged_sources: list[str] = []
+        self.deleted_sources: list[str] = []
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """
+        Returns a list of supported file extensions.
+        """
+        return list(get_args(SupportedExtensionType))
+
+    def iter_file_paths(self) -> Iterator[Path]:
+        """
+        Iterate over the files to load, as they are found.
+
+        Yields:
+            Path: Paths of the files matching `glob` and a supported extension,
+            and none of the `exclude` patterns.
+        """
+        supported_extensions = set(self.supported_extensions)
+        seen: set[Path] = set()
+        for pattern in self.glob:
+            for file_path in self.path.glob(pattern):
+                if file_path in seen or file_path.suffix.lower() not in (
+                    supported_extensions
+                ):
+                    continue
+                if any(file_path.match(excluded) for excluded in self.exclude):
+                    continue
+                if not file_path.is_file():
+                    continue
+                seen.add(file_path)
+                yield file_path
+
+    def lazy_load(self) -> Iterator[Document]:
+        """
+        Load Documents lazily, in the order the files finish extracting.
+
+        At most `2 * max_workers` files are scheduled at a time, so the directory
+        is walked progressively and memory stays bounded for large corpora.
+
+        With a `manifest`, the Documents of unchanged files are not yielded again,
+        since they are already indexed downstream. The files deleted since the
+        previous load are listed in `deleted_sources` at the end of the load, so
+        that their Documents can be removed.
+        """
+        self.unchanged_sources = []
+        self.deleted_sources = []
+        results = extract_many(
+            self.iter_file_paths(),
+            client=self.client,
+            api_key=self.api_key,
+            resources_dir=self.resources_dir,
+            max_workers=self.max_workers,
+            json_codec=self.json_codec,
+            manifest=self.manifest,
+        )
+        # Closing the batch cancels the scheduled files if loading stops early
+        with closing(results):
+            for result in results:
+                if result.status == "unchanged":
+                    self.unchanged_sources.append(str(result.source))
+                    continue
+                if result.status == "deleted":
+                    self.deleted_sources.append(str(result.source))
+                    continue
+                if not result.ok:
+                    if not self.silent_errors:
+                        raise result.error
+                    logger.warning("Failed to load %s: %s", result.source, result.error)
+                    continue
+
+                source = str(result.source)
+                for doc in self._iter_documents(result.data["pages"]):
+                    doc.metadata["source"] = source
+                    yield doc
@@ -1,19 +1,598 @@
 """PODataInsight document loader."""
 
+import asyncio
 import os
 import re
+import uuid
+from importlib.util import find_spec
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, Literal, Optional, Tuple, get_args, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    get_args,
+    overload,
+)
 
 from langchain_core.document_loaders.base import BaseLoader
 from langchain_core.documents import Document
+from langchain_core.stores import BaseStore
 from polaris_ai_datainsight import PolarisAIDataInsightExtractor
+from polaris_ai_datainsight.utils.json_utils import JSONCodec
+from polaris_ai_datainsight.utils.table_utils import TableBackendType, to_columnar
 
-DataInsightModeType = Literal["single", "page", "element"]
+from langchain_polaris_ai_datainsight.datainsight_payload_store import (
+    PAYLOAD_RESOURCE_PREFIXES,
+    is_payload_ref,
+    make_payload_ref,
+    resolve_payload_refs,
+)
+
+if TYPE_CHECKING:
+    from polaris_ai_datainsight import AsyncDataInsightClient
+
+DataInsightModeType = Literal["single", "page", "element", "chunk"]
 StrPath = str | Path
 
+# Placeholders of the resources in the page content
+RESOURCE_PLACEHOLDER_PATTERN = re.compile(
+    r'<img src="#" alt="" id="(di\.[^"]*)"/>|<div id="(di\.[^"]*)"/>'
+)
+# Words with their trailing whitespace, to split text elements larger than a chunk
+_TEXT_SPLIT_PATTERN = re.compile(r"\s*\S+\s*|\s+")
+
+# (content, element metadata, resource id, resource) of a parsed element
+ElementParts = Tuple[str, Dict, Optional[str], Any]
+# Bounding box sides, and how the boxes of a chunk's elements are merged
+_BOX_SIDES = (("left", min), ("top", min), ("right", max), ("bottom", max))
+# Number of Documents built per worker thread call by `alazy_load`
+_ASYNC_BATCH_SIZE = 64
+
+
+class BaseDataInsightLoader(BaseLoader):
+    """
+    Common base of the Polaris AI DataInsight document loaders.
+
+    Converts extraction results to Document objects according to `mode`.
+    Subclasses provide the documents to extract.
+
+    With a `payload_store`, the table and chart data and the per-element metadata
+    are written to the store, and the Documents only hold references to them.
+    """
+
+    mode: Optional[DataInsightModeType] = None
+    payload_store: Optional[BaseStore[str, Any]] = None
+    chunk_size: int = 1000
+    length_function: Callable[[str], int] = len
+
+    @property
+    def supported_modes(self) -> list[str]:
+        return list(get_args(DataInsightModeType))
+
+    def _convert_json_to_documents(self, json_data: Dict) -> list[Document]:
+        """
+        Convert JSON data to Document objects.
+
+        Args:
+            json_data (Dict): JSON data to convert.
+
+        Returns:
+            list[Document]: List of Document objects.
+        """
+        return list(self._iter_documents(json_data["pages"]))
+
+    def _iter_documents(self, doc_pages: Iterable[Dict]) -> Iterator[Document]:
+        """
+        Convert pages of JSON data to Document objects, one page at a time.
+
+        Args:
+            doc_pages (Iterable[Dict]): Pages of the JSON data.
+
+        Yields:
+            Document: Document objects, as each page is converted.
+        """
+        if self.mode == "element":
+            for doc_page in doc_pages:
+                for doc_element in doc_page["elements"]:
+                    element_content, element_metadata = self._parse_doc_element(
+                        doc_element
+                    )
+                    yield Document(
+                        page_content=element_content, metadata=element_metadata
+                    )
+        elif self.mode == "page":
+            for doc_page in doc_pages:
+                yield self._build_document(doc_page["elements"])
+        elif self.mode == "chunk":
+            yield from self._iter_chunks(doc_pages)
+        else:
+            yield self._build_document(
+                chain.from_iterable(doc_page["elements"] for doc_page in doc_pages)
+            )
+
+    def _build_document(self, doc_elements: Iterable[Dict]) -> Document:
+        """
+        Build one Document from a sequence of elements, in a single pass.
+
+        The element contents are collected in a list and joined once, so the cost
+        per element does not grow with the size of the document. The position of
+        each resource placeholder is recorded in `metadata["resource_index"]` as
+        `{"resource id": [start, end]}` character offsets in the page content.
+
+        Args:
+            doc_elements (Iterable[Dict]): Elements of the page or document.
+
+        Returns:
+            Document: Document with the contents of the elements, one per line.
+        """
+        return self._assemble_document(
+            self._parse_doc_element_parts(doc_element) for doc_element in doc_elements
+        )
+
+    def _assemble_document(
+        self, element_parts: Iterable[ElementParts], trailing_newline: bool = True
+    ) -> Document:
+        """
+        Build one Document from parsed elements. See `_build_document()`.
+
+        Without `trailing_newline`, the last element content is not followed by a
+        newline, so that chunks are not longer than measured.
+        """
+        contents: list[str] = []
+        elements: list[Dict] = []
+        resources: Dict[str, Any] = {}  # {"image id" : "image path"}
+        resource_index: Dict[str, list[int]] = {}  # {"image id" : [start, end]}
+        offset = 0
+        for element_content, element_metadata, resource_id, resource in element_parts:
+            contents.append(element_content)
+            elements.append(element_metadata)
+            if resource_id is not None:
+                resources[resource_id] = resource
+                resource_index[resource_id] = _placeholder_span(element_content, offset)
+            # Each element content is followed by a newline
+            offset += len(element_content) + 1
+
+        if trailing_newline:
+            contents.append("")
+        metadata = {
+            "elements": elements,
+            "resources": resources,
+            "resource_index": resource_index,
+        }
+        if self.payload_store is not None:
+            self._store_payloads(metadata)
+        return Document(
+            page_content="\n".join(contents) if elements else "", metadata=metadata
+        )
+
+    def _iter_chunks(self, doc_pages: Iterable[Dict]) -> Iterator[Document]:
+        """
+        Pack consecutive elements into Documents of at most `chunk_size`, as
+        measured by `length_function`, in a single pass over the pages.
+
+        Chunks may span pages. Text elements larger than a chunk are split between
+        words; tables, charts and images are never split. Besides the metadata of
+        `_build_document()`, each chunk has the bounding box of its elements on
+        each page in `metadata["coordinates"]`, as `[{"page": 1, "left": ...}]`.
+
+        Args:
+            doc_pages (Iterable[Dict]): Pages of the JSON data.
+
+        Yields:
+            Document: Chunks, as soon as each one is full.
+        """
+        chunk_size = self.chunk_size
+        length_function = self.length_function
+        separator_length = length_function("\n")
+
+        chunk_parts: list[ElementParts] = []
+        chunk_pages: list[int] = []
+        length = 0
+        for page_index, doc_page in enumerate(doc_pages):
+            page_number = doc_page.get("pageNum", page_index + 1)
+            for doc_element in doc_page["elements"]:
+                parts = self._parse_doc_element_parts(doc_element)
+                for piece, piece_length in self._split_element_parts(parts):
+                    if chunk_parts and (
+                        length + separator_length + piece_length > chunk_size
+                    ):
+                        yield self._build_chunk(chunk_parts, chunk_pages)
+                        chunk_parts, chunk_pages, length = [], [], 0
+                    elif chunk_parts:
+                        length += separator_length
+                    length += piece_length
+                    chunk_parts.append(piece)
+                    chunk_pages.append(page_number)
+
+        if chunk_parts:
+            yield self._build_chunk(chunk_parts, chunk_pages)
+
+    def _split_element_parts(
+        self, parts: ElementParts
+    ) -> Iterator[Tuple[ElementParts, int]]:
+        # Split a text element larger than a chunk between words, and measure
+        # each piece
+        element_content, element_metadata, resource_id, _ = parts
+        length_function = self.length_function
+        content_length = length_function(element_content or "")
+        if resource_id is not None or content_length <= self.chunk_size:
+            yield parts, content_length
+            return
+
+        words: list[str] = []
+        length = 0
+        for word in _TEXT_SPLIT_PATTERN.findall(element_content):
+            word_length = length_function(word)
+            if words and length + word_length > self.chunk_size:
+                yield self._text_piece(words, element_metadata)
+                words, length = [], 0
+            words.append(word)
+            length += word_length
+        if words:
+            yield self._text_piece(words, element_metadata)
+
+    def _text_piece(
+        self, words: list[str], element_metadata: Dict
+    ) -> Tuple[ElementParts, int]:
+        piece = "".join(words).strip()
+        parts = (piece, dict(element_metadata), None, None)
+        return parts, self.length_function(piece)
+
+    def _build_chunk(
+        self, chunk_parts: list[ElementParts], chunk_pages: list[int]
+    ) -> Document:
+        # Merged bounding box of the elements of each page, in page order
+        boxes: Dict[int, Dict] = {}
+        for (_, element_metadata, _, _), page_number in zip(chunk_parts, chunk_pages):
+            box = boxes.setdefault(page_number, {"page": page_number})
+            coordinates = element_metadata.get("coordinates") or {}
+            for side, merge in _BOX_SIDES:
+                if side in coordinates:
+                    box[side] = (
+                        merge(box[side], coordinates[side])
+                        if side in box
+                        else coordinates[side]
+                    )
+
+        document = self._assemble_document(chunk_parts, trailing_newline=False)
+        document.metadata["coordinates"] = list(boxes.values())
+        return document
+
+    def _store_payloads(self, metadata: Dict) -> None:
+        """
+        Move the table and chart data, and the element list, of a Document's
+        metadata to `payload_store`, leaving `{"$ref": key}` references in place.
+
+        The keys are `"<namespace>/<resource id>"` and `"<namespace>/elements"`,
+        with a namespace unique to the Document. They are written in one batch.
+
+        Args:
+            metadata (Dict): Metadata of the Document, updated in place.
+        """
+        namespace = uuid.uuid4().hex
+        payloads = []
+        resources = metadata.get("resources", {})
+        for resource_id, resource in resources.items():
+            if resource_id.startswith(PAYLOAD_RESOURCE_PREFIXES):
+                key = f"{namespace}/{resource_id}"
+                payloads.append((key, resource))
+                resources[resource_id] = make_payload_ref(key)
+        if metadata.get("elements"):
+            key = f"{namespace}/elements"
+            payloads.append((key, metadata["elements"]))
+            metadata["elements"] = make_payload_ref(key)
+        if payloads:
+            self.payload_store.mset(payloads)
+
+    def _parse_doc_element(self, doc_element: Dict) -> Tuple[str, Dict]:
+        """Parse a document element and extract its content and metadata.
+
+        Args:
+            doc_element (Dict): The document element to parse.
+
+        Returns:
+            Tuple[str, Dict]: The extracted content and metadata.
+        """
+        element_content, element_metadata, resource_id, resource = (
+            self._parse_doc_element_parts(doc_element)
+        )
+        if resource_id is not None:
+            element_metadata["resources"] = {resource_id: resource}
+            element_metadata["resource_index"] = {
+                resource_id: _placeholder_span(element_content, 0)
+            }
+            if self.payload_store is not None:
+                self._store_payloads(element_metadata)
+        return element_content, element_metadata
+
+    def _parse_doc_element_parts(self, doc_element: Dict) -> ElementParts:
+        """Parse a document element into its content, metadata and resource.
+
+        Args:
+            doc_element (Dict): The document element to parse.
+
+        Returns:
+            Tuple[str, Dict, Optional[str], Any]: The extracted content, the metadata,
+            and the id and data of the resource (image, table or chart) of the
+            element, or (None, None) for text elements.
+        """
+        element_id = doc_element.get("id")
+        data_type = doc_element.pop("type")
+        content = doc_element.pop("content")
+        boundary_box = doc_element.pop("boundaryBox")
+
+        element_metadata = {
+            "type": data_type,
+            "coordinates": boundary_box,
+        }
+
+        # Extract the content data based on the data type
+        if data_type == "text":
+            return content.get("text"), element_metadata, None, None
+
+        elif data_type == "table":
+            table_id = f"di.table.{element_id}"
+            if "json" in content:
+                table_content = content.get("json")
+            elif "csv" in content:
+                table_content = content.get("csv")
+            else:
+                raise ValueError(f"Table content not found for {element_id} element")
+
+            element_content = f'\n\n<div id="{table_id}"/>\n'
+            return element_content, element_metadata, table_id, table_content
+
+        elif data_type == "chart":
+            chart_id = f"di.chart.{element_id}"
+            chart_image_path = content.get("src")
+            chart_content = content.get("csv")
+            if not chart_image_path:
+                raise ValueError(f"Image path not found for {chart_image_path}")
+            if not chart_content:
+                raise ValueError(f"Chart content not found for {element_id} element")
+
+            element_content = f'\n\n<div id="{chart_id}"/>\n'
+            chart_resource = {"src": chart_image_path, "csv": chart_content}
+            return element_content, element_metadata, chart_id, chart_resource
+
+        else:  # image and shape for data_type
+            image_id = f"di.image.{element_id}"
+            image_path = content.get("src")  # image filename
+            if not image_path:
+                raise ValueError(f"Image path not found for {image_path}")
+
+            # Make html tag for image resource
+            element_content = f'\n\n<img src="#" alt="" id="{image_id}"/>\n\n'
+            return element_content, element_metadata, image_id, image_path
+
+    def _validate_data_structure(self, json_data):
+        if "pages" not in json_data:
+            raise ValueError("Invalid JSON data structure.")
+        if "elements" not in json_data["pages"][0]:
+            raise ValueError("Invalid JSON data structure.")
+
+    @staticmethod
+    def get_ids_from_document(document: Document) -> list[str]:
+        """
+        Look for image and table ids in the document's page content, and return list of ids.
+
+        The ids are read from `metadata["resource_index"]` when the Document was
+        built by the loader. Otherwise, or if the index no longer matches the page
+        content (e.g. the Document was split), the page content is scanned.
+
+        Args:
+            document (Document): Document object to extract resource ids from.
+
+        Returns:
+            List[str]: List of resource ids.
+        """
+        if not isinstance(document, Document):
+            raise ValueError("The document must be an instance of Document.")
+        if "resources" not in document.metadata:
+            return []
+        resource_index = _valid_resource_index(document)
+        if resource_index is not None:
+            return list(resource_index)
+
+        return [
+            match.group(1) or match.group(2)
+            for match in RESOURCE_PLACEHOLDER_PATTERN.finditer(document.page_content)
+        ]
+
+    @staticmethod
+    def get_resource_by_id(
+        document: Document,
+        resource_id: str,
+        payload_store: Optional[BaseStore[str, Any]] = None,
+    ) -> str | list[dict]:
+        """
+        Get resource by id from the document.
+
+        Args:
+            document (Document): Document object to extract resource from.
+            resource_id (str): Resource id to extract.
+            payload_store (BaseStore, optional): Store holding the table and chart
+                data, if the Document was loaded with a `payload_store`.
+
+        Returns:
+            str | list[dict]: Resource data.
+        """
+        if not isinstance(document, Document):
+            raise ValueError("The document must be an instance of Document.")
+        if "resources" not in document.metadata:
+            return {}
+
+        resource = document.metadata["resources"].get(resource_id)
+        if not resource:
+            raise ValueError(f"Resource with id {resource_id} not found.")
+        if is_payload_ref(resource):
+            return resolve_payload_refs({resource_id: resource}, payload_store)[
+                resource_id
+            ]
+        return resource
+
+    @staticmethod
+    def get_table_by_id(
+        document: Document,
+        resource_id: str,
+        backend: TableBackendType = "numpy",
+        header: bool = True,
+        payload_store: Optional[BaseStore[str, Any]] = None,
+    ) -> Any:
+        """
+        Get a table or chart of the document as columns with inferred dtypes.
+
+        Args:
+            document (Document): Document object to extract the table from.
+            resource_id (str): Id of the table or chart, e.g. "di.table.3".
+            backend (str, optional): "numpy" for a dict of NumPy arrays, or "arrow"
+                for a ``pyarrow.Table``. Defaults to "numpy".
+            header (bool, optional): Use the first row as column names.
+                Defaults to True.
+            payload_store (BaseStore, optional): Store holding the table and chart
+                data, if the Document was loaded with a `payload_store`.
+
+        Returns:
+            Dict[str, numpy.ndarray] | pyarrow.Table: Columns of the table.
+        """
+        if not resource_id.startswith(PAYLOAD_RESOURCE_PREFIXES):
+            raise ValueError(f"Resource {resource_id} is not a table or a chart.")
+        resource = BaseDataInsightLoader.get_resource_by_id(
+            document, resource_id, payload_store
+        )
+        return to_columnar(resource, backend=backend, header=header)
+
+    @staticmethod
+    def get_elements_from_document(
+        document: Document, payload_store: Optional[BaseStore[str, Any]] = None
+    ) -> list[dict]:
+        """
+        Get the metadata (type and coordinates) of the elements of the document.
+
+        Args:
+            document (Document): Document object built in `page` or `single` mode.
+            payload_store (BaseStore, optional): Store holding the element list,
+                if the Document was loaded with a `payload_store`.
+
+        Returns:
+            list[dict]: Metadata of each element, in the page content order.
+        """
+        if not isinstance(document, Document):
+            raise ValueError("The document must be an instance of Document.")
+        elements = document.metadata.get("elements", [])
+        return resolve_payload_refs({"elements": elements}, payload_store)["elements"]
+
+    @staticmethod
+    def substitute_resources(
+        document: Document,
+        substitute: Callable[[str, Any], str],
+        payload_store: Optional[BaseStore[str, Any]] = None,
+    ) -> str:
+        """
+        Replace the resource placeholders of the document's page content.
+
+        The page content is spliced at the offsets of `metadata["resource_index"]`
+        in a single pass, or scanned once if the Document has no index or the
+        index no longer matches the page content.
+
+        Args:
+            document (Document): Document object whose placeholders to replace.
+            substitute (Callable[[str, Any], str]): Function returning the text of a
+                placeholder from the resource id and the resource data.
+            payload_store (BaseStore, optional): Store holding the table and chart
+                data, if the Document was loaded with a `payload_store`. The data
+                is fetched in one batch.
+
+        Returns:
+            str: The page content with the placeholders replaced.
+        """
+        if not isinstance(document, Document):
+            raise ValueError("The document must be an instance of Document.")
+        page_content = document.page_content
+        resources = resolve_payload_refs(
+            document.metadata.get("resources", {}), payload_store
+        )
+        resource_index = _valid_resource_index(document)
+
+        if resource_index is None:
+            return RESOURCE_PLACEHOLDER_PATTERN.sub(
+                lambda match: substitute(
+                    match.group(1) or match.group(2),
+                    resources.get(match.group(1) or match.group(2)),
+                ),
+                page_content,
+            )
+
+        parts = []
+        position = 0
+        for resource_id, (start, end) in sorted(
+            resource_index.items(), key=lambda item: item[1][0]
+        ):
+            parts.append(page_content[position:start])
+            parts.append(substitute(resource_id, resources.get(resource_id)))
+            position = end
+        parts.append(page_content[position:])
+        return "".join(parts)
+
+    @staticmethod
+    def get_resources_from_documents(
+        documents: list[Document],
+        payload_store: Optional[BaseStore[str, Any]] = None,
+    ) -> dict:
+        """
+        Get resources from documents.
+
+        Args:
+            documents (list[Document]): List of Document objects to extract resources from.
+            payload_store (BaseStore, optional): Store holding the table and chart
+                data, if the Documents were loaded with a `payload_store`. The data
+                is fetched in one batch.
 
-class PolarisAIDataInsightLoader(BaseLoader):
+        Returns:
+            dict: Dictionary of resources.
+        """
+        if not isinstance(documents, list):
+            raise ValueError("The documents must be a list of Document objects.")
+
+        resources = {}
+        for document in documents:
+            if "resources" in document.metadata:
+                resources.update(document.metadata["resources"])
+        return resolve_payload_refs(resources, payload_store)
+
+
+def _valid_resource_index(document: Document) -> Optional[Dict[str, list[int]]]:
+    # Text splitters copy the metadata of a Document to each of its pieces, so the
+    # index is only trusted if every span still holds the placeholder of its id
+    resource_index = document.metadata.get("resource_index")
+    if resource_index is None:
+        return None
+    for resource_id, (start, end) in resource_index.items():
+        match = RESOURCE_PLACEHOLDER_PATTERN.fullmatch(
+            document.page_content, start, end
+        )
+        if match is None or (match.group(1) or match.group(2)) != resource_id:
+            return None
+    return resource_index
+
+
+def _placeholder_span(element_content: str, offset: int) -> list[int]:
+    # Resource element contents are a placeholder tag surrounded by newlines
+    start = offset + len(element_content) - len(element_content.lstrip("\n"))
+    end = offset + len(element_content.rstrip("\n"))
+    return [start, end]
+
+
+class PolarisAIDataInsightLoader(BaseDataInsightLoader):
     """
     Polaris AI DataInsight Document Loader.
 
@@ -66,6 +645,14 @@ class PolarisAIDataInsightLoader(BaseLoader):
             print(docs[0].page_content[:100])
             print(docs[0].metadata)
         ```
+
+    Async load:
+        ```python
+            async for doc in loader.alazy_load():
+                ...
+
+            docs = await loader.aload()
+        ```
     """
 
     @overload
@@ -76,17 +663,27 @@ class PolarisAIDataInsightLoader(BaseLoader):
         api_key: Optional[str],
         resources_dir: StrPath = "app/",
         mode: DataInsightModeType = "single",
+        json_codec: Optional[str | JSONCodec] = None,
+        async_client: Optional["AsyncDataInsightClient"] = None,
+        payload_store: Optional[BaseStore[str, Any]] = None,
+        chunk_size: int = 1000,
+        length_function: Callable[[str], int] = len,
     ): ...
 
     @overload
     def __init__(
         self,
         *,
-        file: bytes,
+        file: bytes | BinaryIO | Iterable[bytes],
         filename: str,
         api_key: Optional[str],
         resources_dir: StrPath = "app/",
         mode: DataInsightModeType = "single",
+        json_codec: Optional[str | JSONCodec] = None,
+        async_client: Optional["AsyncDataInsightClient"] = None,
+        payload_store: Optional[BaseStore[str, Any]] = None,
+        chunk_size: int = 1000,
+        length_function: Callable[[str], int] = len,
     ): ...
 
     def __init__(self, *args, **kwargs):
@@ -104,8 +701,10 @@ class PolarisAIDataInsightLoader(BaseLoader):
         Args:
             `file_path` (str, Path): Path to the file to process.
             Use instead of `file` and `filename`.
-            `file` (bytes): Bytes data of the file to process
-            . Use instead of `file_path` and must be provided with `filename`.
+            `file` (bytes, BinaryIO, Iterable[bytes]): Data of the file to process:
+            bytes, an open binary file object or an iterator of bytes chunks.
+            File objects and iterators are streamed to the API.
+            Use instead of `file_path` and must be provided with `filename`.
             `filename` (str): Name of the file when using bytes data.
             Must be provided with `file`.
             `api_key` (str, optional): API authentication key. If not provided,
@@ -114,13 +713,29 @@ class PolarisAIDataInsightLoader(BaseLoader):
             `resources_dir` (str, optional): Resource directory path. If the
             directory does not exist, it will be created. Defaults to "app/".
             `mode` (str, optional): Document loader mode. Valid options are "element",
-            "page", or "single". Defaults to "single".
+            "page", "single" or "chunk". Defaults to "single".
+            `json_codec` (str, JSONCodec, optional): JSON backend decoding the
+            extraction results: "orjson", "msgspec" or "json".
+            Defaults to the fastest installed backend.
+            `async_client` (AsyncDataInsightClient, optional): Shared async client used
+            by `alazy_load()` and `aload()`. Share one client across loaders so that
+            many documents are extracted concurrently over one connection pool.
+            `payload_store` (BaseStore, optional): Store receiving the table and chart
+            data and the element list of each Document, e.g. `InMemoryStore`,
+            `FilePayloadStore` or `SQLitePayloadStore`. The metadata then holds
+            `{"$ref": key}` references, resolved on demand by `get_resource_by_id()`.
+            `chunk_size` (int, optional): Maximum size of the chunks in `chunk` mode.
+            Defaults to 1000.
+            `length_function` (Callable[[str], int], optional): Function measuring the
+            size of a text in `chunk` mode, e.g. a token counter. Defaults to `len`.
 
         Mode:
             The mode parameter determines how the document is loaded:
                 `element`: Load each element in the pages as a separate Document object.
                 `page`: Load each page in the document as a separate Document object.
                 `single`: Load the entire document as a single Document object.
+                `chunk`: Pack consecutive elements into Document objects of at most
+                `chunk_size`, ready to embed.
 
         Example:
             - Using a file path:
@@ -146,6 +761,11 @@ class PolarisAIDataInsightLoader(BaseLoader):
         """
 
         self.mode: DataInsightModeType = kwargs.get("mode")
+        self.payload_store = kwargs.get("payload_store")
+        self.chunk_size = kwargs.get("chunk_size", 1000)
+        self.length_function = kwargs.get("length_function", len)
+        if not isinstance(self.chunk_size, int) or self.chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
         self.doc_extractor: PolarisAIDataInsightExtractor = None
         _api_key = kwargs.get(
             "api_key", os.environ.get("POLARIS_AI_DATA_INSIGHT_API_KEY")
@@ -168,6 +788,8 @@ class PolarisAIDataInsightLoader(BaseLoader):
                 file_path=kwargs["file_path"],
                 api_key=_api_key,
                 resources_dir=kwargs.get("resources_dir", "app/"),
+                json_codec=kwargs.get("json_codec"),
+                async_client=kwargs.get("async_client"),
             )
 
         # Check if the file is provided
@@ -175,260 +797,80 @@ class PolarisAIDataInsightLoader(BaseLoader):
             file = kwargs["file"]
             filename = kwargs["filename"]
 
-            if not isinstance(file, bytes):
-                raise ValueError("`file` must be a bytes object.")
-
             if not isinstance(filename, str):
                 raise ValueError("`filename` must be a string.")
 
+            # `file` (bytes, binary file object or chunk iterator) is validated
+            # by the extractor
             self.doc_extractor = PolarisAIDataInsightExtractor(
-                file=kwargs["file"],
-                filename=kwargs["filename"],
+                file=file,
+                filename=filename,
                 api_key=_api_key,
                 resources_dir=kwargs.get("resources_dir", "app/"),
+                json_codec=kwargs.get("json_codec"),
+                async_client=kwargs.get("async_client"),
             )
 
         else:
             raise ValueError("Either file_path or file/filename must be provided.")
 
     @property
-    def supported_modes(self) -> list[str]:
-        return list(get_args(DataInsightModeType))
-
-    def lazy_load(self) -> Iterator[Document]:
-        json_data = self.doc_extractor.extract()
-
-        # Convert the JSON data to Document objects
-        document_list = self._convert_json_to_documents(json_data)
-
-        yield from document_list
-
-    def _convert_json_to_documents(self, json_data: Dict) -> list[Document]:
-        """
-        Convert JSON data to Document objects.
-
-        Args:
-            json_data (Dict): JSON data to convert.
-
-        Returns:
-            list[Document]: List of Document objects.
+    def json_codec(self) -> JSONCodec:
         """
-        if self.mode == "element":
-            document_list = []
-            for doc_page in json_data["pages"]:
-                for doc_element in doc_page["elements"]:
-                    element_content, element_metadata = self._parse_doc_element(
-                        doc_element
-                    )
-                    document_list.append(
-                        Document(
-                            page_content=element_content, metadata=element_metadata
-                        )
-                    )
-            return document_list
-        elif self.mode == "page":
-            document_list = []
-            for doc_page in json_data["pages"]:
-                page_content = ""
-                page_metadata: Dict[str, Any] = {
-                    "elements": [],
-                    "resources": {},  # {"image id" : "image path"}
-                }
-                # Parse elements in the page
-                for doc_element in doc_page["elements"]:
-                    element_content, element_metadata = self._parse_doc_element(
-                        doc_element
-                    )
-
-                    # Add element content to page content
-                    page_content += element_content + "\n"
-
-                    # Add element metadata to page metadata
-                    if "resources" in element_metadata:
-                        page_metadata["resources"].update(
-                            element_metadata.pop("resources")
-                        )
-                    page_metadata["elements"].append(element_metadata)
-
-                # Add page document
-                document_list.append(
-                    Document(page_content=page_content, metadata=page_metadata)
-                )
-            return document_list
-        else:
-            doc_content = ""
-            doc_metadata: Dict[str, Any] = {
-                "elements": [],
-                "resources": {},  # {"image id" : "image path"}
-            }
-            # Parse elements in the document
-            for doc_page in json_data["pages"]:
-                for doc_element in doc_page["elements"]:
-                    element_content, element_metadata = self._parse_doc_element(
-                        doc_element
-                    )
-
-                    # Add element content to document content
-                    doc_content += element_content + "\n"
-
-                    # Add element metadata to document metadata
-                    if "resources" in element_metadata:
-                        doc_metadata["resources"].update(
-                            element_metadata.pop("resources")
-                        )
-                    doc_metadata["elements"].append(element_metadata)
-
-            return [Document(page_content=doc_content, metadata=doc_metadata)]
-
-    def _parse_doc_element(self, doc_element: Dict) -> Tuple[str, Dict]:
-        """Parse a document element and extract its content and metadata.
-
-        Args:
-            doc_element (Dict): The document element to parse.
-
-        Returns:
-            Tuple[str, Dict]: The extracted content and metadata.
+        JSON backend used to decode, and to re-serialize, extraction results.
         """
-        element_id = doc_element.get("id")
-        data_type = doc_element.pop("type")
-        content = doc_element.pop("content")
-        boundary_box = doc_element.pop("boundaryBox")
-
-        # Result dictionary
-        element_content = ""
-        element_metadata = {
-            "type": data_type,
-            "coordinates": boundary_box,
-        }
+        return self.doc_extractor.json_codec
 
-        # Extract the content data based on the data type
-        if data_type == "text":
-            element_content = content.get("text")
-
-        elif data_type == "table":
-            table_id = f"di.table.{element_id}"
-            if "json" in content:
-                table_content = content.get("json")
-            elif "csv" in content:
-                table_content = content.get("csv")
-            else:
-                raise ValueError(f"Table content not found for {element_id} element")
-
-            element_content = f'\n\n<div id="{table_id}"/>\n'
-
-            if element_metadata.get("resources") is None:
-                element_metadata["resources"] = {}
-            element_metadata["resources"][table_id] = table_content
-
-        elif data_type == "chart":
-            chart_id = f"di.chart.{element_id}"
-            chart_image_path = content.get("src")
-            chart_content = content.get("csv")
-            if not chart_image_path:
-                raise ValueError(f"Image path not found for {chart_image_path}")
-            if not chart_content:
-                raise ValueError(f"Chart content not found for {element_id} element")
-
-            element_content = f'\n\n<div id="{chart_id}"/>\n'
-
-            if element_metadata.get("resources") is None:
-                element_metadata["resources"] = {}
-            element_metadata["resources"][chart_id] = {
-                "src": chart_image_path,
-                "csv": chart_content,
-            }
-
-        else:  # image and shape for data_type
-            image_id = f"di.image.{element_id}"
-            image_path = content.get("src")  # image filename
-            if not image_path:
-                raise ValueError(f"Image path not found for {image_path}")
-
-            # Make html tag for image resource
-            element_content = f'\n\n<img src="#" alt="" id="{image_id}"/>\n\n'
-
-            # Add metadata for image file access
-            if element_metadata.get("resources") is None:
-                element_metadata["resources"] = {}
-            element_metadata["resources"][image_id] = image_path
-
-        return element_content, element_metadata
-
-    def _validate_data_structure(self, json_data):
-        if "pages" not in json_data:
-            raise ValueError("Invalid JSON data structure.")
-        if "elements" not in json_data["pages"][0]:
-            raise ValueError("Invalid JSON data structure.")
-
-    @staticmethod
-    def get_ids_from_document(document: Document) -> list[str]:
+    def lazy_load(self) -> Iterator[Document]:
         """
-        Look for image and table ids in the document's page content, and return list of ids.
-
-        Args:
-            document (Document): Document object to extract resource ids from.
+        Load Documents lazily.
 
-        Returns:
-            List[str]: List of resource ids.
+        In `page`, `element` and `chunk` modes, the result is read one page at a
+        time and the Documents of each page are yielded as soon as it is
+        converted, so only one page is held in memory. In `single` mode, the
+        whole document is extracted first.
         """
-        if not isinstance(document, Document):
-            raise ValueError("The document must be an instance of Document.")
-        if "resources" not in document.metadata:
-            return []
-
-        # result dictionary
-        resource_ids = []
+        if self.mode in ("page", "element", "chunk"):
+            yield from self._iter_documents(self.doc_extractor.iter_pages())
+            return
 
-        page_content = document.page_content
-        page_content_split = page_content.split("\n\n")
-        for content in page_content_split:
-            if content.startswith('<img src="#" alt="" id="di.') or content.startswith(
-                '<div id="di.'
-            ):
-                resource_id = re.search(r'id="(.*?)"', content)
-                if resource_id:
-                    resource_id = resource_id.group(1)
-                    resource_ids.append(resource_id)
-        return resource_ids
+        json_data = self.doc_extractor.extract()
+        yield from self._iter_documents(json_data["pages"])
 
-    @staticmethod
-    def get_resource_by_id(document: Document, resource_id: str) -> str | list[dict]:
+    def load_tables(
+        self, backend: TableBackendType = "numpy", header: bool = True
+    ) -> Dict[str, Any]:
         """
-        Get resource by id from the document.
+        Load the tables and charts of the document as columns with inferred dtypes,
+        without building Documents.
 
         Args:
-            document (Document): Document object to extract resource from.
-            resource_id (str): Resource id to extract.
+            backend (str, optional): "numpy" for dicts of NumPy arrays, or "arrow"
+                for ``pyarrow.Table`` objects. Defaults to "numpy".
+            header (bool, optional): Use the first row of each table as column
+                names. Defaults to True.
 
         Returns:
-            str | list[dict]: Resource data.
+            Dict[str, Any]: Columnar tables by resource id, e.g. "di.table.3".
         """
-        if not isinstance(document, Document):
-            raise ValueError("The document must be an instance of Document.")
-        if "resources" not in document.metadata:
-            return {}
-
-        resource = document.metadata["resources"].get(resource_id)
-        if not resource:
-            raise ValueError(f"Resource with id {resource_id} not found.")
-        return resource
+        return self.doc_extractor.extract_tables(backend=backend, header=header)
 
-    @staticmethod
-    def get_resources_from_documents(documents: list[Document]) -> dict:
+    async def alazy_load(self) -> AsyncIterator[Document]:
         """
-        Get resources from documents.
+        Load Documents lazily without blocking the event loop.
 
-        Args:
-            documents (list[Document]): List of Document objects to extract resources from.
-
-        Returns:
-            dict: Dictionary of resources.
+        The document is uploaded and downloaded with the async client of the
+        extractor (``httpx``). The result archive is processed, and the Documents
+        are built and their payloads stored, in worker threads. Without ``httpx``,
+        `lazy_load()` runs in an executor instead.
         """
-        if not isinstance(documents, list):
-            raise ValueError("The documents must be a list of Document objects.")
-
-        resources = {}
-        for document in documents:
-            if "resources" in document.metadata:
-                resources.update(document.metadata["resources"])
-        return resources
+        if self.doc_extractor.async_client is None and find_spec("httpx") is None:
+            async for doc in super().alazy_load():
+                yield doc
+            return
+
+        json_data = await self.doc_extractor.aextract()
+        docs = self._iter_documents(json_data["pages"])
+        while batch := await asyncio.to_thread(list, islice(docs, _ASYNC_BATCH_SIZE)):
+            for doc in batch:
+                yield doc
@@ -0,0 +1,238 @@
+"""PODataInsight resource payload stores."""
+
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+
+from langchain_core.stores import BaseStore
+from polaris_ai_datainsight.utils.json_utils import JSONCodec, get_json_codec
+
+# Key of the lightweight reference left in the metadata in place of a payload
+PAYLOAD_REF_KEY = "$ref"
+# Resources whose data is moved to the payload store. Images are file paths.
+PAYLOAD_RESOURCE_PREFIXES = ("di.table.", "di.chart.")
+
+# Keys are "<namespace>/<resource id>", e.g. "3f2a.../di.table.4"
+_KEY_PATTERN = re.compile(r"[A-Za-z0-9_.-]+(/[A-Za-z0-9_.-]+)*")
+# Bound on the number of SQLite query parameters
+_SQLITE_BATCH_SIZE = 500
+
+
+def make_payload_ref(key: str) -> Dict[str, str]:
+    """
+    Reference to the payload stored under `key`.
+    """
+    return {PAYLOAD_REF_KEY: key}
+
+
+def is_payload_ref(value: Any) -> bool:
+    """
+    Whether `value` is a reference to a stored payload.
+    """
+    return isinstance(value, dict) and len(value) == 1 and PAYLOAD_REF_KEY in value
+
+
+def resolve_payload_refs(
+    values: Dict[str, Any], payload_store: Optional[BaseStore[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Copy of `values` with the payload references replaced by their payloads,
+    fetched from `payload_store` in a single batch.
+
+    Raises:
+        ValueError: If a reference is found without `payload_store`, or its
+            payload is missing from the store.
+    """
+    refs = {
+        name: value[PAYLOAD_REF_KEY]
+        for name, value in values.items()
+        if is_payload_ref(value)
+    }
+    if not refs:
+        return values
+    if payload_store is None:
+        raise ValueError(
+            "The resources are held in a payload store."
+            " Provide `payload_store` to resolve them."
+        )
+
+    resolved = dict(values)
+    for (name, key), payload in zip(
+        refs.items(), payload_store.mget(list(refs.values()))
+    ):
+        if payload is None:
+            raise ValueError(f"Payload {key} not found in the payload store.")
+        resolved[name] = payload
+    return resolved
+
+
+def _check_key(key: str) -> str:
+    if not _KEY_PATTERN.fullmatch(key) or ".." in key.split("/"):
+        raise ValueError(f"Invalid payload key: {key}")
+    return key
+
+
+class FilePayloadStore(BaseStore[str, Any]):
+    """
+    Payload store keeping each payload as a JSON file under `root_dir`.
+
+    The payloads of a document share a directory named after its namespace,
+    so they can be removed with `mdelete(list(yield_keys(prefix=namespace)))`.
+
+    Args:
+        `root_dir` (str, Path): Directory of the payload files. If the directory
+        does not exist, it will be created.
+        `json_codec` (str, JSONCodec, optional): JSON backend encoding the payloads:
+        "orjson", "msgspec" or "json". Defaults to the fastest installed backend.
+    """
+
+    def __init__(
+        self, root_dir: str | Path, json_codec: Optional[str | JSONCodec] = None
+    ):
+        self.root_dir = Path(root_dir).absolute()
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+
+    def _path(self, key: str) -> Path:
+        return self.root_dir / f"{_check_key(key)}.json"
+
+    def mget(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        values = []
+        for key in keys:
+            try:
+                data = self._path(key).read_bytes()
+            except FileNotFoundError:
+                values.append(None)
+            else:
+                values.append(self.json_codec.loads(data))
+        return values
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, Any]]) -> None:
+        for key, value in key_value_pairs:
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Written aside and renamed, so readers never see a partial payload
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    # Chart sources are `Path` objects, stored as strings
+                    f.write(self.json_codec.dumps(value, default=str))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            path = self._path(key)
+            path.unlink(missing_ok=True)
+            # Remove the namespace directory once empty
+            if path.parent != self.root_dir:
+                try:
+                    path.parent.rmdir()
+                except OSError:
+                    pass
+
+    def yield_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        for path in self.root_dir.rglob("*.json"):
+            key = path.relative_to(self.root_dir).as_posix()[: -len(".json")]
+            if prefix is None or key.startswith(prefix):
+                yield key
+
+
+class SQLitePayloadStore(BaseStore[str, Any]):
+    """
+    Payload store keeping the payloads as JSON in a SQLite table.
+
+    The payloads of a Document are written in one transaction, and read back in
+    one query. The store can be shared between threads.
+
+    Args:
+        `database` (str, Path): Path of the SQLite database, or ":memory:".
+        If the file does not exist, it will be created.
+        `table` (str, optional): Name of the table. Defaults to "payloads".
+        `json_codec` (str, JSONCodec, optional): JSON backend encoding the payloads:
+        "orjson", "msgspec" or "json". Defaults to the fastest installed backend.
+    """
+
+    def __init__(
+        self,
+        database: str | Path,
+        *,
+        table: str = "payloads",
+        json_codec: Optional[str | JSONCodec] = None,
+    ):
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+
+        self.table = table
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table}"
+                " (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+
+    def mget(self, keys: Sequence[str]) -> list[Optional[Any]]:
+        found: Dict[str, str] = {}
+        with self._lock:
+            for start in range(0, len(keys), _SQLITE_BATCH_SIZE):
+                batch = keys[start : start + _SQLITE_BATCH_SIZE]
+                rows = self._connection.execute(
+                    f"SELECT key, value FROM {self.table}"
+                    f" WHERE key IN ({', '.join('?' * len(batch))})",
+                    list(batch),
+                )
+                found.update(rows)
+        return [
+            self.json_codec.loads(found[key]) if key in found else None for key in keys
+        ]
+
+    def mset(self, key_value_pairs: Sequence[Tuple[str, Any]]) -> None:
+        # Chart sources are `Path` objects, stored as strings
+        rows = [
+            (key, self.json_codec.dumps(value, default=str))
+            for key, value in key_value_pairs
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO {self.table} (key, value) VALUES (?, ?)", rows
+            )
+
+    def mdelete(self, keys: Sequence[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                f"DELETE FROM {self.table} WHERE key = ?", [(key,) for key in keys]
+            )
+
+    def yield_keys(self, prefix: Optional[str] = None) -> Iterator[str]:
+        with self._lock:
+            if prefix is None:
+                rows = self._connection.execute(f"SELECT key FROM {self.table}")
+            else:
+                # `substr` instead of LIKE, so that "_" and "%" match literally
+                rows = self._connection.execute(
+                    f"SELECT key FROM {self.table} WHERE substr(key, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+            keys = [key for (key,) in rows]
+        yield from keys
+
+    def close(self) -> None:
+        """
+        Close the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "SQLitePayloadStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
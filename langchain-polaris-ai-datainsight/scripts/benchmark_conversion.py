@@ -0,0 +1,110 @@
+"""
+Benchmark the conversion of extraction results to Documents.
+
+Converts synthetic documents of growing size (mostly text cells, with a table,
+chart or image every few elements, as in large sheets) and prints the cost per
+element of each mode. The cost per element should stay flat as documents grow.
+Fails if it grows by more than `--max-ratio` from the smallest to the largest
+document.
+
+    python scripts/benchmark_conversion.py --sizes 1000 10000 100000 --max-ratio 3
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from langchain_polaris_ai_datainsight.datainsight_loader import (
+    PolarisAIDataInsightLoader,
+)
+
+ELEMENTS_PER_PAGE = 1000
+
+
+def make_json_data(num_elements: int) -> Dict:
+    """
+    Synthetic extraction result with `num_elements` elements.
+    """
+    pages = []
+    for page_start in range(0, num_elements, ELEMENTS_PER_PAGE):
+        elements = []
+        for element_id in range(
+            page_start, min(page_start + ELEMENTS_PER_PAGE, num_elements)
+        ):
+            box = {"left": 0, "top": element_id, "right": 100, "bottom": element_id + 1}
+            if element_id % 50 == 10:
+                content = {"csv": "a,b\n1,2"}
+                data_type = "table"
+            elif element_id % 50 == 20:
+                content = {"src": "chart.png", "csv": "x,y\n1,2"}
+                data_type = "chart"
+            elif element_id % 50 == 30:
+                content = {"src": "image.png"}
+                data_type = "image"
+            else:
+                content = {"text": f"Cell {element_id} of a large sheet"}
+                data_type = "text"
+            elements.append(
+                {
+                    "id": element_id,
+                    "type": data_type,
+                    "content": content,
+                    "boundaryBox": box,
+                }
+            )
+        pages.append({"pageNum": len(pages) + 1, "elements": elements})
+    return {"pages": pages}
+
+
+def measure_conversion(mode: str, num_elements: int, repeat: int = 3) -> float:
+    """
+    Best conversion time per element, in microseconds.
+    """
+    # Only `_convert_json_to_documents` is measured: no API call, no file
+    loader = object.__new__(PolarisAIDataInsightLoader)
+    loader.mode = mode
+
+    best = float("inf")
+    for _ in range(repeat):
+        # Conversion consumes the element dicts, so each run gets fresh data
+        json_data = make_json_data(num_elements)
+        start = time.perf_counter()
+        loader._convert_json_to_documents(json_data)
+        best = min(best, time.perf_counter() - start)
+    return best / num_elements * 1e6
+
+
+def benchmark_conversion(
+    modes: List[str], sizes: List[int], max_ratio: float
+) -> List[str]:
+    errors = []
+    for mode in modes:
+        costs = [measure_conversion(mode, size) for size in sizes]
+        for size, cost in zip(sizes, costs):
+            print(f"{mode:>8} {size:>9} elements: {cost:6.2f} us/element")  # noqa: T201
+
+        ratio = costs[-1] / costs[0]
+        if ratio > max_ratio:
+            errors.append(
+                f"{mode}: cost per element grows {ratio:.1f}x"
+                f" from {sizes[0]} to {sizes[-1]} elements"
+            )
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--modes", nargs="+", default=["single", "page", "element", "chunk"]
+    )
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1000, 10000, 100000, 300000]
+    )
+    parser.add_argument("--max-ratio", type=float, default=3.0)
+    args = parser.parse_args()
+
+    errors = benchmark_conversion(args.modes, sorted(args.sizes), args.max_ratio)
+    for error in errors:
+        print(error, file=sys.stderr)  # noqa: T201
+    sys.exit(1 if errors else 0)
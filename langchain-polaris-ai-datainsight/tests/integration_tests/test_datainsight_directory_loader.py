@@ -0,0 +1,162 @@
+import shutil
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.documents import Document
+from polaris_ai_datainsight import IngestionManifest
+
+from langchain_polaris_ai_datainsight import PolarisAIDataInsightDirectoryLoader
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+MOCK_RESPONSE_ZIP_PATH = Path(__file__).parent.parent / "examples" / "example.zip"
+
+# Pages of the mock response
+MOCK_RESPONSE_PAGES = 2
+
+
+@pytest.fixture
+def temp_resources_dir():
+    """Create a temporary directory."""
+    with tempfile.TemporaryDirectory(
+        prefix="example_", dir=Path(__file__).parent.parent / "examples"
+    ) as temp_resources_dir:
+        yield Path(temp_resources_dir)
+
+
+@pytest.fixture
+def corpus_dir(tmp_path: Path) -> Path:
+    for name in ["a.docx", "b.docx", "c.docx"]:
+        shutil.copy(EXAMPLE_DOC_PATH, tmp_path / name)
+    (tmp_path / "notes.txt").write_text("not a document")
+    return tmp_path
+
+
+@pytest.fixture
+def mock_response():
+    # Make mock response for DataInsight API call
+    with patch("requests.Session.post") as mock_response:
+        mock_response.return_value = MagicMock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+        )
+        yield mock_response
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_lazy_load__tag_source(
+    corpus_dir: Path, temp_resources_dir: Path, mock_response: MagicMock
+) -> None:
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        mode="page",
+        max_workers=2,
+    )
+
+    docs = list(loader.lazy_load())
+
+    assert all(isinstance(doc, Document) for doc in docs)
+    assert len(docs) == 3 * MOCK_RESPONSE_PAGES
+    assert mock_response.call_count == 3
+    assert {doc.metadata["source"] for doc in docs} == {
+        str(corpus_dir / name) for name in ["a.docx", "b.docx", "c.docx"]
+    }
+
+
+def test_lazy_load__silent_errors(
+    corpus_dir: Path, temp_resources_dir: Path, mock_response: MagicMock
+) -> None:
+    # Rejected before upload: the file is empty
+    (corpus_dir / "broken.docx").write_bytes(b"")
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        mode="single",
+        silent_errors=True,
+    )
+
+    docs = loader.load()
+
+    assert len(docs) == 3
+    assert str(corpus_dir / "broken.docx") not in {
+        doc.metadata["source"] for doc in docs
+    }
+
+
+def test_lazy_load__incremental(
+    corpus_dir: Path, temp_resources_dir: Path, mock_response: MagicMock
+) -> None:
+    manifest = IngestionManifest(corpus_dir / "manifest.json")
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        manifest=manifest,
+    )
+    assert len(loader.load()) == 3
+
+    (corpus_dir / "c.docx").unlink()
+    shutil.copy(EXAMPLE_DOC_PATH, corpus_dir / "d.docx")
+    mock_response.reset_mock()
+
+    docs = loader.load()
+
+    assert [doc.metadata["source"] for doc in docs] == [str(corpus_dir / "d.docx")]
+    assert mock_response.call_count == 1
+    assert sorted(loader.unchanged_sources) == [
+        str(corpus_dir / "a.docx"),
+        str(corpus_dir / "b.docx"),
+    ]
+    assert loader.deleted_sources == [str(corpus_dir / "c.docx")]
+
+
+def test_lazy_load__incremental_early_stop(
+    corpus_dir: Path, temp_resources_dir: Path, mock_response: MagicMock
+) -> None:
+    manifest = IngestionManifest(corpus_dir / "manifest.json")
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        manifest=manifest,
+    )
+
+    # Stop after the Document of the second file: only the first file is done
+    docs = loader.lazy_load()
+    first = next(docs)
+    next(docs)
+    docs.close()
+
+    # The files not consumed are loaded again, not skipped as unchanged
+    sources = sorted(doc.metadata["source"] for doc in loader.load())
+    assert loader.unchanged_sources == [first.metadata["source"]]
+    assert sources == sorted(
+        str(corpus_dir / name)
+        for name in ["a.docx", "b.docx", "c.docx"]
+        if str(corpus_dir / name) != first.metadata["source"]
+    )
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_lazy_load__raise_errors(
+    corpus_dir: Path, temp_resources_dir: Path, mock_response: MagicMock
+) -> None:
+    (corpus_dir / "broken.docx").write_bytes(b"")
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir, api_key="api_key", resources_dir=temp_resources_dir
+    )
+
+    with pytest.raises(ValueError, match="File is empty"):
+        loader.load()
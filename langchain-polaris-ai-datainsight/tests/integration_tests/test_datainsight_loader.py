@@ -1,10 +1,14 @@
+import asyncio
 import re
 import tempfile
+import threading
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.documents import Document
+from langchain_core.stores import InMemoryStore
+from polaris_ai_datainsight import AsyncDataInsightClient
 
 from langchain_polaris_ai_datainsight import PolarisAIDataInsightLoader
 
@@ -45,11 +49,12 @@ def temp_resources_dir():
 @pytest.fixture
 def mock_response():
     # Make mock response for DataInsight API call
-    patcher = patch("requests.post")
+    patcher = patch("requests.Session.post")
     mock_response = patcher.start()
     mock_response.return_value = MagicMock(
         status_code=200,
         content=MOCK_RESPONSE_ZIP_PATH.read_bytes(),
+        iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
     )
 
     yield mock_response
@@ -57,6 +62,31 @@ def mock_response():
     patcher.stop()
 
 
+@pytest.fixture
+def mock_async_response():
+    # Make mock response for async DataInsight API calls, tracking requests in flight
+    state = {"calls": 0, "in_flight": 0, "max_in_flight": 0}
+
+    async def aiter_bytes(chunk_size):
+        yield MOCK_RESPONSE_ZIP_PATH.read_bytes()
+
+    async def send(*args, **kwargs):
+        state["calls"] += 1
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return MagicMock(
+            status_code=200,
+            is_error=False,
+            aiter_bytes=aiter_bytes,
+            aclose=AsyncMock(),
+        )
+
+    with patch("httpx.AsyncClient.send", side_effect=send):
+        yield state
+
+
 ######################
 # -- SUCCESS TEST -- #
 ######################
@@ -155,6 +185,42 @@ def test_lazy_load__load_with_page_mode(
             assert Path(resource_path).parent.parent == temp_resources_dir
 
 
+@pytest.mark.usefixtures("temp_resources_dir")
+@pytest.mark.usefixtures("mock_response")
+@pytest.mark.parametrize("mode", ["element", "page"])
+def test_lazy_load__yield_as_pages_are_read(
+    temp_resources_dir: Path, mock_response: MagicMock, mode: str
+) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        mode=mode,
+    )
+    pages_read = []
+    iter_pages = loader.doc_extractor.iter_pages
+
+    def tracked_iter_pages():
+        for page in iter_pages():
+            pages_read.append(page)
+            yield page
+
+    with patch.object(loader.doc_extractor, "iter_pages", tracked_iter_pages):
+        docs = loader.lazy_load()
+
+        # The first Document is yielded before the second page is read
+        assert isinstance(next(docs), Document)
+        assert len(pages_read) == 1
+
+        rest = list(docs)
+
+    assert len(pages_read) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+    if mode == "page":
+        assert len(rest) + 1 == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+    else:
+        assert len(rest) + 1 == MOCK_RESPONSE_DATA_STRUCTURE["elements"]["total"]
+
+
 @pytest.mark.usefixtures("temp_resources_dir")
 @pytest.mark.usefixtures("mock_response")
 def test_lazy_load__load_with_single_mode(
@@ -189,3 +255,84 @@ def test_lazy_load__load_with_single_mode(
         assert Path(resource_path).exists()
         assert Path(resource_path).is_file()
         assert Path(resource_path).parent.parent == temp_resources_dir
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "mode, total",
+    [
+        ("element", MOCK_RESPONSE_DATA_STRUCTURE["elements"]["total"]),
+        ("page", MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]),
+        ("single", 1),
+    ],
+)
+async def test_alazy_load__async_extraction(
+    temp_resources_dir: Path, mock_async_response: dict, mode: str, total: int
+) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        mode=mode,
+    )
+
+    with patch("requests.Session.post") as mock_post:
+        docs = [doc async for doc in loader.alazy_load()]
+
+    # The document is extracted by the async client, not in a thread
+    mock_post.assert_not_called()
+    assert mock_async_response["calls"] == 1
+    assert len(docs) == total
+    assert all(isinstance(doc, Document) for doc in docs)
+
+
+@pytest.mark.asyncio
+async def test_alazy_load__build_documents_off_event_loop(
+    temp_resources_dir: Path, mock_async_response: dict
+) -> None:
+    store_threads = set()
+
+    class RecordingStore(InMemoryStore):
+        def mset(self, key_value_pairs):
+            store_threads.add(threading.current_thread())
+            super().mset(key_value_pairs)
+
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        mode="page",
+        payload_store=RecordingStore(),
+    )
+
+    docs = [doc async for doc in loader.alazy_load()]
+
+    # Payloads are written by a worker thread, not on the event loop
+    assert len(docs) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+    assert store_threads
+    assert threading.current_thread() not in store_threads
+
+
+@pytest.mark.asyncio
+async def test_aload__shared_async_client(
+    temp_resources_dir: Path, mock_async_response: dict
+) -> None:
+    async with AsyncDataInsightClient(
+        api_key="api_key", resources_dir=temp_resources_dir, max_concurrency=4
+    ) as async_client:
+        loaders = [
+            PolarisAIDataInsightLoader(
+                file_path=EXAMPLE_DOC_PATH,
+                api_key="api_key",
+                mode="page",
+                async_client=async_client,
+            )
+            for _ in range(8)
+        ]
+        results = await asyncio.gather(*(loader.aload() for loader in loaders))
+
+    # Documents are extracted concurrently on one event loop
+    assert mock_async_response["max_in_flight"] == 4
+    assert all(
+        len(docs) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"] for docs in results
+    )
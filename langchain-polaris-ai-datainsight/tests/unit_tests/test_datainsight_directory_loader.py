@@ -0,0 +1,72 @@
+import shutil
+from pathlib import Path
+
+import pytest
+
+from langchain_polaris_ai_datainsight import PolarisAIDataInsightDirectoryLoader
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+
+
+@pytest.fixture
+def corpus_dir(tmp_path: Path) -> Path:
+    (tmp_path / "reports" / "drafts").mkdir(parents=True)
+    for relative_path in [
+        "a.docx",
+        "b.DOCX",
+        "notes.txt",
+        "reports/c.docx",
+        "reports/drafts/d.docx",
+    ]:
+        shutil.copy(EXAMPLE_DOC_PATH, tmp_path / relative_path)
+    # A directory named like a document is not a file to load
+    (tmp_path / "folder.docx").mkdir()
+    return tmp_path
+
+
+def relative_paths(loader: PolarisAIDataInsightDirectoryLoader) -> set[str]:
+    return {
+        path.relative_to(loader.path).as_posix() for path in loader.iter_file_paths()
+    }
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_iter_file_paths__supported_extensions(corpus_dir: Path) -> None:
+    loader = PolarisAIDataInsightDirectoryLoader(corpus_dir, api_key="api_key")
+
+    assert relative_paths(loader) == {
+        "a.docx",
+        "b.DOCX",
+        "reports/c.docx",
+        "reports/drafts/d.docx",
+    }
+
+
+def test_iter_file_paths__glob_and_exclude(corpus_dir: Path) -> None:
+    loader = PolarisAIDataInsightDirectoryLoader(
+        corpus_dir,
+        glob=["*.docx", "reports/**/*.docx"],
+        exclude=["drafts/*"],
+        api_key="api_key",
+    )
+
+    assert relative_paths(loader) == {"a.docx", "reports/c.docx"}
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_init__not_a_directory(corpus_dir: Path) -> None:
+    with pytest.raises(ValueError, match="does not exist"):
+        PolarisAIDataInsightDirectoryLoader(corpus_dir / "a.docx", api_key="api_key")
+
+
+def test_init__invalid_max_workers(corpus_dir: Path) -> None:
+    with pytest.raises(ValueError, match="max_workers"):
+        PolarisAIDataInsightDirectoryLoader(corpus_dir, max_workers=0)
@@ -1,7 +1,12 @@
+import copy
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
+from langchain_core.documents import Document
 from polaris_ai_datainsight import PolarisAIDataInsightExtractor
 
 from langchain_polaris_ai_datainsight import PolarisAIDataInsightLoader
@@ -14,6 +19,23 @@ EXAMPLE_UNSUPPORTED_DOC_PATH = Path(__file__).parent.parent / "examples" / "exam
 EXAMPLE_NOT_EXIST_DOC_PATH = Path(__file__).parent.parent / "examples" / "no_file.docx"
 
 
+def make_json_data() -> dict:
+    # Two pages mixing text, table, chart and image elements
+    contents = [
+        ("text", {"text": "Title"}),
+        ("table", {"csv": "a,b\n1,2"}),
+        ("image", {"src": "image1.png"}),
+        ("text", {"text": "Body"}),
+        ("chart", {"src": "chart1.png", "csv": "x,y"}),
+        ("shape", {"src": "shape1.png"}),
+    ]
+    elements = [
+        {"id": i, "type": data_type, "content": content, "boundaryBox": {}}
+        for i, (data_type, content) in enumerate(contents)
+    ]
+    return {"pages": [{"elements": elements[:3]}, {"elements": elements[3:]}]}
+
+
 @pytest.fixture
 def temp_resources_dir():
     """Create a temporary directory."""
@@ -57,6 +79,235 @@ def test_init__from_file_and_filename(
     assert isinstance(loader.doc_extractor, PolarisAIDataInsightExtractor)
 
 
+@pytest.mark.usefixtures("temp_resources_dir")
+def test_json_codec__without_client(temp_resources_dir: Path) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        json_codec="json",
+    )
+
+    assert loader.json_codec.name == "json"
+    # No client, and so no HTTP session, is opened
+    assert loader.doc_extractor._client is None
+
+
+def test_import__defer_langchain_core() -> None:
+    # Importing the package alone must not load `langchain_core` or `requests`
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, langchain_polaris_ai_datainsight;"
+            " print(sorted({'langchain_core', 'requests'} & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.mark.parametrize("mode", ["single", "page", "element"])
+def test_convert__resource_index(mode: str) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode=mode
+    )
+
+    docs = loader._convert_json_to_documents(make_json_data())
+
+    all_ids = []
+    for doc in docs:
+        resource_index = doc.metadata.get("resource_index", {})
+        for resource_id, (start, end) in resource_index.items():
+            placeholder = doc.page_content[start:end]
+            assert placeholder.startswith(("<img ", "<div "))
+            assert f'id="{resource_id}"' in placeholder
+
+        # Same ids as scanning the page content
+        unindexed = Document(
+            page_content=doc.page_content,
+            metadata={
+                key: value
+                for key, value in doc.metadata.items()
+                if key != "resource_index"
+            },
+        )
+        ids = loader.get_ids_from_document(doc)
+        assert ids == loader.get_ids_from_document(unindexed)
+        all_ids.extend(ids)
+
+    assert all_ids == [
+        "di.table.1",
+        "di.image.2",
+        "di.chart.4",
+        "di.image.5",
+    ]
+
+
+def test_substitute_resources() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="single"
+    )
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+    unindexed = Document(
+        page_content=doc.page_content,
+        metadata={"resources": doc.metadata["resources"]},
+    )
+
+    def substitute(resource_id: str, resource: object) -> str:
+        return f"[{resource_id}: {resource}]"
+
+    content = loader.substitute_resources(doc, substitute)
+
+    assert content == loader.substitute_resources(unindexed, substitute)
+    assert "[di.image.2: image1.png]" in content
+    assert "[di.table.1: a,b\n1,2]" in content
+    assert "<img" not in content and "<div" not in content
+    assert content.startswith("Title\n")
+
+
+def test_substitute_resources__split_document() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="single"
+    )
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+    # Split after the table placeholder, as text splitters do: each piece gets a
+    # copy of the metadata, with the offsets of the whole document
+    split_at = doc.metadata["resource_index"]["di.table.1"][1] + 1
+    pieces = [
+        Document(page_content=content, metadata=copy.deepcopy(doc.metadata))
+        for content in (doc.page_content[:split_at], doc.page_content[split_at:])
+    ]
+
+    def substitute(resource_id: str, resource: object) -> str:
+        return f"[{resource_id}]"
+
+    assert [loader.get_ids_from_document(piece) for piece in pieces] == [
+        ["di.table.1"],
+        ["di.image.2", "di.chart.4", "di.image.5"],
+    ]
+    assert "".join(
+        loader.substitute_resources(piece, substitute) for piece in pieces
+    ) == loader.substitute_resources(doc, substitute)
+
+
+@pytest.mark.parametrize("mode", ["single", "page", "element"])
+def test_get_table_by_id(mode: str) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode=mode
+    )
+    docs = loader._convert_json_to_documents(make_json_data())
+    (table_doc,) = [doc for doc in docs if "di.table.1" in doc.page_content]
+
+    columns = loader.get_table_by_id(table_doc, "di.table.1")
+
+    assert list(columns) == ["a", "b"]
+    assert columns["b"].dtype == np.int64
+    assert columns["b"].tolist() == [2]
+
+
+def make_chunk_json_data() -> dict:
+    # Short texts, a long text and a table on the first page, an image on the second
+    contents = [
+        ("text", {"text": "Alpha"}, {"left": 10, "top": 10, "right": 50, "bottom": 20}),
+        ("text", {"text": "Beta"}, {"left": 5, "top": 30, "right": 40, "bottom": 40}),
+        ("text", {"text": " ".join(["word"] * 30)}, {"left": 0, "top": 50}),
+        ("table", {"csv": "a,b\n1,2"}, {"left": 0, "top": 60, "right": 90}),
+        ("image", {"src": "a.png"}, {"left": 1, "top": 1, "right": 2, "bottom": 2}),
+    ]
+    elements = [
+        {"id": i, "type": data_type, "content": content, "boundaryBox": box}
+        for i, (data_type, content, box) in enumerate(contents)
+    ]
+    return {
+        "pages": [
+            {"pageNum": 1, "elements": elements[:4]},
+            {"pageNum": 2, "elements": elements[4:]},
+        ]
+    }
+
+
+def test_convert__chunk_mode() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="chunk", chunk_size=60
+    )
+
+    docs = loader._convert_json_to_documents(make_chunk_json_data())
+
+    assert all(len(doc.page_content) <= 60 for doc in docs)
+    assert docs[0].page_content == "Alpha\nBeta"
+    assert docs[0].metadata["coordinates"] == [
+        {"page": 1, "left": 5, "top": 10, "right": 50, "bottom": 40}
+    ]
+    # The long text is split between words, keeping every word
+    text = " ".join(doc.page_content for doc in docs)
+    assert text.split().count("word") == 30
+
+    # Resources are whole, with their ids and offsets
+    resources = loader.get_resources_from_documents(docs)
+    assert list(resources) == ["di.table.3", "di.image.4"]
+    for doc in docs:
+        for resource_id, (start, end) in doc.metadata["resource_index"].items():
+            assert f'id="{resource_id}"' in doc.page_content[start:end]
+    image_box = {"page": 2, "left": 1, "top": 1, "right": 2, "bottom": 2}
+    assert image_box in docs[-1].metadata["coordinates"]
+
+
+@pytest.mark.parametrize("chunk_size", [9, 10])
+def test_convert__chunk_mode_exact_size(chunk_size: int) -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        mode="chunk",
+        chunk_size=chunk_size,
+    )
+    json_data = make_chunk_json_data()
+    json_data["pages"][0]["elements"] = json_data["pages"][0]["elements"][:2]
+    json_data["pages"] = json_data["pages"][:1]
+
+    docs = loader._convert_json_to_documents(json_data)
+
+    # "Alpha\nBeta" is 10 characters: no trailing newline past the budget
+    expected = ["Alpha\nBeta"] if chunk_size == 10 else ["Alpha", "Beta"]
+    assert [doc.page_content for doc in docs] == expected
+
+
+def test_convert__chunk_mode_spans_pages() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="chunk", chunk_size=1000
+    )
+
+    (doc,) = loader._convert_json_to_documents(make_chunk_json_data())
+
+    assert [box["page"] for box in doc.metadata["coordinates"]] == [1, 2]
+    assert doc.metadata["coordinates"][0] == {
+        "page": 1,
+        "left": 0,
+        "top": 10,
+        "right": 90,
+        "bottom": 40,
+    }
+    assert len(doc.metadata["elements"]) == 5
+
+
+def test_convert__chunk_mode_length_function() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        mode="chunk",
+        chunk_size=10,
+        length_function=lambda text: len(text.split()),
+    )
+
+    docs = loader._convert_json_to_documents(make_chunk_json_data())
+
+    assert all(len(doc.page_content.split()) <= 10 for doc in docs)
+    assert sum(doc.page_content.split().count("word") for doc in docs) == 30
+
+
 ######################
 # -- FAILURE TEST -- #
 ######################
@@ -137,3 +388,20 @@ def test_init__unsupported_extension(temp_resources_dir: Path, file_path: Path)
             api_key="api_key",
             resources_dir=temp_resources_dir,
         )
+
+
+def test_get_table_by_id__not_a_table() -> None:
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="single"
+    )
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+
+    with pytest.raises(ValueError, match="not a table"):
+        loader.get_table_by_id(doc, "di.image.2")
+
+
+def test_init__invalid_chunk_size() -> None:
+    with pytest.raises(ValueError, match="chunk_size"):
+        PolarisAIDataInsightLoader(
+            file_path=EXAMPLE_DOC_PATH, api_key="api_key", mode="chunk", chunk_size=0
+        )
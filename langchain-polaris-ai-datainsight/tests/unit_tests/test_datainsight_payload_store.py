@@ -0,0 +1,212 @@
+import io
+import json
+import pickle
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.stores import InMemoryStore
+
+from langchain_polaris_ai_datainsight import (
+    FilePayloadStore,
+    PolarisAIDataInsightLoader,
+    SQLitePayloadStore,
+)
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+MOCK_RESPONSE_ZIP_PATH = Path(__file__).parent.parent / "examples" / "example.zip"
+
+LARGE_TABLE = [[f"cell {row}.{column}" for column in range(20)] for row in range(500)]
+
+
+def make_json_data() -> dict:
+    contents = [
+        ("text", {"text": "Title"}),
+        ("table", {"json": LARGE_TABLE}),
+        ("image", {"src": "image1.png"}),
+        ("chart", {"src": "chart1.png", "csv": "x,y\n1,2"}),
+    ]
+    elements = [
+        {"id": i, "type": data_type, "content": content, "boundaryBox": {"top": i}}
+        for i, (data_type, content) in enumerate(contents)
+    ]
+    return {"pages": [{"elements": elements[:2]}, {"elements": elements[2:]}]}
+
+
+def make_chart_response() -> bytes:
+    # The example response, with its first image turned into a chart
+    archive = io.BytesIO()
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as source:
+        with zipfile.ZipFile(archive, "w") as target:
+            for info in source.infolist():
+                data = source.read(info)
+                if info.filename.endswith(".json"):
+                    json_data = json.loads(data)
+                    for page in json_data["pages"]:
+                        for element in page["elements"]:
+                            if element["type"] == "image":
+                                element["type"] = "chart"
+                                element["content"]["csv"] = "x,y\n1,2"
+                                break
+                        else:
+                            continue
+                        break
+                    data = json.dumps(json_data).encode("utf-8")
+                target.writestr(info, data)
+    return archive.getvalue()
+
+
+def make_loader(mode: str, payload_store) -> PolarisAIDataInsightLoader:
+    return PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        mode=mode,
+        payload_store=payload_store,
+    )
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def payload_store(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryStore()
+    elif request.param == "file":
+        yield FilePayloadStore(tmp_path / "payloads")
+    else:
+        with SQLitePayloadStore(tmp_path / "payloads.db") as store:
+            yield store
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.parametrize("mode", ["single", "page", "element"])
+def test_loader__payloads_behind_references(mode: str, payload_store) -> None:
+    inline = make_loader(mode, None)._convert_json_to_documents(make_json_data())
+    loader = make_loader(mode, payload_store)
+
+    docs = loader._convert_json_to_documents(make_json_data())
+
+    assert [doc.page_content for doc in docs] == [doc.page_content for doc in inline]
+    for doc, inline_doc in zip(docs, inline):
+        resources = doc.metadata.get("resources", {})
+        for resource_id, resource in resources.items():
+            if resource_id.startswith("di.image."):
+                # Image paths stay inline
+                assert resource == inline_doc.metadata["resources"][resource_id]
+            else:
+                assert set(resource) == {"$ref"}
+            assert (
+                loader.get_resource_by_id(doc, resource_id, payload_store)
+                == inline_doc.metadata["resources"][resource_id]
+            )
+        if mode != "element":
+            assert set(doc.metadata["elements"]) == {"$ref"}
+            assert (
+                loader.get_elements_from_document(doc, payload_store)
+                == inline_doc.metadata["elements"]
+            )
+
+    assert loader.get_resources_from_documents(
+        docs, payload_store
+    ) == loader.get_resources_from_documents(inline)
+
+
+def test_loader__lightweight_metadata(payload_store) -> None:
+    (inline,) = make_loader("single", None)._convert_json_to_documents(make_json_data())
+    (doc,) = make_loader("single", payload_store)._convert_json_to_documents(
+        make_json_data()
+    )
+
+    assert len(pickle.dumps(doc)) * 10 < len(pickle.dumps(inline))
+
+
+def test_substitute_resources__payload_store(payload_store) -> None:
+    loader = make_loader("single", payload_store)
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+
+    content = loader.substitute_resources(
+        doc,
+        lambda resource_id, resource: f"[{resource_id}: {len(resource)}]",
+        payload_store,
+    )
+
+    assert "[di.table.1: 500]" in content
+    assert "[di.chart.3: 2]" in content
+
+
+def test_store__delete_namespace(payload_store) -> None:
+    loader = make_loader("single", payload_store)
+    (first,) = loader._convert_json_to_documents(make_json_data())
+    (second,) = loader._convert_json_to_documents(make_json_data())
+    namespace = first.metadata["elements"]["$ref"].split("/")[0]
+
+    keys = list(payload_store.yield_keys(prefix=namespace))
+    assert sorted(keys) == sorted(
+        f"{namespace}/{name}" for name in ["di.table.1", "di.chart.3", "elements"]
+    )
+
+    payload_store.mdelete(keys)
+    assert list(payload_store.yield_keys(prefix=namespace)) == []
+    assert loader.get_resource_by_id(second, "di.table.1", payload_store) == (
+        LARGE_TABLE
+    )
+
+
+def test_loader__extracted_chart(tmp_path, payload_store) -> None:
+    # Extracted charts refer to their image by `Path`
+    loader = PolarisAIDataInsightLoader(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=tmp_path / "resources",
+        mode="single",
+        payload_store=payload_store,
+    )
+    response = make_chart_response()
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200, iter_content=lambda chunk_size: iter([response])
+        )
+        (doc,) = loader.load()
+
+    (chart_id,) = [
+        resource_id
+        for resource_id in doc.metadata["resources"]
+        if resource_id.startswith("di.chart.")
+    ]
+    chart = loader.get_resource_by_id(doc, chart_id, payload_store)
+    assert chart["csv"] == "x,y\n1,2"
+    assert Path(chart["src"]).is_file()
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_get_resource_by_id__without_payload_store() -> None:
+    loader = make_loader("single", InMemoryStore())
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+
+    with pytest.raises(ValueError, match="payload store"):
+        loader.get_resource_by_id(doc, "di.table.1")
+
+
+def test_get_resource_by_id__missing_payload(payload_store) -> None:
+    loader = make_loader("single", payload_store)
+    (doc,) = loader._convert_json_to_documents(make_json_data())
+    payload_store.mdelete([doc.metadata["resources"]["di.table.1"]["$ref"]])
+
+    with pytest.raises(ValueError, match="not found"):
+        loader.get_resource_by_id(doc, "di.table.1", payload_store)
+
+
+@pytest.mark.parametrize("key", ["../escape", "/absolute", "a/../../b", ""])
+def test_file_store__invalid_key(tmp_path, key: str) -> None:
+    store = FilePayloadStore(tmp_path)
+
+    with pytest.raises(ValueError, match="Invalid payload key"):
+        store.mset([(key, "payload")])
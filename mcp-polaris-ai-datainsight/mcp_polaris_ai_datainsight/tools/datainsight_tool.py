@@ -1,6 +1,5 @@
 import os
 from pathlib import Path
-from polaris_ai_datainsight import PolarisAIDataInsightExtractor
 
 def call_datainsight_api(
     file_path: Path, resources_dir: Path
@@ -32,10 +31,19 @@ def call_datainsight_api(
         return f"Error: {str(e)}"
     
     try:
+        # Imported on first call to keep the server startup fast
+        from polaris_ai_datainsight import PolarisAIDataInsightExtractor
+
         extractor = PolarisAIDataInsightExtractor(file_path=file_path, resources_dir=resources_dir)
         docs = extractor.extract()
         if not docs:
             return "No content extracted."
+        # Image paths are `Path` objects, which the tool result cannot serialize
+        for page in docs.get("pages", []):
+            for element in page.get("elements", []):
+                content = element.get("content", {})
+                if isinstance(content.get("src"), Path):
+                    content["src"] = str(content["src"])
         return docs
     except Exception as e:
         return f"Error: {str(e)}"
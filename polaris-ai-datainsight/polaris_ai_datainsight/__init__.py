@@ -1,17 +1,99 @@
-from importlib import metadata
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from polaris_ai_datainsight.datainsight_extractor import (
-    PolarisAIDataInsightExtractor,
-)
+if TYPE_CHECKING:
+    from polaris_ai_datainsight.datainsight_async_client import AsyncDataInsightClient
+    from polaris_ai_datainsight.datainsight_batch import (
+        ExtractionResult,
+        extract_many,
+    )
+    from polaris_ai_datainsight.datainsight_cache import (
+        DiskExtractionCache,
+        ExtractionCache,
+        MemoryExtractionCache,
+    )
+    from polaris_ai_datainsight.datainsight_client import DataInsightClient
+    from polaris_ai_datainsight.datainsight_extractor import (
+        PolarisAIDataInsightExtractor,
+    )
+    from polaris_ai_datainsight.datainsight_manifest import (
+        IngestionManifest,
+        ManifestEntry,
+    )
+    from polaris_ai_datainsight.datainsight_resources import (
+        ContentAddressedStore,
+        ResourceStore,
+    )
+    from polaris_ai_datainsight.datainsight_retry import (
+        AdaptiveConcurrencyLimiter,
+        AsyncAdaptiveConcurrencyLimiter,
+        RetryableError,
+        RetryPolicy,
+    )
+
+# Public names and their modules. Modules are imported on first access, so that
+# importing the package does not load `requests` or the other dependencies.
+_LAZY_IMPORTS = {
+    "AdaptiveConcurrencyLimiter": "datainsight_retry",
+    "AsyncAdaptiveConcurrencyLimiter": "datainsight_retry",
+    "AsyncDataInsightClient": "datainsight_async_client",
+    "ContentAddressedStore": "datainsight_resources",
+    "DataInsightClient": "datainsight_client",
+    "DiskExtractionCache": "datainsight_cache",
+    "ExtractionCache": "datainsight_cache",
+    "ExtractionResult": "datainsight_batch",
+    "IngestionManifest": "datainsight_manifest",
+    "ManifestEntry": "datainsight_manifest",
+    "MemoryExtractionCache": "datainsight_cache",
+    "PolarisAIDataInsightExtractor": "datainsight_extractor",
+    "ResourceStore": "datainsight_resources",
+    "RetryPolicy": "datainsight_retry",
+    "RetryableError": "datainsight_retry",
+    "extract_many": "datainsight_batch",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # `importlib.metadata` is slow to import, so it is resolved on access too
+        from importlib import metadata
+
+        try:
+            value = metadata.version(__package__)
+        except metadata.PackageNotFoundError:
+            # Case where package metadata is not available.
+            value = ""
+        globals()[name] = value
+        return value
+
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_IMPORTS, "__version__"])
 
-try:
-    __version__ = metadata.version(__package__)
-except metadata.PackageNotFoundError:
-    # Case where package metadata is not available.
-    __version__ = ""
-del metadata  # optional, avoids polluting the results of dir(__package__)
 
 __all__ = [
+    "AdaptiveConcurrencyLimiter",
+    "AsyncAdaptiveConcurrencyLimiter",
+    "AsyncDataInsightClient",
+    "ContentAddressedStore",
+    "DataInsightClient",
+    "DiskExtractionCache",
+    "ExtractionCache",
+    "ExtractionResult",
+    "IngestionManifest",
+    "ManifestEntry",
+    "MemoryExtractionCache",
     "PolarisAIDataInsightExtractor",
+    "ResourceStore",
+    "RetryPolicy",
+    "RetryableError",
+    "extract_many",
     "__version__",
 ]
@@ -0,0 +1,331 @@
+"""PolarisAIDataInsight asyncio API client."""
+
+import asyncio
+from tempfile import SpooledTemporaryFile
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Iterable, Optional, Tuple
+
+try:
+    from .datainsight_cache import ExtractionCache
+    from .datainsight_client import (
+        DEFAULT_SPOOL_MAX_SIZE,
+        DOWNLOAD_CHUNK_SIZE,
+        BaseDataInsightClient,
+        PreflightType,
+        ResourcesModeType,
+        StrPath,
+        _stream_position,
+    )
+    from .datainsight_resources import ContentAddressedStore, ResourceStore
+    from .datainsight_retry import (
+        THROTTLING_STATUSES,
+        AsyncAdaptiveConcurrencyLimiter,
+        RetryableError,
+        RetryPolicy,
+    )
+    from .utils.http_utils import Blob, MultipartBody, encode_multipart
+    from .utils.json_utils import JSONCodec
+except ImportError:
+    from polaris_ai_datainsight.datainsight_cache import ExtractionCache
+    from polaris_ai_datainsight.datainsight_client import (
+        DEFAULT_SPOOL_MAX_SIZE,
+        DOWNLOAD_CHUNK_SIZE,
+        BaseDataInsightClient,
+        PreflightType,
+        ResourcesModeType,
+        StrPath,
+        _stream_position,
+    )
+    from polaris_ai_datainsight.datainsight_resources import (
+        ContentAddressedStore,
+        ResourceStore,
+    )
+    from polaris_ai_datainsight.datainsight_retry import (
+        THROTTLING_STATUSES,
+        AsyncAdaptiveConcurrencyLimiter,
+        RetryableError,
+        RetryPolicy,
+    )
+    from polaris_ai_datainsight.utils.http_utils import (
+        Blob,
+        MultipartBody,
+        encode_multipart,
+    )
+    from polaris_ai_datainsight.utils.json_utils import JSONCodec
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncDataInsightClient(BaseDataInsightClient):
+    """
+    Asyncio Polaris AI DataInsight API client.
+
+    Uploads go through a shared ``httpx.AsyncClient`` connection pool and at most
+    `max_concurrency` extractions are in flight at once. When the API throttles,
+    the number of extractions in flight is lowered, then raised back to
+    `max_concurrency` as requests succeed. Unzipping and
+    post-processing the result archive run in a worker thread, so the event loop
+    is never blocked.
+
+    Setup:
+        The async client requires ``httpx``.
+
+        ```bash
+            pip install -U "polaris-ai-datainsight[async]"
+        ```
+
+    Extract:
+        ```python
+            from polaris_ai_datainsight import AsyncDataInsightClient
+
+            async with AsyncDataInsightClient(
+                resources_dir="path/to/save/resources/", max_concurrency=64
+            ) as client:
+                results = await asyncio.gather(*(client.aextract(blob) for blob in blobs))
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        resources_dir: StrPath = "app/",
+        base_url: Optional[str] = None,
+        max_concurrency: int = 16,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float | Tuple[float, float]] = None,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        resources_mode: ResourcesModeType = "disk",
+        cache: Optional[ExtractionCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AsyncAdaptiveConcurrencyLimiter] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        resource_store: Optional[ResourceStore] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        preflight: PreflightType = True,
+        max_file_size: Optional[int] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            `api_key` (str, optional): API authentication key. If not provided, the API key will be
+                retrieved from an environment variable. If no API key is found, a ValueError is raised.
+            `resources_dir` (str, optional): Resource directory path. If the
+                directory does not exist, it will be created. Defaults to "app/".
+            `base_url` (str, optional): Endpoint of the extraction API.
+            `max_concurrency` (int, optional): Maximum number of extractions in flight. Defaults to 16.
+            `max_connections` (int, optional): Size of the connection pool.
+                Defaults to `max_concurrency`.
+            `max_keepalive_connections` (int, optional): Number of idle connections kept alive.
+                Defaults to `max_connections`.
+            `headers` (dict, optional): Extra headers sent with every request.
+            `timeout` (float, tuple, optional): Timeout for each API call.
+                A tuple is read as `(connect, read)`.
+            `spool_max_size` (int, optional): The result archive is downloaded in chunks and
+                kept in memory up to this many bytes, then spooled to a temporary file. Defaults to 8 MiB.
+            `resources_mode` (str, optional): "disk" writes the images to `resources_dir`.
+                "memory" resolves `content.src` to `ArchiveResource` objects read lazily from the
+                result archive, without any filesystem write. Defaults to "disk".
+            `cache` (ExtractionCache, optional): Cache of result archives keyed by the hash of
+                the document bytes. Byte-identical documents are then extracted without an API call.
+            `retry` (RetryPolicy, optional): Retry policy for throttled (429), failed (5xx) and
+                dropped requests. Defaults to 3 retries with exponential backoff and jitter.
+                Pass `RetryPolicy(max_retries=0)` to disable retries.
+            `limiter` (AsyncAdaptiveConcurrencyLimiter, optional): Concurrency limiter, e.g. to share
+                one limit between several clients. Defaults to a limiter of `max_concurrency`.
+            `json_codec` (str, JSONCodec, optional): JSON backend decoding the results: "orjson",
+                "msgspec" or "json". Defaults to the fastest installed backend.
+            `resource_store` (ResourceStore, optional): Managed resources directory, used instead of
+                `resources_dir`. It deletes the directories of released, evicted and orphaned extractions.
+            `content_store` (ContentAddressedStore, optional): Store writing each distinct image once,
+                under its content hash. Extraction directories then link to the stored images.
+            `preflight` (bool, "strict", optional): Check the container header of each document
+                before uploading it, so that empty and password-protected files are rejected locally.
+                Truncated files and files whose content does not match their extension raise a
+                warning, or are rejected too in "strict" mode. Defaults to True.
+            `max_file_size` (int, optional): Maximum size of the uploaded documents in bytes.
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                "`httpx` is required for AsyncDataInsightClient."
+                " Please install it with `pip install httpx`."
+            )
+
+        super().__init__(
+            api_key=api_key,
+            resources_dir=resources_dir,
+            base_url=base_url,
+            timeout=timeout,
+            spool_max_size=spool_max_size,
+            resources_mode=resources_mode,
+            cache=cache,
+            retry=retry,
+            json_codec=json_codec,
+            resource_store=resource_store,
+            content_store=content_store,
+            preflight=preflight,
+            max_file_size=max_file_size,
+        )
+
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be a positive integer.")
+
+        self.max_concurrency = max_concurrency
+        self.limiter = limiter or AsyncAdaptiveConcurrencyLimiter(max_concurrency)
+
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            httpx_timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        else:
+            httpx_timeout = httpx.Timeout(timeout)
+
+        max_connections = max_connections or max_concurrency
+        self.session = httpx.AsyncClient(
+            headers={**(headers or {}), "x-po-di-apikey": self.api_key},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections or max_connections,
+            ),
+            timeout=httpx_timeout,
+        )
+
+    async def __aenter__(self) -> "AsyncDataInsightClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the underlying connection pool.
+        """
+        await self.session.aclose()
+
+    async def aextract(self, blob: Blob, key: Optional[str] = None) -> Dict:
+        """
+        Extract the document data of a blob.
+
+        Args:
+            blob (Blob): File to extract. `blob.metadata["filename"]` must be set.
+            key (str, optional): SHA-256 hash of the blob content, if already
+                computed, so that the blob is not read again to look up `cache`.
+
+        Returns:
+            Dict: Extracted JSON data. Image filenames are replaced with the paths
+            of the images saved under `resources_dir`, or with `ArchiveResource`
+            objects if `resources_mode` is "memory".
+        """
+        # The preflight check reads the file, off the event loop too
+        await asyncio.to_thread(self._check_blob, blob)
+
+        # Reuse a cached result archive, or download it
+        key, zip_file = await asyncio.to_thread(self._cache_lookup, blob, key)
+        if zip_file is None:
+            zip_file = await self._adownload_response(blob)
+        else:
+            # Already cached
+            key = None
+
+        # Unzip and post-process off the event loop
+        try:
+            unzip_dir_path = await asyncio.to_thread(self._create_unzip_dir)
+        except BaseException:
+            zip_file.close()
+            raise
+        return await asyncio.to_thread(
+            self._load_archive, zip_file, unzip_dir_path, key
+        )
+
+    async def _adownload_response(self, blob: Blob) -> SpooledTemporaryFile:
+        position = _stream_position(blob)
+        attempt = 0
+        while True:
+            async with self.limiter.slot() as slot:
+                try:
+                    zip_file = await self._aread_response(
+                        await self._aget_response(blob)
+                    )
+                    slot.succeeded = True
+                    return zip_file
+                except RetryableError as e:
+                    error = e
+                    slot.throttled = e.throttled
+
+            # Back off outside the limiter slot
+            delay = self._retry_delay(attempt, error, blob, position)
+            if delay is None:
+                raise error
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _aread_response(self, response: "httpx.Response") -> SpooledTemporaryFile:
+        import httpx
+
+        zip_file = SpooledTemporaryFile(max_size=self.spool_max_size)
+        try:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                zip_file.write(chunk)
+            zip_file.seek(0)
+            return zip_file
+        except httpx.HTTPError as e:
+            zip_file.close()
+            raise RetryableError(f"Failed to download response: {e}")
+        finally:
+            await response.aclose()
+
+    async def _aget_response(self, blob: Blob) -> "httpx.Response":
+        import httpx
+
+        response = None
+
+        try:
+            # Prepare the request, streaming the file content
+            body, content_type = encode_multipart(blob)
+            headers = {"Content-Type": content_type}
+            if isinstance(body, MultipartBody):
+                headers["Content-Length"] = str(len(body))
+
+            # Send the request, keeping the response body as a stream
+            request = self.session.build_request(
+                "POST",
+                self._api_base_url,
+                content=_aiter_in_thread(body),
+                headers=headers,
+            )
+            response = await self.session.send(request, stream=True)
+            if response.is_error:
+                await response.aread()
+            response.raise_for_status()
+            return response
+        except httpx.HTTPStatusError as e:
+            await response.aclose()
+            if e.response.status_code in self.retry.retry_statuses:
+                raise RetryableError(
+                    f"HTTP error: {e.response.text}",
+                    retry_after=e.response.headers.get("Retry-After"),
+                    throttled=e.response.status_code in THROTTLING_STATUSES,
+                )
+            raise ValueError(f"HTTP error: {e.response.text}")
+        except httpx.TransportError as e:
+            raise RetryableError(f"Failed to send request: {e}")
+        except httpx.HTTPError as e:
+            # Handle any request-related exceptions
+            raise ValueError(f"Failed to send request: {e}")
+        except Exception as e:
+            # Handle any other exceptions
+            raise ValueError(f"An error occurred: {e}")
+
+
+async def _aiter_in_thread(chunks: Iterable[bytes]) -> AsyncIterator[bytes]:
+    # Read the upload chunks (file I/O) in a worker thread
+    iterator = iter(chunks)
+    while True:
+        chunk = await asyncio.to_thread(next, iterator, None)
+        if chunk is None:
+            break
+        yield chunk
@@ -0,0 +1,332 @@
+"""PolarisAIDataInsight batch extraction."""
+
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+try:
+    from .datainsight_cache import ExtractionCache, hash_blob
+    from .datainsight_client import DataInsightClient, StrPath
+    from .datainsight_manifest import IngestionManifest, ManifestEntry
+    from .datainsight_resources import ContentAddressedStore, ResourceStore
+    from .datainsight_retry import AdaptiveConcurrencyLimiter, RetryPolicy
+    from .utils.http_utils import Blob, determine_mime_type
+    from .utils.json_utils import JSONCodec
+except ImportError:
+    from polaris_ai_datainsight.datainsight_cache import ExtractionCache, hash_blob
+    from polaris_ai_datainsight.datainsight_client import DataInsightClient, StrPath
+    from polaris_ai_datainsight.datainsight_manifest import (
+        IngestionManifest,
+        ManifestEntry,
+    )
+    from polaris_ai_datainsight.datainsight_resources import (
+        ContentAddressedStore,
+        ResourceStore,
+    )
+    from polaris_ai_datainsight.datainsight_retry import (
+        AdaptiveConcurrencyLimiter,
+        RetryPolicy,
+    )
+    from polaris_ai_datainsight.utils.http_utils import Blob, determine_mime_type
+    from polaris_ai_datainsight.utils.json_utils import JSONCodec
+
+BatchSource = Union[StrPath, Blob]
+ExtractionStatusType = Literal["extracted", "unchanged", "deleted"]
+
+
+@dataclass
+class ExtractionResult:
+    """
+    Result of one item of a batch extraction.
+
+    Attributes:
+        index (int): Position of the item in the input.
+        source (str, Path, Blob): The input item.
+        data (Dict, optional): Extracted JSON data, if the extraction succeeded.
+        error (Exception, optional): The error raised while extracting the item.
+        status (str): "extracted" if the item was extracted (or failed to), and with
+            an `IngestionManifest`, "unchanged" for files unchanged since the last
+            run, or "deleted" for recorded files absent from this run. The data of
+            an unchanged file is loaded from the client cache, or None without one.
+    """
+
+    index: int
+    source: BatchSource
+    data: Optional[Dict] = None
+    error: Optional[Exception] = None
+    status: ExtractionStatusType = "extracted"
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def extract_many(
+    sources: Iterable[BatchSource],
+    *,
+    client: Optional[DataInsightClient] = None,
+    api_key: Optional[str] = None,
+    resources_dir: StrPath = "app/",
+    max_workers: int = 8,
+    ordered: bool = False,
+    retry: Optional[RetryPolicy] = None,
+    resource_store: Optional[ResourceStore] = None,
+    content_store: Optional[ContentAddressedStore] = None,
+    max_file_size: Optional[int] = None,
+    json_codec: Optional[str | JSONCodec] = None,
+    cache: Optional[ExtractionCache] = None,
+    manifest: Optional[IngestionManifest] = None,
+) -> Iterator[ExtractionResult]:
+    """
+    Extract many documents concurrently.
+
+    Items are uploaded by a pool of `max_workers` threads sharing one pooled
+    client, so the server-side conversion of several documents overlaps. At most
+    `2 * max_workers` items are scheduled at a time, so large or lazy inputs are
+    consumed progressively. An error on one item is captured in its result and
+    does not abort the batch. When the batch opens its own client, throttling
+    by the API lowers the number of uploads in flight below `max_workers`
+    until requests succeed again.
+
+    Args:
+        `sources` (Iterable[str | Path | Blob]): File paths or blobs to extract.
+            A blob must have `metadata["filename"]` set.
+        `client` (DataInsightClient, optional): Shared client. If not provided, a client
+            with a pool of `max_workers` connections is opened for the batch.
+        `api_key` (str, optional): API authentication key, used when `client` is not provided.
+        `resources_dir` (str, optional): Resource directory path, used when `client` is not provided.
+        `max_workers` (int, optional): Number of concurrent extractions. Defaults to 8.
+        `ordered` (bool, optional): Yield results in input order instead of
+            completion order. Defaults to False.
+        `retry` (RetryPolicy, optional): Retry policy, used when `client` is not provided.
+        `resource_store` (ResourceStore, optional): Managed resources directory, used instead of
+            `resources_dir` when `client` is not provided.
+        `content_store` (ContentAddressedStore, optional): Store writing each distinct image once,
+            used when `client` is not provided. Repeated images across the batch are then written once.
+        `max_file_size` (int, optional): Maximum size of the documents in bytes, used when `client`
+            is not provided. Larger, empty, truncated or password-protected documents fail
+            locally, without being uploaded.
+        `json_codec` (str, JSONCodec, optional): JSON backend decoding the results, used when
+            `client` is not provided. Defaults to the fastest installed backend.
+        `cache` (ExtractionCache, optional): Cache of result archives, used when `client` is
+            not provided. With a `manifest`, unchanged files are served from it.
+        `manifest` (IngestionManifest, optional): Record of the previous runs. Only new and
+            changed files are uploaded; unchanged files are yielded with the status
+            "unchanged", and the recorded files absent from `sources` are yielded last
+            with the status "deleted". A file is recorded once its result was
+            delivered, i.e. when the next result is requested, so files whose results
+            were not consumed before stopping early are extracted again by the next
+            run. The manifest is saved when the batch ends.
+
+    Yields:
+        ExtractionResult: One result per input item.
+
+    Example:
+        ```python
+        from polaris_ai_datainsight import extract_many
+
+        for result in extract_many(Path("docs").glob("*.docx"), max_workers=16):
+            if result.ok:
+                print(result.source, len(result.data["pages"]))
+            else:
+                print(result.source, result.error)
+        ```
+    """
+    if max_workers < 1:
+        raise ValueError("`max_workers` must be a positive integer.")
+
+    owns_client = client is None
+    if owns_client:
+        client = DataInsightClient(
+            api_key=api_key,
+            resources_dir=resources_dir,
+            pool_maxsize=max_workers,
+            retry=retry,
+            resource_store=resource_store,
+            content_store=content_store,
+            max_file_size=max_file_size,
+            json_codec=json_codec,
+            cache=cache,
+            limiter=AdaptiveConcurrencyLimiter(max_workers),
+        )
+
+    if manifest is None:
+        extract = partial(_extract_one, client)
+    else:
+        extract = partial(_extract_incremental, client, manifest)
+        tracker = _SourceTracker()
+        sources = tracker.track(sources)
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        if ordered:
+            outcomes = _iter_ordered(executor, extract, sources, max_workers * 2)
+        else:
+            outcomes = _iter_completed(executor, extract, sources, max_workers * 2)
+
+        if manifest is None:
+            yield from outcomes
+        else:
+            for result, entry in outcomes:
+                yield result
+                # Resumed: the caller got the result, and the file can be skipped
+                # by the next run
+                if entry is not None:
+                    manifest.record(result.source, entry)
+
+            # Deletions are only known once every source was seen
+            index = tracker.count
+            for key in manifest.missing(tracker.keys):
+                yield ExtractionResult(index=index, source=Path(key), status="deleted")
+                manifest.discard(key)
+                index += 1
+    finally:
+        # Drop the scheduled items if the caller stops iterating early
+        executor.shutdown(wait=True, cancel_futures=True)
+        if manifest is not None:
+            manifest.save()
+        if owns_client:
+            client.close()
+
+
+def _iter_ordered(
+    executor: ThreadPoolExecutor,
+    extract: Callable[[int, BatchSource], Any],
+    sources: Iterable[BatchSource],
+    window: int,
+) -> Iterator[Any]:
+    pending: deque[Future] = deque()
+    for index, source in enumerate(sources):
+        pending.append(executor.submit(extract, index, source))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+
+    while pending:
+        yield pending.popleft().result()
+
+
+def _iter_completed(
+    executor: ThreadPoolExecutor,
+    extract: Callable[[int, BatchSource], Any],
+    sources: Iterable[BatchSource],
+    window: int,
+) -> Iterator[Any]:
+    pending: set[Future] = set()
+    for index, source in enumerate(sources):
+        pending.add(executor.submit(extract, index, source))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def _extract_one(
+    client: DataInsightClient, index: int, source: BatchSource
+) -> ExtractionResult:
+    try:
+        blob = _to_blob(source)
+        return ExtractionResult(index=index, source=source, data=client.extract(blob))
+    except Exception as e:
+        return ExtractionResult(index=index, source=source, error=e)
+
+
+class _SourceTracker:
+    # Counts the sources and records the manifest keys of the file paths, to
+    # find the deleted files
+
+    def __init__(self):
+        self.count = 0
+        self.keys: set[str] = set()
+
+    def track(self, sources: Iterable[BatchSource]) -> Iterator[BatchSource]:
+        for source in sources:
+            self.count += 1
+            if isinstance(source, (str, Path)):
+                self.keys.add(IngestionManifest.key(source))
+            yield source
+
+
+def _extract_incremental(
+    client: DataInsightClient,
+    manifest: IngestionManifest,
+    index: int,
+    source: BatchSource,
+) -> Tuple[ExtractionResult, Optional[ManifestEntry]]:
+    # Returns the result and the manifest entry to record once it is delivered.
+    # Blobs have no path to record, so they are always extracted
+    if not isinstance(source, (str, Path)):
+        return _extract_one(client, index, source), None
+
+    try:
+        blob = _to_blob(source)
+        stat = Path(source).stat()
+        entry = manifest.get(source)
+        if (
+            entry is not None
+            and entry.size == stat.st_size
+            and entry.mtime_ns == stat.st_mtime_ns
+        ):
+            sha256 = entry.sha256
+        else:
+            # A touched file is recognized by its content
+            sha256 = hash_blob(blob)
+
+        if entry is not None and entry.sha256 == sha256:
+            data = None
+            if entry.result is not None:
+                data = client.load_cached(entry.result)
+            # A result evicted from the cache is extracted again
+            if data is not None or client.cache is None:
+                result = ExtractionResult(
+                    index=index, source=source, data=data, status="unchanged"
+                )
+                return result, ManifestEntry(
+                    stat.st_size, stat.st_mtime_ns, sha256, entry.result
+                )
+
+        # The content hash is passed on, so the cache lookup does not read it again
+        data = client.extract(blob, key=sha256)
+    except Exception as e:
+        # Extracted again by the next run
+        manifest.discard(source)
+        return ExtractionResult(index=index, source=source, error=e), None
+
+    # The client caches results under the content hash
+    cache_key = sha256 if client.cache is not None else None
+    result = ExtractionResult(index=index, source=source, data=data)
+    return result, ManifestEntry(stat.st_size, stat.st_mtime_ns, sha256, cache_key)
+
+
+def _to_blob(source: BatchSource) -> Blob:
+    if isinstance(source, Blob):
+        return source
+
+    if not isinstance(source, (str, Path)):
+        raise ValueError("Batch items must be file paths or Blob objects.")
+
+    if not Path(source).is_file():
+        raise ValueError(f"File {source} does not exist.")
+
+    return Blob.from_path(
+        path=source,
+        mime_type=determine_mime_type(str(source)),
+        metadata={"filename": Path(source).name},
+    )
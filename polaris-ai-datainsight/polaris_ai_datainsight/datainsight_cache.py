@@ -0,0 +1,244 @@
+"""PolarisAIDataInsight extraction result cache."""
+
+import io
+import os
+import shutil
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Optional, Tuple
+
+try:
+    from .utils.http_utils import Blob
+except ImportError:
+    from polaris_ai_datainsight.utils.http_utils import Blob
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class ExtractionCache(ABC):
+    """
+    Base class of the extraction result caches.
+
+    A cache maps the SHA-256 hash of a document to the result archive returned
+    by the API (the JSON data together with its resources). A hit is loaded
+    exactly like a fresh API response, so it honours the `resources_dir` and
+    `resources_mode` of the client reading it.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[BinaryIO]:
+        """
+        Return the cached result archive for `key`, or None on a miss.
+        """
+
+    @abstractmethod
+    def set(self, key: str, zip_file: BinaryIO) -> None:
+        """
+        Store the result archive read from `zip_file` under `key`.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove every entry.
+        """
+
+
+class MemoryExtractionCache(ExtractionCache):
+    """
+    In-process LRU cache holding result archives in memory.
+
+    Args:
+        `max_size` (int, optional): Maximum total size of the archives in bytes.
+        `max_entries` (int, optional): Maximum number of entries.
+        `max_age` (float, optional): Maximum age of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: Optional[int] = 256 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._entries: OrderedDict[str, Tuple[bytes, float]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[BinaryIO]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            data, created_at = entry
+            if self.max_age is not None and time.time() - created_at > self.max_age:
+                self._remove(key)
+                return None
+
+            self._entries.move_to_end(key)
+            return io.BytesIO(data)
+
+    def set(self, key: str, zip_file: BinaryIO) -> None:
+        data = zip_file.read()
+        if self.max_size is not None and len(data) > self.max_size:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (data, time.time())
+            self._size += len(data)
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        data, _ = self._entries.pop(key)
+        self._size -= len(data)
+
+    def _evict(self) -> None:
+        # Drop the least recently used entries first
+        while self._entries and (
+            (self.max_size is not None and self._size > self.max_size)
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            self._remove(next(iter(self._entries)))
+
+
+class DiskExtractionCache(ExtractionCache):
+    """
+    On-disk LRU cache of result archives, shareable by processes on one host.
+
+    Each entry is a `<hash>.zip` file in `cache_dir`. Entries are written to a
+    temporary file and atomically renamed, so readers never see partial
+    archives. The modification time of an entry records when it was stored and
+    its access time when it was last used, which drives the LRU eviction.
+
+    Args:
+        `cache_dir` (str, Path): Cache directory. Created if it does not exist.
+        `max_size` (int, optional): Maximum total size of the archives in bytes.
+        `max_entries` (int, optional): Maximum number of entries.
+        `max_age` (float, optional): Maximum age of an entry in seconds.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path,
+        *,
+        max_size: Optional[int] = 1024 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        max_age: Optional[float] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, key: str) -> Optional[BinaryIO]:
+        path = self._entry_path(key)
+        try:
+            zip_file = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        stat = os.fstat(zip_file.fileno())
+        now = time.time()
+        if self.max_age is not None and now - stat.st_mtime > self.max_age:
+            zip_file.close()
+            self._unlink(path)
+            return None
+
+        # Mark the entry as recently used, keeping its creation time
+        try:
+            os.utime(path, (now, stat.st_mtime))
+        except OSError:
+            pass
+        return zip_file
+
+    def set(self, key: str, zip_file: BinaryIO) -> None:
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                shutil.copyfileobj(zip_file, f)
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            self._unlink(Path(temp_path))
+            raise
+        self._evict()
+
+    def clear(self) -> None:
+        for path in self.cache_dir.glob("*.zip"):
+            self._unlink(path)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.zip"
+
+    def _evict(self) -> None:
+        entries = []
+        now = time.time()
+        for path in self.cache_dir.glob("*.zip"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                # Removed by another process
+                continue
+            if self.max_age is not None and now - stat.st_mtime > self.max_age:
+                self._unlink(path)
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        # Drop the least recently used entries first
+        entries.sort(key=lambda entry: entry[0])
+        total_size = sum(size for _, size, _ in entries)
+        while entries and (
+            (self.max_size is not None and total_size > self.max_size)
+            or (self.max_entries is not None and len(entries) > self.max_entries)
+        ):
+            _, size, path = entries.pop(0)
+            self._unlink(path)
+            total_size -= size
+
+    @staticmethod
+    def _unlink(path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def hash_blob(blob: Blob) -> Optional[str]:
+    """
+    Compute the SHA-256 hash of a blob content.
+
+    Returns None for blobs that cannot be read twice (non-seekable streams and
+    chunk iterators), since hashing would consume the upload.
+    """
+    import hashlib
+
+    digest = hashlib.sha256()
+    if blob.path is not None:
+        with open(blob.path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    elif blob.data is not None:
+        digest.update(blob.data)
+    elif hasattr(blob.stream, "seekable") and blob.stream.seekable():
+        position = blob.stream.tell()
+        while chunk := blob.stream.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+        blob.stream.seek(position)
+    else:
+        return None
+    return digest.hexdigest()
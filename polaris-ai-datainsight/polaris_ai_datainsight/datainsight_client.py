@@ -0,0 +1,737 @@
+"""PolarisAIDataInsight API client."""
+
+import os
+import time
+import zipfile
+from contextlib import nullcontext
+from pathlib import Path, PurePosixPath
+from tempfile import SpooledTemporaryFile
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    Optional,
+    Tuple,
+    get_args,
+)
+
+try:
+    from .datainsight_cache import ExtractionCache, hash_blob
+    from .datainsight_resources import ContentAddressedStore, ResourceStore
+    from .datainsight_retry import (
+        THROTTLING_STATUSES,
+        AdaptiveConcurrencyLimiter,
+        RetryableError,
+        RetryPolicy,
+    )
+    from .utils.file_utils import create_temp_dir
+    from .utils.format_utils import check_document
+    from .utils.http_utils import Blob, encode_multipart
+    from .utils.json_utils import JSONCodec, get_json_codec, iter_json_array
+    from .utils.zip_utils import ArchiveResource
+except ImportError:
+    from polaris_ai_datainsight.datainsight_cache import ExtractionCache, hash_blob
+    from polaris_ai_datainsight.datainsight_resources import (
+        ContentAddressedStore,
+        ResourceStore,
+    )
+    from polaris_ai_datainsight.datainsight_retry import (
+        THROTTLING_STATUSES,
+        AdaptiveConcurrencyLimiter,
+        RetryableError,
+        RetryPolicy,
+    )
+    from polaris_ai_datainsight.utils.file_utils import create_temp_dir
+    from polaris_ai_datainsight.utils.format_utils import check_document
+    from polaris_ai_datainsight.utils.http_utils import Blob, encode_multipart
+    from polaris_ai_datainsight.utils.json_utils import (
+        JSONCodec,
+        get_json_codec,
+        iter_json_array,
+    )
+    from polaris_ai_datainsight.utils.zip_utils import ArchiveResource
+
+if TYPE_CHECKING:
+    import requests
+
+DEFAULT_API_BASE_URL = (
+    "https://datainsight-api.polarisoffice.com/api/v1/datainsight/doc-extract"
+)
+
+SupportedExtensionType = Literal[
+    ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx", ".hwp", ".hwpx"
+]
+ResourcesModeType = Literal["disk", "memory"]
+PreflightType = bool | Literal["strict"]
+StrPath = str | Path
+
+# Result archives larger than this are spooled to a temporary file on disk
+DEFAULT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# JSON data larger than this is parsed page by page by `iter_pages`, and smaller
+# data is decoded at once with the JSON codec, which is several times faster
+STREAM_JSON_MIN_SIZE = 32 * 1024 * 1024
+
+
+class BaseDataInsightClient:
+    """
+    Common base of the Polaris AI DataInsight API clients.
+
+    Holds the API settings and turns the result archive returned by the API
+    into JSON data. Subclasses implement the transport.
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        resources_dir: StrPath = "app/",
+        base_url: Optional[str] = None,
+        timeout: Optional[float | Tuple[float, float]] = None,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        resources_mode: ResourcesModeType = "disk",
+        cache: Optional[ExtractionCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        resource_store: Optional[ResourceStore] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        preflight: PreflightType = True,
+        max_file_size: Optional[int] = None,
+    ):
+        self.api_key: Optional[str] = api_key or os.environ.get(
+            "POLARIS_AI_DATA_INSIGHT_API_KEY"
+        )
+        if not self.api_key:
+            raise ValueError(
+                "API key is not provided."
+                " Please pass the `api_key` as a parameter,"
+                " or set the `POLARIS_AI_DATA_INSIGHT_API_KEY` environment variable."
+            )
+
+        self._api_base_url = base_url or DEFAULT_API_BASE_URL
+        self._supported_extensions = get_args(SupportedExtensionType)
+        self.resources_dir: StrPath = resources_dir
+        self.timeout = timeout
+        self.spool_max_size = spool_max_size
+
+        if resources_mode not in get_args(ResourcesModeType):
+            raise ValueError(
+                f"Invalid resources_mode: {resources_mode}."
+                f" Supported modes are: {get_args(ResourcesModeType)}"
+            )
+        self.resources_mode: ResourcesModeType = resources_mode
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.json_codec = get_json_codec(json_codec)
+
+        # A resource store manages the directories under its own root
+        self.resource_store = resource_store
+        if resource_store is not None:
+            self.resources_dir = resource_store.resources_dir
+        self.content_store = content_store
+        if preflight not in (True, False, "strict"):
+            raise ValueError(
+                f"Invalid preflight: {preflight}."
+                " Supported values are: True, False, 'strict'"
+            )
+        self.preflight: PreflightType = preflight
+        self.max_file_size = max_file_size
+
+        # create the directory if it does not exist
+        if self.resources_mode == "disk" and not Path(self.resources_dir).exists():
+            Path(self.resources_dir).mkdir(parents=True, exist_ok=True)
+
+    @property
+    def supported_extensions(self) -> list[str]:
+        """
+        Returns a list of supported file extensions.
+        """
+        return self._supported_extensions
+
+    def validate_extension(self, file_path: StrPath) -> bool:
+        """
+        Validates if the file extension is supported.
+
+        Args:
+            filename (str): The name of the file to validate.
+
+        Returns:
+            bool: True if the file extension is supported, False otherwise.
+        """
+        extension = Path(file_path).suffix.lower()
+        return extension in self._supported_extensions
+
+    def _check_blob(self, blob: Blob):
+        filename = blob.metadata.get("filename", "")
+        if not self.validate_extension(filename):
+            raise ValueError(
+                "Unsupported file extension."
+                f" Supported extensions are: {self._supported_extensions}"
+            )
+
+        # Reject doomed uploads before any network round trip
+        if self.preflight:
+            check_document(
+                blob,
+                Path(filename).suffix.lower(),
+                self.max_file_size,
+                strict=self.preflight == "strict",
+            )
+        elif self.max_file_size is not None and (blob.size or 0) > self.max_file_size:
+            raise ValueError(
+                f"File is too large: {filename} ({blob.size} bytes)."
+                f" The maximum size is {self.max_file_size} bytes."
+            )
+
+    def _cache_lookup(
+        self, blob: Blob, key: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[BinaryIO]]:
+        # Look up the result archive of a byte-identical document
+        if self.cache is None:
+            return None, None
+        key = key or hash_blob(blob)
+        if key is None:
+            return None, None
+        return key, self.cache.get(key)
+
+    def _cache_store(self, key: Optional[str], zip_file: BinaryIO) -> None:
+        if self.cache is None or key is None:
+            return
+        zip_file.seek(0)
+        try:
+            self.cache.set(key, zip_file)
+        except OSError:
+            # A cache failure must not fail the extraction
+            pass
+        zip_file.seek(0)
+
+    def _retry_delay(
+        self, attempt: int, error: RetryableError, blob: Blob, position: Optional[int]
+    ) -> Optional[float]:
+        # Delay before retrying a failed upload, or None to give up
+        if attempt >= self.retry.max_retries:
+            return None
+
+        # The upload can be replayed only if the blob content can be read again
+        if not blob.replayable:
+            return None
+        if position is not None:
+            blob.stream.seek(position)
+
+        return self.retry.compute_delay(attempt, error.retry_after)
+
+    def _create_unzip_dir(self) -> Optional[Path]:
+        # No directory is needed when resources are kept in the archive
+        if self.resources_mode == "memory":
+            return None
+        # Nor when resources are referred to in a content store
+        if self.content_store is not None and self.content_store.link_mode == "path":
+            return None
+        if self.resource_store is not None:
+            return self.resource_store.create()
+        return create_temp_dir(self.resources_dir)
+
+    def _discard_unzip_dir(self, dir_path: Optional[Path]) -> None:
+        # Drop a directory left unused by a failed or image-less extraction
+        if dir_path is not None and self.resource_store is not None:
+            self.resource_store.release(dir_path)
+
+    def _finish_unzip_dir(self, dir_path: Optional[Path]) -> None:
+        # Account for the size of a directory once its resources are written
+        if dir_path is not None and self.resource_store is not None:
+            self.resource_store.finish(dir_path)
+
+    def _load_archive(
+        self,
+        zip_file: BinaryIO,
+        dir_path: Optional[StrPath],
+        cache_key: Optional[str] = None,
+    ) -> Dict:
+        # The archive is closed here, unless in-memory resources refer to it.
+        # It is cached under `cache_key` only once it loaded, so that a broken
+        # result is not served again
+        keep_open = self.resources_mode == "memory"
+        zip_ref = None
+        try:
+            zip_ref = zipfile.ZipFile(zip_file, "r")
+
+            # Index the archive entries without extracting them
+            json_info, resource_infos = self._index_archive(zip_ref)
+
+            # Read the JSON data straight from the archive
+            json_data = self._read_json(zip_ref, json_info)
+
+            # Check if the "page", "elements" keys are present in the JSON data
+            self._validate_data_structure(json_data)
+
+            if keep_open:
+                # Resolve resources to lazily read archive entries
+                images_path_map = {
+                    name: ArchiveResource(zip_ref, info)
+                    for name, info in resource_infos.items()
+                }
+            else:
+                # Write only the resources referenced by elements
+                images_path_map = self._extract_resources(
+                    zip_ref, resource_infos, json_data["pages"], dir_path
+                )
+                if images_path_map:
+                    self._finish_unzip_dir(dir_path)
+                else:
+                    self._discard_unzip_dir(dir_path)
+
+            # Post-process the JSON data to replace image filenames with paths
+            self._postprocess_json(json_data, images_path_map)
+
+            self._cache_store(cache_key, zip_file)
+        except BaseException:
+            keep_open = False
+            self._discard_unzip_dir(dir_path)
+            raise
+        finally:
+            if not keep_open:
+                if zip_ref is not None:
+                    zip_ref.close()
+                zip_file.close()
+
+        return json_data
+
+    def _iter_archive_pages(
+        self,
+        zip_file: BinaryIO,
+        dir_path: Optional[StrPath],
+        cache_key: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        # Same as `_load_archive`, one page at a time. The archive is cached once
+        # every page was read, so a result stopped early is not cached
+        keep_open = self.resources_mode == "memory"
+        zip_ref = None
+        try:
+            zip_ref = zipfile.ZipFile(zip_file, "r")
+            json_info, resource_infos = self._index_archive(zip_ref)
+
+            with zip_ref.open(json_info) as json_file:
+                for doc_page in iter_json_array(
+                    json_file,
+                    "pages",
+                    self.json_codec.loads,
+                    stream=json_info.file_size > STREAM_JSON_MIN_SIZE,
+                ):
+                    if "elements" not in doc_page:
+                        raise ValueError("Invalid JSON data structure.")
+
+                    if keep_open:
+                        images_path_map = {
+                            name: ArchiveResource(zip_ref, resource_infos[name])
+                            for name in self._iter_referenced_resources([doc_page])
+                            if name in resource_infos
+                        }
+                    else:
+                        images_path_map = self._extract_resources(
+                            zip_ref, resource_infos, [doc_page], dir_path
+                        )
+
+                    self._postprocess_page(doc_page, images_path_map)
+                    yield doc_page
+            self._cache_store(cache_key, zip_file)
+            self._finish_unzip_dir(dir_path)
+        except GeneratorExit:
+            # Stopped early: resources of the pages already yielded stay readable
+            self._finish_unzip_dir(dir_path)
+            raise
+        except BaseException:
+            keep_open = False
+            self._discard_unzip_dir(dir_path)
+            raise
+        finally:
+            if not keep_open:
+                if zip_ref is not None:
+                    zip_ref.close()
+                zip_file.close()
+
+    def _index_archive(
+        self, zip_ref: zipfile.ZipFile
+    ) -> Tuple[zipfile.ZipInfo, Dict[str, zipfile.ZipInfo]]:
+        json_info = None
+        resource_infos = {}
+        for info in zip_ref.infolist():
+            if info.is_dir():
+                continue
+            if info.filename.lower().endswith(".json"):
+                json_info = json_info or info
+            else:
+                resource_infos[PurePosixPath(info.filename).name] = info
+
+        if json_info is None:
+            raise ValueError("No JSON file found in the response.")
+        return json_info, resource_infos
+
+    def _read_json(self, zip_ref: zipfile.ZipFile, json_info: zipfile.ZipInfo) -> Dict:
+        try:
+            return self.json_codec.loads(zip_ref.read(json_info))
+        except ValueError as e:
+            # Handle JSON decode errors
+            raise ValueError(f"Failed to decode JSON response: {e}")
+
+    def _extract_resources(
+        self,
+        zip_ref: zipfile.ZipFile,
+        resource_infos: Dict[str, zipfile.ZipInfo],
+        pages: Iterable[Dict],
+        dir_path: StrPath,
+    ) -> Dict[str, Path]:
+        images_path_map = {}
+        for image_filename in self._iter_referenced_resources(pages):
+            if image_filename in images_path_map:
+                continue
+            info = resource_infos.get(image_filename)
+            if info is None:
+                # Reported by `_replace_image_filenames_with_paths`
+                continue
+            if self.content_store is not None:
+                # Write each distinct resource once, and link to it
+                image_path = self.content_store.link(zip_ref, info, dir_path)
+            else:
+                image_path = zip_ref.extract(info, dir_path)
+            images_path_map[image_filename] = Path(image_path).absolute()
+        return images_path_map
+
+    def _iter_referenced_resources(self, pages: Iterable[Dict]) -> Iterator[str]:
+        for doc_page in pages:
+            for doc_element in doc_page["elements"]:
+                if doc_element.get("type") == "text":
+                    continue
+                src = doc_element.get("content", {}).get("src")
+                if src:
+                    yield src
+
+    def _postprocess_json(self, json_data: Dict, images_path_map: Dict):
+        for doc_page in json_data["pages"]:
+            self._postprocess_page(doc_page, images_path_map)
+
+    def _postprocess_page(self, doc_page: Dict, images_path_map: Dict):
+        for doc_element in doc_page["elements"]:
+            if doc_element.get("type") != "text":
+                self._replace_image_filenames_with_paths(doc_element, images_path_map)
+
+    def _replace_image_filenames_with_paths(
+        self, doc_element: Dict, images_path_map: Dict
+    ):
+        # Convert image filename to image path
+        if "src" not in doc_element.get("content", {}):
+            return
+
+        image_filename = doc_element.get("content").get("src")  # image filename
+        image_path = images_path_map.get(image_filename)
+        if not image_path:
+            raise ValueError(f"Image path not found for {image_filename}")
+
+        doc_element["content"]["src"] = image_path
+
+    def _validate_data_structure(self, json_data):
+        if "pages" not in json_data:
+            raise ValueError("Invalid JSON data structure.")
+        if "elements" not in json_data["pages"][0]:
+            raise ValueError("Invalid JSON data structure.")
+
+
+class DataInsightClient(BaseDataInsightClient):
+    """
+    Reusable Polaris AI DataInsight API client.
+
+    The client owns a pooled, keep-alive ``requests.Session``, so any number of
+    documents can be extracted over the same connections instead of paying for
+    a new TCP/TLS handshake per document. A single client may be shared by many
+    threads.
+
+    Instantiate:
+        ```python
+            from polaris_ai_datainsight import DataInsightClient
+            from polaris_ai_datainsight.utils.http_utils import Blob
+
+            with DataInsightClient(
+                api_key="your-api-key",
+                resources_dir="path/to/save/resources/",
+                pool_maxsize=32,
+            ) as client:
+                for path in paths:
+                    blob = Blob.from_path(path, mime_type=..., metadata={"filename": path.name})
+                    dict_data = client.extract(blob)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        api_key: Optional[str] = None,
+        resources_dir: StrPath = "app/",
+        base_url: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float | Tuple[float, float]] = None,
+        spool_max_size: int = DEFAULT_SPOOL_MAX_SIZE,
+        resources_mode: ResourcesModeType = "disk",
+        cache: Optional[ExtractionCache] = None,
+        retry: Optional[RetryPolicy] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        resource_store: Optional[ResourceStore] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        preflight: PreflightType = True,
+        max_file_size: Optional[int] = None,
+    ):
+        """
+        Initialize the client.
+
+        Args:
+            `api_key` (str, optional): API authentication key. If not provided, the API key will be
+                retrieved from an environment variable. If no API key is found, a ValueError is raised.
+            `resources_dir` (str, optional): Resource directory path. If the
+                directory does not exist, it will be created. Defaults to "app/".
+            `base_url` (str, optional): Endpoint of the extraction API.
+            `pool_connections` (int, optional): Number of host connection pools to cache. Defaults to 10.
+            `pool_maxsize` (int, optional): Maximum number of keep-alive connections per pool.
+                Set it to at least the number of threads sharing the client. Defaults to 10.
+            `headers` (dict, optional): Extra headers sent with every request.
+            `timeout` (float, tuple, optional): `requests` timeout for each API call.
+            `spool_max_size` (int, optional): The result archive is downloaded in chunks and
+                kept in memory up to this many bytes, then spooled to a temporary file. Defaults to 8 MiB.
+            `resources_mode` (str, optional): "disk" writes the images to `resources_dir`.
+                "memory" resolves `content.src` to `ArchiveResource` objects read lazily from the
+                result archive, without any filesystem write. Defaults to "disk".
+            `cache` (ExtractionCache, optional): Cache of result archives keyed by the hash of
+                the document bytes. Byte-identical documents are then extracted without an API call.
+            `retry` (RetryPolicy, optional): Retry policy for throttled (429), failed (5xx) and
+                dropped requests. Defaults to 3 retries with exponential backoff and jitter.
+                Pass `RetryPolicy(max_retries=0)` to disable retries.
+            `limiter` (AdaptiveConcurrencyLimiter, optional): Concurrency limiter shared by the
+                threads using the client. It lowers the number of requests in flight when the
+                API throttles, and raises it back as requests succeed.
+            `json_codec` (str, JSONCodec, optional): JSON backend decoding the results: "orjson",
+                "msgspec" or "json". Defaults to the fastest installed backend.
+            `resource_store` (ResourceStore, optional): Managed resources directory, used instead of
+                `resources_dir`. It deletes the directories of released, evicted and orphaned extractions.
+            `content_store` (ContentAddressedStore, optional): Store writing each distinct image once,
+                under its content hash. Extraction directories then link to the stored images.
+            `preflight` (bool, "strict", optional): Check the container header of each document
+                before uploading it, so that empty and password-protected files are rejected locally.
+                Truncated files and files whose content does not match their extension raise a
+                warning, or are rejected too in "strict" mode. Defaults to True.
+            `max_file_size` (int, optional): Maximum size of the uploaded documents in bytes.
+        """
+        super().__init__(
+            api_key=api_key,
+            resources_dir=resources_dir,
+            base_url=base_url,
+            timeout=timeout,
+            spool_max_size=spool_max_size,
+            resources_mode=resources_mode,
+            cache=cache,
+            retry=retry,
+            json_codec=json_codec,
+            resource_store=resource_store,
+            content_store=content_store,
+            preflight=preflight,
+            max_file_size=max_file_size,
+        )
+        self.limiter = limiter
+
+        # Imported on first use to keep the package import fast
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        # Keep-alive session with a connection pool shared by every extraction
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers or {})
+        self.session.headers.update(
+            {"x-po-di-apikey": self.api_key, "Connection": "keep-alive"}
+        )
+
+    def __enter__(self) -> "DataInsightClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release pooled connections.
+        """
+        self.session.close()
+
+    def extract(self, blob: Blob, key: Optional[str] = None) -> Dict:
+        """
+        Extract the document data of a blob.
+
+        Args:
+            blob (Blob): File to extract. `blob.metadata["filename"]` must be set.
+            key (str, optional): SHA-256 hash of the blob content, if already
+                computed, so that the blob is not read again to look up `cache`.
+
+        Returns:
+            Dict: Extracted JSON data. Image filenames are replaced with the paths
+            of the images saved under `resources_dir`, or with `ArchiveResource`
+            objects if `resources_mode` is "memory".
+        """
+        self._check_blob(blob)
+
+        # Reuse a cached result archive, or download it
+        key, zip_file = self._cache_lookup(blob, key)
+        if zip_file is None:
+            zip_file = self._download_response(blob)
+        else:
+            # Already cached
+            key = None
+
+        # Create a temporary directory for unzipping the response file
+        try:
+            unzip_dir_path = self._create_unzip_dir()
+        except BaseException:
+            zip_file.close()
+            raise
+        return self._load_archive(zip_file, unzip_dir_path, key)
+
+    def load_cached(self, key: str) -> Optional[Dict]:
+        """
+        Load the cached result of a document by the SHA-256 hash of its content,
+        without calling the API.
+
+        Args:
+            key (str): SHA-256 hash of the document content.
+
+        Returns:
+            Dict: Extracted JSON data, or None if `cache` holds no result for `key`.
+        """
+        if self.cache is None:
+            return None
+        zip_file = self.cache.get(key)
+        if zip_file is None:
+            return None
+        try:
+            unzip_dir_path = self._create_unzip_dir()
+        except BaseException:
+            zip_file.close()
+            raise
+        return self._load_archive(zip_file, unzip_dir_path)
+
+    def iter_pages(self, blob: Blob) -> Iterator[Dict]:
+        """
+        Extract the document data of a blob, one page at a time.
+
+        The images of each page are resolved just before it is yielded. The JSON
+        data of large results (over 32 MiB) is parsed incrementally, so memory use
+        follows the size of one page rather than of the whole document. Install the
+        ``stream`` extra (``ijson``) for incremental parsing; without it, and for
+        smaller results, the JSON data is decoded at once with the JSON codec and
+        then iterated.
+
+        Args:
+            blob (Blob): File to extract. `blob.metadata["filename"]` must be set.
+
+        Yields:
+            Dict: Pages of the extracted JSON data, with their `elements`.
+        """
+        self._check_blob(blob)
+
+        key, zip_file = self._cache_lookup(blob)
+        if zip_file is None:
+            zip_file = self._download_response(blob)
+        else:
+            # Already cached
+            key = None
+
+        try:
+            unzip_dir_path = self._create_unzip_dir()
+        except BaseException:
+            zip_file.close()
+            raise
+        yield from self._iter_archive_pages(zip_file, unzip_dir_path, key)
+
+    def _download_response(self, blob: Blob) -> SpooledTemporaryFile:
+        position = _stream_position(blob)
+        attempt = 0
+        while True:
+            with self.limiter.slot() if self.limiter else nullcontext() as slot:
+                try:
+                    zip_file = self._read_response(self._get_response(blob))
+                    if slot is not None:
+                        slot.succeeded = True
+                    return zip_file
+                except RetryableError as e:
+                    error = e
+                    if slot is not None:
+                        slot.throttled = e.throttled
+
+            # Back off outside the limiter slot
+            delay = self._retry_delay(attempt, error, blob, position)
+            if delay is None:
+                raise error
+            time.sleep(delay)
+            attempt += 1
+
+    def _read_response(self, response: "requests.Response") -> SpooledTemporaryFile:
+        import requests
+
+        zip_file = SpooledTemporaryFile(max_size=self.spool_max_size)
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                zip_file.write(chunk)
+            zip_file.seek(0)
+            return zip_file
+        except requests.RequestException as e:
+            zip_file.close()
+            raise RetryableError(f"Failed to download response: {e}")
+        finally:
+            response.close()
+
+    def _get_response(self, blob: Blob) -> "requests.Response":
+        import requests
+
+        try:
+            # Prepare the request, streaming the file content
+            body, content_type = encode_multipart(blob)
+
+            # Send the request
+            response = self.session.post(
+                self._api_base_url,
+                data=body,
+                headers={"Content-Type": content_type},
+                timeout=self.timeout,
+                stream=True,
+            )
+            response.raise_for_status()
+            return response
+        except requests.HTTPError as e:
+            text = e.response.text
+            e.response.close()
+            if e.response.status_code in self.retry.retry_statuses:
+                raise RetryableError(
+                    f"HTTP error: {text}",
+                    retry_after=e.response.headers.get("Retry-After"),
+                    throttled=e.response.status_code in THROTTLING_STATUSES,
+                )
+            raise ValueError(f"HTTP error: {text}")
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise RetryableError(f"Failed to send request: {e}")
+        except requests.RequestException as e:
+            # Handle any request-related exceptions
+            raise ValueError(f"Failed to send request: {e}")
+        except Exception as e:
+            # Handle any other exceptions
+            raise ValueError(f"An error occurred: {e}")
+
+
+def _stream_position(blob: Blob) -> Optional[int]:
+    # Start of a seekable stream blob, to rewind it before a retry
+    if hasattr(blob.stream, "seekable") and blob.stream.seekable():
+        return blob.stream.tell()
+    return None
@@ -1,26 +1,59 @@
 """PolarisAIDataInsight document content extractor."""
 
-import io
-import json
+import mmap
 import os
-import zipfile
 from pathlib import Path
-from typing import Dict, Literal, Optional, Tuple, get_args, overload
-import requests
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    get_args,
+    overload,
+)
+
 try:
-    from .utils.file_utils import create_temp_dir
-    from .utils.http_utils import Blob, determine_mime_type
+    from .datainsight_cache import ExtractionCache
+    from .datainsight_client import (
+        DataInsightClient,
+        PreflightType,
+        ResourcesModeType,
+        StrPath,
+        SupportedExtensionType,
+    )
+    from .datainsight_resources import ContentAddressedStore, ResourceStore
+    from .utils.http_utils import Blob, BytesLike, determine_mime_type
+    from .utils.json_utils import JSONCodec, get_json_codec
+    from .utils.table_utils import TableBackendType, to_columnar
 except ImportError:
-    from polaris_ai_datainsight.utils.file_utils import create_temp_dir
-    from polaris_ai_datainsight.utils.http_utils import Blob, determine_mime_type
+    from polaris_ai_datainsight.datainsight_cache import ExtractionCache
+    from polaris_ai_datainsight.datainsight_client import (
+        DataInsightClient,
+        PreflightType,
+        ResourcesModeType,
+        StrPath,
+        SupportedExtensionType,
+    )
+    from polaris_ai_datainsight.datainsight_resources import (
+        ContentAddressedStore,
+        ResourceStore,
+    )
+    from polaris_ai_datainsight.utils.http_utils import (
+        Blob,
+        BytesLike,
+        determine_mime_type,
+    )
+    from polaris_ai_datainsight.utils.json_utils import JSONCodec, get_json_codec
+    from polaris_ai_datainsight.utils.table_utils import TableBackendType, to_columnar
+
+if TYPE_CHECKING:
+    from polaris_ai_datainsight.datainsight_async_client import AsyncDataInsightClient
 
 POLARISOFFICE_DATAINSIGHT_BASE_URL = os.environ.get("DATA_INSIGHT_BASE_URL")
 
-SupportedExtensionType = Literal[
-    ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx", ".hwp", ".hwpx"
-]
-StrPath = str | Path
-
 
 class PolarisAIDataInsightExtractor:
     """
@@ -66,7 +99,10 @@ class PolarisAIDataInsightExtractor:
 
     Extract:
         ```python
-            docs = extractor.extract()
+            dict_data = extractor.extract()
+
+            # or, inside a coroutine
+            dict_data = await extractor.aextract()
 
             # Elements in first page
             doc_elements = dict_data.get("pages")[0].get("elements")
@@ -75,6 +111,10 @@ class PolarisAIDataInsightExtractor:
             all_elements = []
             for page in dict_data.get("pages"):
                 all_elements.extend(page.get("elements"))
+
+            # Large documents, one page at a time
+            for page in extractor.iter_pages():
+                doc_elements = page.get("elements")
         ```
     """
 
@@ -85,16 +125,34 @@ class PolarisAIDataInsightExtractor:
         file_path: StrPath,
         api_key: Optional[str],
         resources_dir: StrPath = "app/",
+        resources_mode: ResourcesModeType = "disk",
+        cache: Optional[ExtractionCache] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        resource_store: Optional[ResourceStore] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        preflight: PreflightType = True,
+        max_file_size: Optional[int] = None,
+        client: Optional[DataInsightClient] = None,
+        async_client: Optional["AsyncDataInsightClient"] = None,
     ): ...
 
     @overload
     def __init__(
         self,
         *,
-        file: bytes,
+        file: BytesLike | BinaryIO | Iterable[bytes],
         filename: str,
         api_key: Optional[str],
         resources_dir: StrPath = "app/",
+        resources_mode: ResourcesModeType = "disk",
+        cache: Optional[ExtractionCache] = None,
+        json_codec: Optional[str | JSONCodec] = None,
+        resource_store: Optional[ResourceStore] = None,
+        content_store: Optional[ContentAddressedStore] = None,
+        preflight: PreflightType = True,
+        max_file_size: Optional[int] = None,
+        client: Optional[DataInsightClient] = None,
+        async_client: Optional["AsyncDataInsightClient"] = None,
     ): ...
 
     def __init__(self, *args, **kwargs):
@@ -110,12 +168,37 @@ class PolarisAIDataInsightExtractor:
 
         Args:
             `file_path` (str, Path): Path to the file to process. Use instead of `file` and `filename`.
-            `file` (bytes): Bytes data of the file to process. Use instead of `file_path` and must be provided with `filename`.
+            `file` (bytes, BinaryIO, Iterable[bytes]): Data of the file to process: bytes (or a
+                memoryview or mmap, used without copying), an open binary file object or an iterator
+                of bytes chunks. File objects and iterators are streamed to the
+                API without being loaded in memory, and can be extracted only once.
+                Use instead of `file_path` and must be provided with `filename`.
             `filename` (str): Name of the file when using bytes data. Must be provided with `file`.
             `api_key` (str, optional): API authentication key. If not provided, the API key will be
                 retrieved from an environment variable. If no API key is found, a ValueError is raised.
             `resources_dir` (str, optional): Resource directory path. If the
                 directory does not exist, it will be created. Defaults to "app/".
+            `resources_mode` (str, optional): "disk" writes the images to `resources_dir`.
+                "memory" keeps them in the result archive and resolves `content.src` to
+                `ArchiveResource` objects, without any filesystem write. Defaults to "disk".
+            `cache` (ExtractionCache, optional): Cache of result archives keyed by the hash of
+                the file bytes. Re-submitting a byte-identical file does not call the API again.
+            `json_codec` (str, JSONCodec, optional): JSON backend decoding the results: "orjson",
+                "msgspec" or "json". Defaults to the fastest installed backend.
+            `resource_store` (ResourceStore, optional): Managed resources directory, used instead of
+                `resources_dir`. Release the images with `resource_store.release_result(dict_data)`.
+            `content_store` (ContentAddressedStore, optional): Store writing each distinct image once,
+                under its content hash.
+            `preflight` (bool, "strict", optional): Check the container header of the file before
+                uploading it, so that empty and password-protected files are rejected locally.
+                Truncated files and files whose content does not match their extension raise a
+                warning, or are rejected too in "strict" mode. Defaults to True.
+            `max_file_size` (int, optional): Maximum size of the file in bytes.
+            `client` (DataInsightClient, optional): Shared client used to call the API.
+                When provided, `api_key` and `resources_dir` are taken from the client
+                and its pooled connections are reused across extractors.
+            `async_client` (AsyncDataInsightClient, optional): Shared async client used by
+                `aextract()`. If not provided, `aextract()` opens a client for the call.
 
         Example:
             - Using a file path:
@@ -139,16 +222,35 @@ class PolarisAIDataInsightExtractor:
                 )
                 ```
         """
-        self._api_base_url = (
-            "https://datainsight-api.polarisoffice.com/api/v1/datainsight/doc-extract"
-        )
         self._supported_extensions = get_args(SupportedExtensionType)
         self.blob: Blob = None
+        self._client: Optional[DataInsightClient] = kwargs.get("client")
+        # Only a client created by the extractor is closed with it
+        self._owns_client = self._client is None
+        self.async_client: Optional["AsyncDataInsightClient"] = kwargs.get(
+            "async_client"
+        )
         self.resources_dir: StrPath = kwargs.get("resources_dir", "app/")
+        self.resources_mode: ResourcesModeType = kwargs.get("resources_mode", "disk")
+        self.resource_store: Optional[ResourceStore] = kwargs.get("resource_store")
+        self.content_store: Optional[ContentAddressedStore] = kwargs.get(
+            "content_store"
+        )
+        if self.resource_store is not None:
+            self.resources_dir = self.resource_store.resources_dir
         self.api_key: str = kwargs.get(
             "api_key", os.environ.get("POLARIS_AI_DATA_INSIGHT_API_KEY")
         )
 
+        # Use the settings of the shared client if provided
+        shared_client = self._client or self.async_client
+        if shared_client is not None:
+            self.resources_dir = shared_client.resources_dir
+            self.resources_mode = shared_client.resources_mode
+            self.resource_store = shared_client.resource_store
+            self.content_store = shared_client.content_store
+            self.api_key = shared_client.api_key
+
         # Check if the file_path is provided
         if "file_path" in kwargs:
             if "file" in kwargs or "filename" in kwargs:
@@ -175,17 +277,22 @@ class PolarisAIDataInsightExtractor:
             file = kwargs["file"]
             filename = kwargs["filename"]
 
-            if not isinstance(file, bytes):
-                raise ValueError("`file` must be a bytes object.")
-
             if not isinstance(filename, str):
                 raise ValueError("`filename` must be a string.")
 
-            self.blob = Blob.from_data(
-                data=file,
-                mime_type=determine_mime_type(filename),
-                metadata={"filename": filename},
-            )
+            if isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
+                self.blob = Blob.from_data(
+                    data=file,
+                    mime_type=determine_mime_type(filename),
+                    metadata={"filename": filename},
+                )
+            else:
+                # Binary file object or iterator of chunks, streamed on upload
+                self.blob = Blob.from_stream(
+                    stream=file,
+                    mime_type=determine_mime_type(filename),
+                    metadata={"filename": filename},
+                )
 
         else:
             raise ValueError("Either file_path or file/filename must be provided.")
@@ -197,10 +304,6 @@ class PolarisAIDataInsightExtractor:
                 f" Supported extensions are: {self._supported_extensions}"
             )
 
-        # create the directory if it does not exist
-        if not Path(self.resources_dir).exists():
-            Path(self.resources_dir).mkdir(parents=True, exist_ok=True)
-
         # Set the API key
         if not self.api_key:
             raise ValueError(
@@ -209,6 +312,65 @@ class PolarisAIDataInsightExtractor:
                 " or set the `POLARIS_AI_DATA_INSIGHT_API_KEY` environment variable."
             )
 
+        if self.resources_mode not in get_args(ResourcesModeType):
+            raise ValueError(
+                f"Invalid resources_mode: {self.resources_mode}."
+                f" Supported modes are: {get_args(ResourcesModeType)}"
+            )
+
+        # Settings of the dedicated client, opened on first use so that
+        # creating many extractors costs no connection setup
+        self._cache: Optional[ExtractionCache] = kwargs.get("cache")
+        self._json_codec: JSONCodec = get_json_codec(kwargs.get("json_codec"))
+        self._preflight: PreflightType = kwargs.get("preflight", True)
+        self._max_file_size: Optional[int] = kwargs.get("max_file_size")
+        if shared_client is not None:
+            self._cache = shared_client.cache
+            self._json_codec = shared_client.json_codec
+            self._preflight = shared_client.preflight
+            self._max_file_size = shared_client.max_file_size
+
+    @property
+    def client(self) -> DataInsightClient:
+        """
+        Client used to call the API: the shared client if provided, or a dedicated one.
+        """
+        if self._client is None:
+            self._client = DataInsightClient(
+                api_key=self.api_key,
+                resources_dir=self.resources_dir,
+                resources_mode=self.resources_mode,
+                cache=self._cache,
+                json_codec=self._json_codec,
+                resource_store=self.resource_store,
+                content_store=self.content_store,
+                preflight=self._preflight,
+                max_file_size=self._max_file_size,
+            )
+        return self._client
+
+    def __enter__(self) -> "PolarisAIDataInsightExtractor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the dedicated client and release its pooled connections.
+        A shared client is left open for its owner.
+        """
+        if self._owns_client and self._client is not None:
+            self._client.close()
+            self._client = None
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """
+        JSON backend decoding the results, without opening the client.
+        """
+        return self._json_codec
+
     @property
     def supported_extensions(self) -> list[str]:
         """
@@ -230,102 +392,78 @@ class PolarisAIDataInsightExtractor:
         return extension in self._supported_extensions
 
     def extract(self) -> Dict:
-        # Create a temporary directory for unzipping the response file
-        unzip_dir_path = create_temp_dir(self.resources_dir)
+        """
+        Extract the document data of the file.
 
-        # Get the input file path
-        response = self._get_response(self.blob)
+        Returns:
+            Dict: Extracted JSON data.
+        """
+        return self.client.extract(self.blob)
 
-        # Unzip the response and get the JSON data
-        json_data, images_path_map = self._unzip_response(response, unzip_dir_path)
+    def iter_pages(self) -> Iterator[Dict]:
+        """
+        Extract the document data of the file, one page at a time.
 
-        # Check if the "page", "elements" keys are present in the JSON data
-        self._validate_data_structure(json_data)
+        Yields:
+            Dict: Pages of the extracted JSON data, parsed incrementally when
+            the result is large.
+        """
+        return self.client.iter_pages(self.blob)
 
-        # Post-process the JSON data to replace image filenames with paths
-        self._postprocess_json(json_data, images_path_map)
+    def extract_tables(
+        self, backend: TableBackendType = "numpy", header: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Extract the tables and charts of the file as columns with inferred dtypes.
 
-        return json_data
+        The result is read one page at a time, and each table is converted in one
+        vectorized pass, without building Python objects per cell.
 
-    def _get_response(self, blob: Blob) -> requests.Response:
-        try:
-            # Prepare the request
-            filename = blob.metadata.get("filename")
-            files = {"file": (filename, blob.data, blob.mimetype)}
-            headers = {"x-po-di-apikey": self.api_key}
-
-            # Send the request
-            response = requests.post(self._api_base_url, headers=headers, files=files)
-            response.raise_for_status()
-            return response
-        except requests.HTTPError as e:
-            raise ValueError(f"HTTP error: {e.response.text}")
-        except requests.RequestException as e:
-            # Handle any request-related exceptions
-            raise ValueError(f"Failed to send request: {e}")
-        except Exception as e:
-            # Handle any other exceptions
-            raise ValueError(f"An error occurred: {e}")
-
-    def _unzip_response(
-        self, response: requests.Response, dir_path: str
-    ) -> Tuple[Dict, Dict]:
-        # Unzip the response
-        zip_content = response.content
-        json_data = {}
-
-        # Unzip the response
-        with zipfile.ZipFile(io.BytesIO(zip_content), "r") as zip_ref:
-            zip_ref.extractall(dir_path)
-
-            # Find .json file
-            json_files = list(Path(dir_path).rglob("*.json"))
-            if not json_files:
-                raise ValueError("No JSON file found in the response.")
-
-            # Find .png file and create a dictionary of image paths
-            image_path_list = list(Path(dir_path).rglob("*.png"))
-            images_path_map = {}
-            for image_path in image_path_list:
-                image_filename = Path(image_path).name
-                images_path_map[image_filename] = image_path.absolute()
-
-            # Read the JSON file
-            with open(json_files[0], "r", encoding="utf-8") as json_file:
-                data = json_file.read()
-
-            # Parse the JSON data
-            try:
-                json_data = json.loads(data)
-                return json_data, images_path_map
-            except json.JSONDecodeError as e:
-                # Handle JSON decode errors
-                raise ValueError(f"Failed to decode JSON response: {e}")
-
-    def _postprocess_json(self, json_data: Dict, images_path_map: Dict):
-        for doc_page in json_data["pages"]:
-            for doc_element in doc_page["elements"]:
-                if doc_element.get("type") != "text":
-                    self._replace_image_filenames_with_paths(
-                        doc_element, images_path_map
+        Args:
+            backend (str, optional): "numpy" for dicts of NumPy arrays, or "arrow"
+                for ``pyarrow.Table`` objects. Defaults to "numpy".
+            header (bool, optional): Use the first row of each table as column
+                names. Defaults to True.
+
+        Returns:
+            Dict[str, Any]: Columnar tables by resource id, e.g. "di.table.3" or
+            "di.chart.7", as in the LangChain loader.
+        """
+        tables = {}
+        for page in self.iter_pages():
+            for element in page["elements"]:
+                if element["type"] in ("table", "chart"):
+                    tables[f"di.{element['type']}.{element.get('id')}"] = to_columnar(
+                        element["content"], backend=backend, header=header
                     )
+        return tables
+
+    async def aextract(self) -> Dict:
+        """
+        Extract the document data of the file without blocking the event loop.
+
+        Returns:
+            Dict: Extracted JSON data.
+        """
+        if self.async_client is not None:
+            return await self.async_client.aextract(self.blob)
+
+        try:
+            from .datainsight_async_client import AsyncDataInsightClient
+        except ImportError:
+            from polaris_ai_datainsight.datainsight_async_client import (
+                AsyncDataInsightClient,
+            )
 
-    def _replace_image_filenames_with_paths(
-        self, doc_element: Dict, images_path_map: Dict
-    ):
-        # Convert image filename to image path
-        if "src" not in doc_element.get("content", {}):
-            return
-
-        image_filename = doc_element.get("content").get("src")  # image filename
-        image_path = images_path_map.get(image_filename)
-        if not image_path:
-            raise ValueError(f"Image path not found for {image_filename}")
-
-        doc_element["content"]["src"] = image_path
-
-    def _validate_data_structure(self, json_data):
-        if "pages" not in json_data:
-            raise ValueError("Invalid JSON data structure.")
-        if "elements" not in json_data["pages"][0]:
-            raise ValueError("Invalid JSON data structure.")
+        async with AsyncDataInsightClient(
+            api_key=self.api_key,
+            resources_dir=self.resources_dir,
+            resources_mode=self.resources_mode,
+            cache=self._cache,
+            json_codec=self._json_codec,
+            resource_store=self.resource_store,
+            content_store=self.content_store,
+            preflight=self._preflight,
+            max_file_size=self._max_file_size,
+        ) as async_client:
+            return await async_client.aextract(self.blob)
@@ -0,0 +1,138 @@
+"""PolarisAIDataInsight incremental ingestion manifest."""
+
+import os
+import tempfile
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+try:
+    from .datainsight_client import StrPath
+    from .utils.json_utils import JSONCodec, get_json_codec
+except ImportError:
+    from polaris_ai_datainsight.datainsight_client import StrPath
+    from polaris_ai_datainsight.utils.json_utils import JSONCodec, get_json_codec
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ManifestEntry:
+    """
+    State of a file when it was last extracted.
+
+    Attributes:
+        size (int): Size of the file in bytes.
+        mtime_ns (int): Modification time of the file in nanoseconds.
+        sha256 (str): SHA-256 hash of the file content.
+        result (str, optional): Key of the result archive in the extraction cache,
+            or None if the result was not cached.
+    """
+
+    size: int
+    mtime_ns: int
+    sha256: str
+    result: Optional[str] = None
+
+
+class IngestionManifest:
+    """
+    Persistent record of the files extracted by previous batches.
+
+    With a manifest, `extract_many` only uploads new and changed files: a file
+    whose size and modification time are unchanged is not even read, and a file
+    which was only touched is recognized by its content hash. Files recorded by
+    a previous run but absent from the current one are reported as deleted.
+
+    Use one manifest per corpus, since every recorded file which is not part of
+    a run is considered deleted. The manifest is written atomically by `save()`,
+    which `extract_many` calls when the batch ends.
+
+    Args:
+        `path` (str, Path): Path of the manifest file. Loaded if it exists.
+        `json_codec` (str, JSONCodec, optional): JSON backend reading and writing the
+            manifest. Defaults to the fastest installed backend.
+    """
+
+    def __init__(self, path: StrPath, json_codec: Optional[str | JSONCodec] = None):
+        self.path = Path(path)
+        self.json_codec: JSONCodec = get_json_codec(json_codec)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, ManifestEntry] = {}
+
+        try:
+            data = self.json_codec.loads(self.path.read_bytes())
+        except FileNotFoundError:
+            return
+        if data.get("version") != MANIFEST_VERSION:
+            raise ValueError(
+                f"Unsupported manifest version: {data.get('version')} in {self.path}"
+            )
+        self._entries = {
+            key: ManifestEntry(**entry) for key, entry in data["entries"].items()
+        }
+
+    @staticmethod
+    def key(file_path: StrPath) -> str:
+        """
+        Manifest key of a file: its absolute path.
+        """
+        return os.path.abspath(file_path)
+
+    def get(self, file_path: StrPath) -> Optional[ManifestEntry]:
+        """
+        Return the entry of a file, or None if it was never extracted.
+        """
+        with self._lock:
+            return self._entries.get(self.key(file_path))
+
+    def record(self, file_path: StrPath, entry: ManifestEntry) -> None:
+        """
+        Record the state of a file after it was extracted.
+        """
+        with self._lock:
+            self._entries[self.key(file_path)] = entry
+
+    def discard(self, file_path: StrPath) -> None:
+        """
+        Forget a file, so that it is extracted again by the next run.
+        """
+        with self._lock:
+            self._entries.pop(self.key(file_path), None)
+
+    def missing(self, seen: Iterable[str]) -> List[str]:
+        """
+        Return the recorded files which are not among the `seen` manifest keys.
+        """
+        seen = set(seen)
+        with self._lock:
+            return [key for key in self._entries if key not in seen]
+
+    def save(self) -> None:
+        """
+        Write the manifest file atomically.
+        """
+        with self._lock:
+            data = {
+                "version": MANIFEST_VERSION,
+                "entries": {key: asdict(entry) for key, entry in self._entries.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.json_codec.dumps(data))
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: StrPath) -> bool:
+        return self.get(file_path) is not None
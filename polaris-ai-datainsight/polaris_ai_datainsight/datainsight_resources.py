@@ -0,0 +1,448 @@
+"""PolarisAIDataInsight resource file storage."""
+
+import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path, PurePosixPath
+from typing import IO, Dict, Iterator, List, Literal, Optional, Tuple, get_args
+
+try:
+    from .utils.file_utils import dir_size
+except ImportError:
+    from polaris_ai_datainsight.utils.file_utils import dir_size
+
+try:
+    import fcntl
+except ImportError:
+    # No file locks on Windows: orphans are never swept
+    fcntl = None
+
+# Each store holds the lock file `di-<store id>.lock`, and names its
+# directories `di-<store id>-<random>`
+DIR_PREFIX = "di-"
+LOCK_SUFFIX = ".lock"
+_DIR_NAME_PATTERN = re.compile(rf"^{DIR_PREFIX}([a-z0-9_]+)-")
+
+ContentLinkModeType = Literal["hardlink", "path"]
+
+HASH_CHUNK_SIZE = 1024 * 1024
+# Stored files used more recently than this are never pruned, so that an
+# extraction in flight can still link to them
+DEFAULT_PRUNE_GRACE_PERIOD = 300.0
+
+# Directories created inside the innermost `ResourceStore.scope()` block
+_scope_dirs: ContextVar[Optional[List[Path]]] = ContextVar("_scope_dirs", default=None)
+
+
+class ResourceStore:
+    """
+    Managed `resources_dir`: tracks the directory created for each extraction and
+    deletes it when it is released, evicted or orphaned.
+
+    - Release: `release(path)`, `release_result(json_data)`, the `scope()`
+      context manager, or closing the store (`with ResourceStore(...) as store`).
+    - Quota: once `max_size` bytes or `max_entries` directories are exceeded,
+      the oldest directories are deleted first. The images of an evicted
+      extraction are no longer available. Directories still being written are
+      never evicted, and count towards `max_size` once `finish(path)` records
+      their size.
+    - Orphans: directories left by stores which no longer exist, e.g. of crashed
+      processes, are swept when the store is created. A store holds a lock file
+      (``fcntl.flock``) for as long as it exists, so the directories of live
+      stores in other processes, containers or hosts sharing `resources_dir` are
+      never swept. Other files in `resources_dir` are never touched. Orphans are
+      not swept on Windows.
+
+    Args:
+        `resources_dir` (str, Path): Root directory. Created if it does not exist.
+        `max_size` (int, optional): Maximum total size of the tracked directories in bytes.
+        `max_entries` (int, optional): Maximum number of tracked directories.
+        `sweep` (bool, optional): Sweep orphaned directories on creation. Defaults to True.
+
+    Example:
+        ```python
+        store = ResourceStore("path/to/resources", max_size=10 * 1024**3)
+        client = DataInsightClient(resource_store=store)
+
+        with store.scope():
+            dict_data = client.extract(blob)
+            ...  # The images are deleted at the end of the block
+        ```
+    """
+
+    def __init__(
+        self,
+        resources_dir: str | Path,
+        *,
+        max_size: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        sweep: bool = True,
+    ):
+        self.resources_dir = Path(resources_dir)
+        self.max_size = max_size
+        self.max_entries = max_entries
+        # Tracked directories, oldest first, with their size once finished
+        self._entries: OrderedDict[Path, Optional[int]] = OrderedDict()
+        self._total_size = 0
+        self._lock = threading.Lock()
+
+        self.resources_dir.mkdir(parents=True, exist_ok=True)
+        self._store_id, self._lock_file = _create_store_lock(self.resources_dir)
+        if sweep:
+            self.sweep()
+
+    def __enter__(self) -> "ResourceStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """
+        Total size of the finished directories in bytes, as recorded by `finish()`.
+        """
+        with self._lock:
+            return self._total_size
+
+    def create(self) -> Path:
+        """
+        Create and track a new extraction directory, evicting the oldest ones
+        beyond the quota.
+        """
+        path = Path(
+            tempfile.mkdtemp(
+                prefix=f"{DIR_PREFIX}{self._store_id}-", dir=self.resources_dir
+            )
+        ).absolute()
+        with self._lock:
+            self._entries[path] = None
+            evicted = self._select_evicted(keep=path)
+        for evicted_path in evicted:
+            shutil.rmtree(evicted_path, ignore_errors=True)
+
+        scope_dirs = _scope_dirs.get()
+        if scope_dirs is not None:
+            scope_dirs.append(path)
+        return path
+
+    def finish(self, path: str | Path) -> None:
+        """
+        Record the size of an extraction directory once its resources are
+        written, evicting the oldest directories beyond the quota.
+        Unknown and already finished paths are ignored.
+        """
+        path = Path(path).absolute()
+        # Measured once, outside the lock
+        size = dir_size(path)
+        with self._lock:
+            if path not in self._entries or self._entries[path] is not None:
+                return
+            self._entries[path] = size
+            self._total_size += size
+            evicted = self._select_evicted(keep=path)
+        for evicted_path in evicted:
+            shutil.rmtree(evicted_path, ignore_errors=True)
+
+    def release(self, path: str | Path) -> None:
+        """
+        Delete a tracked extraction directory. Unknown paths are ignored.
+        """
+        path = Path(path).absolute()
+        with self._lock:
+            if path not in self._entries:
+                return
+            self._total_size -= self._entries.pop(path) or 0
+        shutil.rmtree(path, ignore_errors=True)
+
+    def release_result(self, json_data: Dict) -> None:
+        """
+        Delete the extraction directory holding the images of `json_data`.
+        """
+        srcs = {
+            doc_element.get("content", {}).get("src")
+            for doc_page in json_data.get("pages", [])
+            for doc_element in doc_page.get("elements", [])
+        }
+        # Images may be nested in folders of the extraction directory
+        dir_paths = {self._tracked_parent(src) for src in srcs if isinstance(src, Path)}
+        for dir_path in dir_paths - {None}:
+            self.release(dir_path)
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """
+        Release the directories created inside the block (by this thread or task)
+        when it exits.
+        """
+        scope_dirs: List[Path] = []
+        token = _scope_dirs.set(scope_dirs)
+        try:
+            yield
+        finally:
+            _scope_dirs.reset(token)
+            for path in scope_dirs:
+                self.release(path)
+
+    def close(self) -> None:
+        """
+        Delete every tracked directory.
+        """
+        with self._lock:
+            paths = list(self._entries)
+            self._entries.clear()
+            self._total_size = 0
+        for path in paths:
+            shutil.rmtree(path, ignore_errors=True)
+
+    def sweep(self) -> int:
+        """
+        Delete the directories of the stores which no longer exist, whose lock
+        file is missing or not held.
+
+        Returns:
+            int: Number of deleted directories.
+        """
+        if fcntl is None:
+            return 0
+
+        swept = 0
+        # Whether each other store is dead, and the lock files of the dead ones,
+        # held until their directories are deleted
+        dead_stores: Dict[str, bool] = {}
+        lock_files: List[IO[bytes]] = []
+
+        def is_dead(store_id: str) -> bool:
+            if store_id not in dead_stores:
+                lock_path = self.resources_dir / f"{DIR_PREFIX}{store_id}{LOCK_SUFFIX}"
+                dead, lock_file = _lock_dead_store(lock_path)
+                dead_stores[store_id] = dead
+                if lock_file is not None:
+                    lock_files.append(lock_file)
+            return dead_stores[store_id]
+
+        try:
+            for path in self.resources_dir.iterdir():
+                match = _DIR_NAME_PATTERN.match(path.name)
+                if match is None or not path.is_dir():
+                    continue
+                store_id = match.group(1)
+                if store_id != self._store_id and is_dead(store_id):
+                    shutil.rmtree(path, ignore_errors=True)
+                    swept += 1
+
+            # Lock files of the dead stores which left no directory
+            for path in self.resources_dir.glob(f"{DIR_PREFIX}*{LOCK_SUFFIX}"):
+                store_id = path.name[len(DIR_PREFIX) : -len(LOCK_SUFFIX)]
+                if store_id != self._store_id:
+                    is_dead(store_id)
+        finally:
+            for lock_file in lock_files:
+                Path(lock_file.name).unlink(missing_ok=True)
+                lock_file.close()
+        return swept
+
+    def _tracked_parent(self, path: Path) -> Optional[Path]:
+        # Tracked directory holding `path`, at any depth
+        with self._lock:
+            for parent in path.absolute().parents:
+                if parent in self._entries:
+                    return parent
+        return None
+
+    def _select_evicted(self, keep: Path) -> List[Path]:
+        # Pop the oldest finished entries beyond the quota, except `keep`.
+        # Directories still being written are skipped: the quota may be
+        # exceeded until they are finished.
+        evicted = []
+        while self._over_quota():
+            path = self._pop_oldest(keep)
+            if path is None:
+                break
+            evicted.append(path)
+        return evicted
+
+    def _over_quota(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_size is not None and self._total_size > self.max_size
+
+    def _pop_oldest(self, keep: Path) -> Optional[Path]:
+        for path, size in self._entries.items():
+            if path != keep and size is not None:
+                del self._entries[path]
+                self._total_size -= size
+                return path
+        return None
+
+
+class ContentAddressedStore:
+    """
+    Deduplicating store of resource files (images) shared by all extractions.
+
+    Each distinct resource is written once, as `<hash[:2]>/<hash><suffix>` under
+    `store_dir`, where `hash` is the SHA-256 of its content. Logos, headers and
+    stamps repeated across documents then cost one file.
+
+    Args:
+        `store_dir` (str, Path): Store directory. Created if it does not exist.
+        `link_mode` (str, optional): How an extraction refers to a stored resource.
+            "hardlink" links it into the extraction directory, so the directory
+            stays self-contained and can be deleted as usual; falls back to "path"
+            where hardlinks are not supported. "path" refers to the stored file
+            directly, writing nothing in the extraction directory. Defaults to "hardlink".
+    """
+
+    def __init__(
+        self, store_dir: str | Path, *, link_mode: ContentLinkModeType = "hardlink"
+    ):
+        if link_mode not in get_args(ContentLinkModeType):
+            raise ValueError(
+                f"Invalid link_mode: {link_mode}."
+                f" Supported modes are: {get_args(ContentLinkModeType)}"
+            )
+        self.store_dir = Path(store_dir).absolute()
+        self.link_mode: ContentLinkModeType = link_mode
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+
+    def put(self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo) -> Path:
+        """
+        Store an archive entry, unless the same content is already stored.
+
+        Returns:
+            Path: Path of the stored file.
+        """
+        import hashlib
+
+        # Hashed while written to a temporary file, so the entry is decompressed
+        # once. The file is renamed, so readers never see partial files
+        digest = hashlib.sha256()
+        fd, temp_path = tempfile.mkstemp(dir=self.store_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as dst, zip_ref.open(info) as src:
+                while chunk := src.read(HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+                    dst.write(chunk)
+            key = digest.hexdigest()
+            path = (
+                self.store_dir / key[:2] / f"{key}{PurePosixPath(info.filename).suffix}"
+            )
+            try:
+                # Already stored: mark it as used, so that `prune()` keeps it
+                os.utime(path)
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(temp_path, path)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        return path
+
+    def link(
+        self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo, dir_path: Optional[Path]
+    ) -> Path:
+        """
+        Store an archive entry and refer to it from an extraction directory.
+
+        Returns:
+            Path: Path of the resource to put in the extracted data.
+        """
+        while True:
+            path = self.put(zip_ref, info)
+            if self.link_mode == "path" or dir_path is None:
+                return path
+
+            link_path = Path(dir_path).absolute() / PurePosixPath(info.filename).name
+            try:
+                os.link(path, link_path)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                if not link_path.parent.is_dir():
+                    raise
+                # Pruned since it was stored: store it again
+                continue
+            except OSError:
+                # No hardlinks across filesystems or on this filesystem
+                return path
+            return link_path
+
+    def prune(self, grace_period: float = DEFAULT_PRUNE_GRACE_PERIOD) -> int:
+        """
+        Delete the stored files no extraction directory links to any more.
+
+        Only meaningful with "hardlink" links: in "path" mode, extracted data
+        refers to the stored files directly, and nothing tells they are unused.
+
+        Args:
+            grace_period (float, optional): Files stored or reused in the last
+                `grace_period` seconds are kept, since an extraction in flight may
+                be about to link to them. Defaults to 300 seconds.
+
+        Returns:
+            int: Number of deleted files.
+        """
+        pruned = 0
+        min_mtime = time.time() - grace_period
+        for path in self.store_dir.glob("??/*"):
+            try:
+                stat = path.stat()
+                if (
+                    path.suffix == ".tmp"
+                    or stat.st_nlink > 1
+                    or stat.st_mtime > min_mtime
+                ):
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            pruned += 1
+        return pruned
+
+
+def _create_store_lock(resources_dir: Path) -> Tuple[str, Optional[IO[bytes]]]:
+    # Id of a new store, and its lock file, held until the store is garbage
+    # collected or its process exits
+    if fcntl is None:
+        return uuid.uuid4().hex[:8], None
+    while True:
+        fd, lock_path = tempfile.mkstemp(
+            prefix=DIR_PREFIX, suffix=LOCK_SUFFIX, dir=resources_dir
+        )
+        lock_file = os.fdopen(fd, "wb")
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # A sweep may have deleted the file before it was locked
+        try:
+            if os.stat(lock_path).st_ino == os.fstat(fd).st_ino:
+                store_id = Path(lock_path).name[len(DIR_PREFIX) : -len(LOCK_SUFFIX)]
+                return store_id, lock_file
+        except FileNotFoundError:
+            pass
+        lock_file.close()
+
+
+def _lock_dead_store(lock_path: Path) -> Tuple[bool, Optional[IO[bytes]]]:
+    # Whether the store of a lock file is dead, and its lock file, locked.
+    # A store is dead if its lock file is missing or not held.
+    try:
+        lock_file = open(lock_path, "rb")
+    except FileNotFoundError:
+        return True, None
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        lock_file.close()
+        return False, None
+    return True, lock_file
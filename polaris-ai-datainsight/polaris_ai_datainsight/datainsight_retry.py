@@ -0,0 +1,252 @@
+"""PolarisAIDataInsight retry policy and adaptive concurrency control."""
+
+import random
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, AsyncIterator, Iterator, Optional, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+# Statuses meaning the service asks clients to slow down
+THROTTLING_STATUSES = (429, 503)
+
+
+class RetryableError(ValueError):
+    """
+    Error of an API call that may succeed if retried (throttling, server errors,
+    connection failures).
+
+    Attributes:
+        retry_after (str, optional): `Retry-After` header of the response.
+        throttled (bool): True if the service asked to slow down (429 or 503).
+    """
+
+    def __init__(
+        self, message: str, retry_after: Optional[str] = None, throttled: bool = False
+    ):
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.throttled = throttled
+
+
+class RetryPolicy:
+    """
+    Retry policy of the API calls: exponential backoff with full jitter.
+
+    Args:
+        `max_retries` (int): Maximum number of retries after the first attempt. Defaults to 3.
+        `backoff_base` (float): Delay before the first retry, in seconds. Doubles at each retry.
+        `backoff_max` (float): Maximum delay between two attempts, in seconds.
+        `jitter` (bool): Draw each delay uniformly between 0 and the backoff,
+            so that throttled clients do not retry in lockstep.
+        `retry_statuses` (tuple): HTTP statuses that are retried.
+        `respect_retry_after` (bool): Wait at least the `Retry-After` delay of the response.
+        `max_retry_after` (float, optional): Give up instead of retrying when the
+            `Retry-After` delay exceeds this many seconds. Defaults to 300.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+        max_retry_after: Optional[float] = 300.0,
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.retry_statuses = retry_statuses
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries},"
+            f" backoff_base={self.backoff_base}, backoff_max={self.backoff_max},"
+            f" jitter={self.jitter}, retry_statuses={self.retry_statuses},"
+            f" respect_retry_after={self.respect_retry_after},"
+            f" max_retry_after={self.max_retry_after})"
+        )
+
+    def compute_delay(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Delay before retry number `attempt` (starting at 0), in seconds.
+
+        The `Retry-After` delay is honored even beyond `backoff_max`. Returns None,
+        meaning not to retry, if it exceeds `max_retry_after`.
+        """
+        backoff = min(self.backoff_max, self.backoff_base * (2**attempt))
+        delay = random.uniform(0, backoff) if self.jitter else backoff
+
+        if self.respect_retry_after and retry_after:
+            server_delay = parse_retry_after(retry_after)
+            if self.max_retry_after is not None and server_delay > self.max_retry_after:
+                return None
+            delay = max(delay, server_delay)
+        return delay
+
+
+def parse_retry_after(value: str) -> float:
+    """
+    Parse a `Retry-After` header (delay in seconds or HTTP date) into seconds.
+    """
+    from email.utils import parsedate_to_datetime
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class _Slot:
+    __slots__ = ("epoch", "throttled", "succeeded")
+
+    def __init__(self, epoch: int):
+        self.epoch = epoch
+        self.throttled = False
+        self.succeeded = False
+
+
+class _AIMDLimit:
+    # Additive increase / multiplicative decrease of the concurrency limit
+
+    def __init__(
+        self,
+        max_limit: int,
+        initial_limit: Optional[int],
+        min_limit: int,
+        increase: float,
+        decrease_factor: float,
+    ):
+        if not 1 <= min_limit <= max_limit:
+            raise ValueError("Limits must satisfy 1 <= `min_limit` <= `max_limit`.")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("`decrease_factor` must be between 0 and 1.")
+
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self._limit = float(min(max_limit, max(min_limit, initial_limit or max_limit)))
+        self._in_flight = 0
+        # Incremented at each decrease, so that the requests which were already
+        # in flight and get throttled too do not shrink the limit again
+        self._epoch = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _on_release(self, slot: _Slot) -> None:
+        self._in_flight -= 1
+        if slot.throttled:
+            if slot.epoch == self._epoch:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._epoch += 1
+        elif slot.succeeded:
+            # Other failures (client errors, network errors) leave the limit as is
+            self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+
+
+class AdaptiveConcurrencyLimiter(_AIMDLimit):
+    """
+    Thread-safe AIMD concurrency limiter.
+
+    Every request runs in a slot. A throttled request (429/503) multiplies the
+    limit by `decrease_factor`. A successful one (2xx), reported by setting
+    `succeeded` on its slot, raises it by `increase / limit`, so the limit grows
+    by about `increase` per round of requests. Other failures leave it unchanged.
+
+    Args:
+        `max_limit` (int): Maximum number of requests in flight.
+        `initial_limit` (int, optional): Starting limit. Defaults to `max_limit`.
+        `min_limit` (int): Minimum number of requests in flight. Defaults to 1.
+        `increase` (float): Additive increase per round of successful requests. Defaults to 1.
+        `decrease_factor` (float): Multiplicative decrease on throttling. Defaults to 0.5.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        super().__init__(max_limit, initial_limit, min_limit, increase, decrease_factor)
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[_Slot]:
+        """
+        Wait for a free slot. Set `throttled` or `succeeded` on the yielded slot
+        to report the outcome of the request.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            slot = _Slot(self._epoch)
+        try:
+            yield slot
+        finally:
+            with self._condition:
+                self._on_release(slot)
+                self._condition.notify_all()
+
+
+class AsyncAdaptiveConcurrencyLimiter(_AIMDLimit):
+    """
+    Asyncio AIMD concurrency limiter. See `AdaptiveConcurrencyLimiter`.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        *,
+        initial_limit: Optional[int] = None,
+        min_limit: int = 1,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        super().__init__(max_limit, initial_limit, min_limit, increase, decrease_factor)
+        self._condition: Optional["asyncio.Condition"] = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_Slot]:
+        """
+        Wait for a free slot. Set `throttled` or `succeeded` on the yielded slot
+        to report the outcome of the request.
+        """
+        import asyncio
+
+        # Created lazily to bind to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+            slot = _Slot(self._epoch)
+        try:
+            yield slot
+        finally:
+            async with self._condition:
+                self._on_release(slot)
+                self._condition.notify_all()
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import tempfile
 
@@ -5,3 +6,24 @@ import tempfile
 def create_temp_dir(dir_path: str) -> Path:
     temp_dir = Path(tempfile.mkdtemp(dir=dir_path))
     return temp_dir
+
+
+def dir_size(dir_path: str | Path) -> int:
+    """
+    Total size in bytes of the files under a directory, 0 if it does not exist.
+    """
+    size = 0
+    try:
+        entries = list(os.scandir(dir_path))
+    except FileNotFoundError:
+        return 0
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                size += dir_size(entry.path)
+            else:
+                size += entry.stat(follow_symlinks=False).st_size
+        except FileNotFoundError:
+            # Removed meanwhile
+            continue
+    return size
@@ -0,0 +1,363 @@
+import io
+import mmap
+import struct
+import warnings
+import zipfile
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, Optional, Tuple
+
+try:
+    from .http_utils import Blob
+except ImportError:
+    from polaris_ai_datainsight.utils.http_utils import Blob
+
+OLE2_SIGNATURE = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"
+ZIP_SIGNATURE = b"PK\x03\x04"
+# Bytes needed to tell the container formats apart
+SNIFF_SIZE = 512
+
+OLE2_EXTENSIONS = (".doc", ".ppt", ".xls", ".hwp")
+ZIP_EXTENSIONS = (".docx", ".pptx", ".xlsx", ".hwpx")
+
+# Top-level part directory of each OOXML document type
+OOXML_PART_DIRS = {".docx": "word/", ".pptx": "ppt/", ".xlsx": "xl/"}
+HWPX_MIMETYPE = b"application/hwp+zip"
+
+# OLE2 stream holding the main content of each legacy document type
+OLE2_MAIN_STREAMS = {
+    ".doc": ("WordDocument",),
+    ".ppt": ("PowerPoint Document",),
+    ".xls": ("Workbook", "Book"),
+    ".hwp": ("FileHeader",),
+}
+
+# Bound on the OLE2 directory walk, so that a corrupted file cannot loop
+_OLE2_MAX_DIRECTORY_SECTORS = 64
+_OLE2_END_OF_CHAIN = 0xFFFFFFFE
+
+
+class _FormatMismatchError(ValueError):
+    # Content which does not look like its extension. The API may still accept
+    # it (e.g. HWP 3.x documents are not OLE2 containers), so it is only
+    # rejected in strict mode
+    pass
+
+
+def check_document(
+    blob: Blob,
+    extension: str,
+    max_file_size: Optional[int] = None,
+    strict: bool = False,
+) -> None:
+    """
+    Check locally that a document can be extracted, before uploading it.
+
+    Only the container header is read, plus a few directory entries when the
+    content can be read at random (in-memory data, a file path or a seekable
+    stream). Nothing is consumed from a stream.
+
+    Args:
+        blob (Blob): Document to check.
+        extension (str): Lowercase extension of the document filename, e.g. ".docx".
+        max_file_size (int, optional): Maximum size of the document in bytes.
+        strict (bool, optional): Reject documents whose content does not match
+            their extension, or which look truncated. Otherwise they only raise
+            a warning. Defaults to False.
+
+    Raises:
+        ValueError: If the document is empty, too large or password-protected,
+            or in strict mode, if it is truncated or its content does not match
+            its extension.
+    """
+    try:
+        _check_document(blob, extension, max_file_size)
+    except _FormatMismatchError as e:
+        if strict:
+            raise
+        warnings.warn(str(e), stacklevel=2)
+
+
+def _check_document(
+    blob: Blob, extension: str, max_file_size: Optional[int] = None
+) -> None:
+    filename = blob.metadata.get("filename", "")
+
+    size = blob.size
+    if size == 0:
+        raise ValueError(f"File is empty: {filename}")
+    if max_file_size is not None and size is not None and size > max_file_size:
+        raise ValueError(
+            f"File is too large: {filename} ({size} bytes)."
+            f" The maximum size is {max_file_size} bytes."
+        )
+
+    head = blob.head(SNIFF_SIZE)
+    if not head:
+        # The stream cannot be read ahead of the upload
+        return
+    if head.startswith(OLE2_SIGNATURE):
+        _check_ole2(blob, extension, filename)
+    elif head.startswith(ZIP_SIGNATURE):
+        _check_zip(blob, head, extension, filename)
+    else:
+        _raise_mismatch(extension, filename)
+
+
+def _check_ole2(blob: Blob, extension: str, filename: str) -> None:
+    if extension not in OLE2_EXTENSIONS + ZIP_EXTENSIONS:
+        _raise_mismatch(extension, filename)
+
+    with _open_random_access(blob) as f:
+        if f is None:
+            # Password-protected OOXML documents are OLE2 containers, whose
+            # streams cannot be listed without random access
+            if extension in ZIP_EXTENSIONS:
+                _raise_protected(filename)
+            return
+        try:
+            ole2_file = _Ole2File(f)
+            # Password-protected OOXML documents are OLE2 containers
+            if extension in ZIP_EXTENSIONS:
+                if "EncryptedPackage" in ole2_file.streams:
+                    _raise_protected(filename)
+                _raise_mismatch(extension, filename)
+
+            names = [
+                name
+                for name in OLE2_MAIN_STREAMS[extension]
+                if name in ole2_file.streams
+            ]
+            if not names:
+                _raise_mismatch(extension, filename)
+            main_head = ole2_file.read_stream_head(names[0])
+            protected = _is_ole2_protected(extension, ole2_file.streams, main_head)
+        except (EOFError, struct.error):
+            raise _FormatMismatchError(f"File is truncated or corrupted: {filename}")
+        if protected:
+            _raise_protected(filename)
+
+
+def _check_zip(blob: Blob, head: bytes, extension: str, filename: str) -> None:
+    if extension not in ZIP_EXTENSIONS:
+        _raise_mismatch(extension, filename)
+
+    # General purpose flag of the first entry: bit 0 is set for encrypted entries
+    if len(head) >= 8 and struct.unpack_from("<H", head, 6)[0] & 0x1:
+        _raise_protected(filename)
+
+    with _open_random_access(blob) as f:
+        if f is None:
+            return
+        try:
+            with zipfile.ZipFile(f) as zip_ref:
+                infos = zip_ref.infolist()
+                if any(info.flag_bits & 0x1 for info in infos):
+                    _raise_protected(filename)
+                names = {info.filename for info in infos}
+                if extension == ".hwpx":
+                    _check_hwpx(zip_ref, names, filename)
+                elif "[Content_Types].xml" not in names or not any(
+                    name.startswith(OOXML_PART_DIRS[extension]) for name in names
+                ):
+                    _raise_mismatch(extension, filename)
+        except (zipfile.BadZipFile, EOFError):
+            raise _FormatMismatchError(f"File is truncated or corrupted: {filename}")
+
+
+def _check_hwpx(zip_ref: zipfile.ZipFile, names: set, filename: str) -> None:
+    if "mimetype" in names:
+        if zip_ref.read("mimetype").strip() != HWPX_MIMETYPE:
+            _raise_mismatch(".hwpx", filename)
+    elif not any(name.startswith("Contents/") for name in names):
+        _raise_mismatch(".hwpx", filename)
+
+    # Encrypted parts are declared in the manifest
+    if "META-INF/manifest.xml" in names and (
+        b"encryption-data" in zip_ref.read("META-INF/manifest.xml")
+    ):
+        _raise_protected(filename)
+
+
+def _is_ole2_protected(extension: str, streams: Dict, main_head: bytes) -> bool:
+    if extension == ".doc":
+        # FIB flags: `fEncrypted` is bit 8
+        return struct.unpack_from("<H", main_head, 0x0A)[0] & 0x0100 != 0
+    if extension == ".xls":
+        # A FILEPASS record (0x002F) follows the BOF record of encrypted workbooks
+        bof_size = struct.unpack_from("<H", main_head, 2)[0]
+        if len(main_head) < 6 + bof_size:
+            return False
+        return struct.unpack_from("<H", main_head, 4 + bof_size)[0] == 0x002F
+    if extension == ".ppt":
+        return "EncryptedSummary" in streams
+    if extension == ".hwp":
+        # FileHeader properties: bit 1 is set for password-protected documents
+        if not main_head.startswith(b"HWP Document File"):
+            return False
+        return struct.unpack_from("<I", main_head, 36)[0] & 0x2 != 0
+    return False
+
+
+class _Ole2File:
+    """
+    Minimal reader of an OLE2 (Compound File Binary) container: lists the
+    directory entries and reads the first sector of a stream, reading the
+    sector allocation table (FAT) one sector at a time.
+
+    Raises EOFError on truncated or corrupted containers.
+    """
+
+    def __init__(self, f: IO[bytes]):
+        self._f = f
+        f.seek(0)
+        header = f.read(512)
+        if len(header) < 512:
+            raise EOFError("Truncated OLE2 header")
+        sector_shift, mini_sector_shift = struct.unpack_from("<HH", header, 30)
+        num_fat_sectors, first_dir_sector = struct.unpack_from("<II", header, 44)
+        self.sector_size = 1 << sector_shift
+        self.mini_sector_size = 1 << mini_sector_shift
+        self.mini_stream_cutoff = struct.unpack_from("<I", header, 56)[0]
+        # The header lists the first 109 FAT sectors, the DIFAT sectors list
+        # the others. They are read only if a chain goes that far.
+        self._num_fat_sectors = num_fat_sectors
+        self._fat_sectors = list(
+            struct.unpack_from(f"<{min(num_fat_sectors, 109)}I", header, 76)
+        )
+        self._next_difat_sector = struct.unpack_from("<I", header, 68)[0]
+        self._fat_cache: Dict[int, Tuple[int, ...]] = {}
+
+        # Entry name -> (start sector, size)
+        self.streams: Dict[str, Tuple[int, int]] = {}
+        self._root_start = _OLE2_END_OF_CHAIN
+        self._read_directory(first_dir_sector)
+
+    def read_stream_head(self, name: str) -> bytes:
+        """
+        First sector (or mini sector) of a stream.
+        """
+        start, size = self.streams[name]
+        if size >= self.mini_stream_cutoff:
+            return self._read_sector(start)[:size]
+
+        # Small streams are stored in the mini stream, held by the root entry
+        offset = start * self.mini_sector_size
+        sector = self._root_start
+        for _ in range(offset // self.sector_size):
+            sector = self._next_sector(sector)
+        position = offset % self.sector_size
+        data = self._read_sector(sector)
+        return data[position : position + min(size, self.mini_sector_size)]
+
+    def _read_directory(self, sector: int) -> None:
+        for _ in range(_OLE2_MAX_DIRECTORY_SECTORS):
+            if sector == _OLE2_END_OF_CHAIN:
+                return
+            data = self._read_sector(sector)
+            for offset in range(0, self.sector_size, 128):
+                entry = data[offset : offset + 128]
+                name_size = struct.unpack_from("<H", entry, 64)[0]
+                entry_type = entry[66]
+                start, size = struct.unpack_from("<II", entry, 116)
+                if entry_type == 5:
+                    self._root_start = start
+                elif entry_type == 2 and 2 <= name_size <= 64:
+                    name = entry[: name_size - 2].decode("utf-16-le", errors="replace")
+                    self.streams[name] = (start, size)
+            sector = self._next_sector(sector)
+
+    def _read_sector(self, sector: int) -> bytes:
+        self._f.seek((sector + 1) * self.sector_size)
+        data = self._f.read(self.sector_size)
+        if len(data) < self.sector_size:
+            raise EOFError("Truncated OLE2 sector")
+        return data
+
+    def _next_sector(self, sector: int) -> int:
+        per_sector = self.sector_size // 4
+        index = sector // per_sector
+        while index >= len(self._fat_sectors):
+            if (
+                self._next_difat_sector == _OLE2_END_OF_CHAIN
+                or len(self._fat_sectors) >= self._num_fat_sectors
+            ):
+                raise EOFError("OLE2 sector out of the FAT range")
+            # Each DIFAT sector ends with the number of the next one
+            entries = struct.unpack(
+                f"<{per_sector}I", self._read_sector(self._next_difat_sector)
+            )
+            self._fat_sectors.extend(entries[:-1])
+            self._next_difat_sector = entries[-1]
+        if index not in self._fat_cache:
+            data = self._read_sector(self._fat_sectors[index])
+            self._fat_cache[index] = struct.unpack(f"<{per_sector}I", data)
+        return self._fat_cache[index][sector % per_sector]
+
+
+@contextmanager
+def _open_random_access(blob: Blob) -> Iterator[Optional[IO[bytes]]]:
+    # Seekable view of the blob content, or None if it can only be read once.
+    # The position of a seekable stream is restored afterwards.
+    if blob.path is not None:
+        with open(blob.path, "rb") as f:
+            yield f
+    elif blob.data is not None:
+        data = blob.data
+        if isinstance(data, mmap.mmap):
+            try:
+                yield data
+            finally:
+                data.seek(0)
+        else:
+            yield io.BytesIO(data)
+    elif hasattr(blob.stream, "seekable") and blob.stream.seekable():
+        position = blob.stream.tell()
+        try:
+            yield _OffsetFile(blob.stream, position)
+        finally:
+            blob.stream.seek(position)
+    else:
+        yield None
+
+
+class _OffsetFile(io.RawIOBase):
+    """
+    Read-only view of a seekable stream starting at `offset`.
+    """
+
+    def __init__(self, f: IO[bytes], offset: int):
+        self._f = f
+        self._offset = offset
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, position: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position += self._offset
+        return self._f.seek(position, whence) - self._offset
+
+    def tell(self) -> int:
+        return self._f.tell() - self._offset
+
+    def read(self, size: int = -1) -> bytes:
+        return self._f.read(size)
+
+    def readinto(self, buffer) -> int:
+        data = self._f.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+
+def _raise_protected(filename: str) -> None:
+    raise ValueError(f"File is password-protected: {filename}")
+
+
+def _raise_mismatch(extension: str, filename: str) -> None:
+    raise _FormatMismatchError(
+        f"File content does not match its extension: {filename}"
+        f" is not a valid {extension} document."
+    )
@@ -1,31 +1,256 @@
+import itertools
 import mimetypes
+import mmap
+import os
 from pathlib import Path
-from pydantic import BaseModel
-from typing import Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
-class Blob(BaseModel):
+BytesLike = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class Blob:
     """
     Blob class to represent a file with its metadata.
+
+    The content comes from exactly one source: in-memory `data` (bytes, a
+    `memoryview` or an `mmap`), a file `path`, or a `stream` (a binary file
+    object or an iterator of bytes chunks). Nothing is read or copied when the
+    blob is created: path and stream blobs are read chunk by chunk at upload
+    time, and `data` of a path blob maps the file in memory on first access.
+    A stream can be consumed only once.
     """
 
-    data: bytes
-    mimetype: str
-    metadata: Dict[str, str]
+    __slots__ = ("_data", "path", "stream", "mimetype", "metadata")
+
+    def __init__(
+        self,
+        *,
+        mimetype: str,
+        metadata: Optional[Dict[str, str]] = None,
+        data: Optional[BytesLike] = None,
+        path: Optional[str | Path] = None,
+        stream: Optional[Any] = None,
+    ):
+        if sum(source is not None for source in (data, path, stream)) > 1:
+            raise ValueError("Only one of `data`, `path` and `stream` can be provided.")
+        if data is not None and not isinstance(
+            data, (bytes, bytearray, memoryview, mmap.mmap)
+        ):
+            raise ValueError("`data` must be bytes, a memoryview or an mmap.")
+
+        self._data = data
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        self.stream = stream
+        self.mimetype = mimetype
+        self.metadata: Dict[str, str] = metadata if metadata is not None else {}
+
+    def __repr__(self) -> str:
+        if self.path is not None:
+            source = f"path={str(self.path)!r}"
+        elif self._data is not None:
+            source = f"data=<{len(self._data)} bytes>"
+        else:
+            source = f"stream={self.stream!r}"
+        return f"Blob({source}, mimetype={self.mimetype!r}, metadata={self.metadata!r})"
 
     @classmethod
     def from_path(
         cls, path: str | Path, mime_type: str, metadata: Optional[Dict[str, str]] = None
     ) -> "Blob":
-        with open(path, "rb") as f:
-            data = f.read()
-        return cls(data=data, mimetype=mime_type, metadata=metadata or {})
+        return cls(path=path, mimetype=mime_type, metadata=metadata)
 
     @classmethod
     def from_data(
-        cls, data: bytes, mime_type: str, metadata: Optional[Dict[str, str]] = None
+        cls, data: BytesLike, mime_type: str, metadata: Optional[Dict[str, str]] = None
     ) -> "Blob":
-        return cls(data=data, mimetype=mime_type, metadata=metadata or {})
+        return cls(data=data, mimetype=mime_type, metadata=metadata)
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: Any,
+        mime_type: str,
+        metadata: Optional[Dict[str, str]] = None,
+    ) -> "Blob":
+        if isinstance(stream, (bytes, str)) or not (
+            hasattr(stream, "read") or isinstance(stream, Iterable)
+        ):
+            raise ValueError(
+                "`stream` must be a binary file object or an iterator of bytes."
+            )
+        return cls(stream=stream, mimetype=mime_type, metadata=metadata)
+
+    @property
+    def data(self) -> Optional[BytesLike]:
+        """
+        In-memory content, or None for stream blobs.
+
+        The file of a path blob is mapped read-only in memory on first access,
+        without copying it.
+        """
+        if self._data is None and self.path is not None:
+            self._data = _map_file(self.path)
+        return self._data
+
+    @property
+    def replayable(self) -> bool:
+        """
+        True if the content can be read again, e.g. to retry an upload.
+        """
+        return (
+            self._data is not None
+            or self.path is not None
+            or (hasattr(self.stream, "seekable") and self.stream.seekable())
+        )
+
+    @property
+    def size(self) -> Optional[int]:
+        """
+        Size of the content in bytes, or None if it is unknown before reading.
+        """
+        if self._data is not None:
+            return memoryview(self._data).nbytes
+        if self.path is not None:
+            return os.stat(self.path).st_size
+        if hasattr(self.stream, "seekable") and self.stream.seekable():
+            position = self.stream.tell()
+            end = self.stream.seek(0, os.SEEK_END)
+            self.stream.seek(position)
+            return end - position
+        return None
+
+    def head(self, size: int) -> bytes:
+        """
+        Read up to `size` bytes from the start of the content, without consuming it.
+
+        The chunks read from an iterator stream are put back in front of it.
+        """
+        if self.path is not None:
+            with open(self.path, "rb") as f:
+                return f.read(size)
+        if self._data is not None:
+            return bytes(memoryview(self._data).cast("B")[:size])
+        if hasattr(self.stream, "read"):
+            if hasattr(self.stream, "seekable") and self.stream.seekable():
+                position = self.stream.tell()
+                data = self.stream.read(size)
+                self.stream.seek(position)
+                return data
+            if hasattr(self.stream, "peek"):
+                return self.stream.peek(size)[:size]
+            # Unbuffered and not seekable: nothing can be read back
+            return b""
+        if self.stream is None:
+            return b""
+
+        chunks = []
+        read = 0
+        iterator = iter(self.stream)
+        for chunk in iterator:
+            chunks.append(chunk)
+            read += len(chunk)
+            if read >= size:
+                break
+        self.stream = itertools.chain(chunks, iterator)
+        return b"".join(bytes(chunk) for chunk in chunks)[:size]
+
+    def iter_chunks(self, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Iterate over the content without loading it all in memory.
+        """
+        if isinstance(self._data, bytes):
+            yield self._data
+        elif self._data is not None:
+            # Copy a memoryview or mmap one chunk at a time
+            view = memoryview(self._data).cast("B")
+            for offset in range(0, view.nbytes, chunk_size):
+                yield bytes(view[offset : offset + chunk_size])
+        elif self.path is not None:
+            with open(self.path, "rb") as f:
+                yield from _iter_file(f, chunk_size)
+        elif hasattr(self.stream, "read"):
+            yield from _iter_file(self.stream, chunk_size)
+        elif self.stream is not None:
+            for chunk in self.stream:
+                yield bytes(chunk)
+
+    def read_bytes(self) -> bytes:
+        """
+        Read the whole content in memory.
+        """
+        if isinstance(self._data, bytes):
+            return self._data
+        if self._data is not None:
+            return bytes(self._data)
+        return b"".join(self.iter_chunks())
+
+    def close(self) -> None:
+        """
+        Release the memory map of a path blob, if `data` was accessed.
+        """
+        if self.path is not None and isinstance(self._data, mmap.mmap):
+            self._data.close()
+            self._data = None
+
+
+class MultipartBody:
+    """
+    Sized, iterable `multipart/form-data` body with a single file field.
+
+    `requests` sends it with a `Content-Length` header and reads it chunk by chunk.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], size: int):
+        self._chunks = chunks
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._chunks)
+
+
+def encode_multipart(
+    blob: Blob,
+    field_name: str = "file",
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> Tuple[Iterable[bytes], str]:
+    """
+    Build a streaming `multipart/form-data` body for a blob.
+
+    Args:
+        blob (Blob): File to upload. `blob.metadata["filename"]` is used as filename.
+        field_name (str): Name of the form field.
+        chunk_size (int): Size of the chunks read from path and file object blobs.
+
+    Returns:
+        Tuple[Iterable[bytes], str]: The body and its `Content-Type` header value.
+        The body is a `MultipartBody` if the blob size is known, and a plain
+        generator (sent with chunked transfer encoding) otherwise.
+    """
+    boundary = os.urandom(16).hex()
+    filename = _escape_header_param(blob.metadata.get("filename", ""))
+    preamble = (
+        f"--{boundary}\r\n"
+        f'Content-Disposition: form-data; name="{field_name}"; filename="{filename}"\r\n'
+        f"Content-Type: {blob.mimetype}\r\n"
+        "\r\n"
+    ).encode("utf-8")
+    epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+    def chunks() -> Iterator[bytes]:
+        yield preamble
+        yield from blob.iter_chunks(chunk_size)
+        yield epilogue
+
+    content_type = f"multipart/form-data; boundary={boundary}"
+    size = blob.size
+    if size is None:
+        return chunks(), content_type
+    return MultipartBody(chunks(), len(preamble) + size + len(epilogue)), content_type
 
 
 def determine_mime_type(filename: str) -> str:
@@ -33,3 +258,24 @@ def determine_mime_type(filename: str) -> str:
     if mime_type is None:
         mime_type = "application/octet-stream"
     return mime_type
+
+
+def _map_file(path: Path) -> BytesLike:
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # Empty files cannot be mapped
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _iter_file(f: Any, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def _escape_header_param(value: str) -> str:
+    # Same escaping as browsers (and urllib3) use for multipart filenames
+    return value.replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
@@ -0,0 +1,158 @@
+import json
+from typing import IO, Any, Callable, Dict, Iterator, Optional
+
+# Backends tried in this order when no codec is specified
+PREFERRED_JSON_CODECS = ("orjson", "msgspec", "json")
+
+
+class JSONCodec:
+    """
+    JSON decoder and encoder backend.
+
+    `loads` raises ValueError on invalid documents, whatever the backend.
+    `dumps` calls `default` on objects the backend cannot serialize (e.g. `Path`).
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return json.dumps(obj, ensure_ascii=False, default=default)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    JSON codec backed by ``orjson``.
+    """
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes | str) -> Any:
+        # `orjson.JSONDecodeError` is a ValueError
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return self._orjson.dumps(obj, default=default).decode("utf-8")
+
+
+class MsgspecCodec(JSONCodec):
+    """
+    JSON codec backed by ``msgspec``.
+    """
+
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._msgspec = msgspec
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._msgspec.json.decode(data)
+        except self._msgspec.DecodeError as e:
+            raise ValueError(str(e))
+
+    def dumps(self, obj: Any, *, default: Optional[Callable[[Any], Any]] = None) -> str:
+        return self._msgspec.json.encode(obj, enc_hook=default).decode("utf-8")
+
+
+JSON_CODECS: Dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JSONCodec,
+}
+
+
+def get_json_codec(codec: Optional[str | JSONCodec] = None) -> JSONCodec:
+    """
+    Resolve a JSON codec.
+
+    Args:
+        codec (str, JSONCodec, optional): A codec instance, or the name of a backend:
+            "orjson", "msgspec" or "json" (standard library). If not provided, the
+            fastest installed backend is used.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+
+    if codec is None:
+        for name in PREFERRED_JSON_CODECS:
+            try:
+                return JSON_CODECS[name]()
+            except ImportError:
+                continue
+
+    if codec not in JSON_CODECS:
+        raise ValueError(
+            f"Invalid json_codec: {codec}. Supported codecs are: {tuple(JSON_CODECS)}"
+        )
+    return JSON_CODECS[codec]()
+
+
+def iter_json_array(
+    f: IO[bytes],
+    key: str,
+    loads: Callable[[bytes], Any] = json.loads,
+    stream: bool = True,
+) -> Iterator[Any]:
+    """
+    Iterate over the items of the top-level array `key` of a JSON document.
+
+    With ``ijson`` installed and `stream` set, items are parsed incrementally
+    from the file, so only one item is held in memory at a time. Otherwise the
+    whole document is decoded first with `loads`, which is faster for documents
+    that fit in memory.
+
+    Raises:
+        ValueError: If the document is not valid JSON, or has no `key` array.
+    """
+    ijson = None
+    if stream:
+        try:
+            import ijson
+        except ImportError:
+            pass
+
+    if ijson is None:
+        try:
+            data = loads(f.read())
+        except ValueError as e:
+            raise ValueError(f"Failed to decode JSON response: {e}")
+        if not isinstance(data, dict) or not isinstance(data.get(key), list):
+            raise ValueError("Invalid JSON data structure.")
+        yield from data[key]
+        return
+
+    found = False
+    try:
+        # `use_float` decodes numbers as float/int like `json.loads`, not Decimal
+        for item in ijson.items(f, f"{key}.item", use_float=True):
+            found = True
+            yield item
+        # Nothing yielded: an empty array, or no array at all
+        found = found or _has_json_array(ijson, f, key)
+    except ijson.JSONError as e:
+        raise ValueError(f"Failed to decode JSON response: {e}")
+    if not found:
+        raise ValueError("Invalid JSON data structure.")
+
+
+def _has_json_array(ijson: Any, f: IO[bytes], key: str) -> bool:
+    # Read the document again to tell an empty `key` array from a missing one.
+    # Only needed when no item was found, so the value is cheap to build
+    if not (hasattr(f, "seekable") and f.seekable()):
+        return False
+    f.seek(0)
+    return any(isinstance(value, list) for value in ijson.items(f, key))
@@ -0,0 +1,251 @@
+import csv
+import io
+from typing import Any, Dict, List, Literal, Optional, Sequence
+
+TableBackendType = Literal["numpy", "arrow"]
+
+
+def table_rows(content: Any) -> List[List[str]]:
+    """
+    Cell texts of a table or chart, row by row.
+
+    Args:
+        content (Any): Content of a `table` or `chart` element (`{"json": [...]}`,
+            `{"csv": "..."}` or `{"src": ..., "csv": "..."}`), or the resource data
+            of the loaders: a list of JSON cells or a CSV string.
+
+    Returns:
+        List[List[str]]: Rows of the table. Merged cells hold their text in their
+        top-left position, and empty strings elsewhere.
+    """
+    content = _table_content(content)
+    if isinstance(content, str):
+        # The C parser reads the whole table in one pass
+        return list(csv.reader(io.StringIO(content)))
+    if isinstance(content, list):
+        return _cells_to_rows(content)
+    raise ValueError(f"Invalid table content: {type(content).__name__}")
+
+
+def _table_content(content: Any) -> Any:
+    # JSON cells or CSV string of an element content, or resource data as is
+    if isinstance(content, dict):
+        if "json" in content:
+            return content["json"]
+        if "csv" in content:
+            return content["csv"]
+        raise ValueError("Table content not found.")
+    return content
+
+
+def _cells_to_rows(cells: List[Dict]) -> List[List[str]]:
+    num_rows = num_columns = 0
+    for cell in cells:
+        metrics = cell["metrics"]
+        num_rows = max(num_rows, metrics["rowaddr"] + metrics.get("rowspan", 1))
+        num_columns = max(num_columns, metrics["coladdr"] + metrics.get("colspan", 1))
+
+    rows = [[""] * num_columns for _ in range(num_rows)]
+    for cell in cells:
+        metrics = cell["metrics"]
+        rows[metrics["rowaddr"]][metrics["coladdr"]] = "\n".join(
+            "".join(run.get("text", "") for run in para.get("content", []))
+            for para in cell.get("para", [])
+        )
+    return rows
+
+
+def to_columnar(
+    content: Any, backend: TableBackendType = "numpy", header: bool = True
+) -> Any:
+    """
+    Convert a table or chart to columns with inferred dtypes.
+
+    Each column is parsed in one vectorized pass: integers if every cell is an
+    integer, floats if every non-empty cell is a number (empty cells are NaN or
+    null), and strings otherwise. CSV content is parsed without building Python
+    rows, by the C readers of ``pyarrow.csv`` for Arrow and ``numpy.loadtxt``
+    for NumPy, unless the CSV has ragged rows (or blank lines, for NumPy).
+
+    Args:
+        content (Any): Content of a `table` or `chart` element, or resource data of
+            the loaders. See `table_rows()`.
+        backend (str, optional): "numpy" for a dict of NumPy arrays, or "arrow" for a
+            ``pyarrow.Table``. Defaults to "numpy".
+        header (bool, optional): Use the first row as column names. Otherwise the
+            columns are named "column_0", "column_1", etc. Defaults to True.
+
+    Returns:
+        Dict[str, numpy.ndarray] | pyarrow.Table: Columns of the table.
+
+    Raises:
+        ValueError: If the backend is unknown or the content is not a table.
+        ImportError: If ``numpy`` or ``pyarrow`` is not installed.
+    """
+    if backend not in ("numpy", "arrow"):
+        raise ValueError(
+            f"Invalid backend: {backend}. Supported backends are: ('numpy', 'arrow')"
+        )
+
+    content = _table_content(content)
+    if isinstance(content, str):
+        if backend == "arrow":
+            table = _read_csv_arrow(content, header)
+        else:
+            table = _read_csv_numpy(content, header)
+        if table is not None:
+            return table
+
+    rows = table_rows(content)
+    width = max((len(row) for row in rows), default=0)
+    if header and rows:
+        names = _column_names(rows[0], width)
+        rows = rows[1:]
+    else:
+        names = [f"column_{i}" for i in range(width)]
+    # Ragged CSV rows are padded with empty cells
+    rows = [
+        row if len(row) == width else row + [""] * (width - len(row)) for row in rows
+    ]
+    columns = list(zip(*rows)) if rows else [()] * width
+
+    if backend == "numpy":
+        return {name: _numpy_column(values) for name, values in zip(names, columns)}
+
+    pa = _import("pyarrow")
+    return pa.table(
+        {name: _arrow_column(values) for name, values in zip(names, columns)}
+    )
+
+
+def _read_csv_arrow(text: str, header: bool) -> Optional[Any]:
+    # Parse with the C reader of `pyarrow.csv`, or return None on ragged rows
+    pa = _import("pyarrow")
+    import pyarrow.csv as pa_csv
+
+    first_row = next(csv.reader(io.StringIO(text)), None)
+    if first_row is None:
+        return None
+    width = len(first_row)
+    if header:
+        names = _column_names(first_row, width)
+    else:
+        names = [f"column_{i}" for i in range(width)]
+
+    # Placeholder names, since pyarrow rejects missing and repeated ones
+    read_names = [f"column_{i}" for i in range(width)]
+    try:
+        table = pa_csv.read_csv(
+            io.BytesIO(text.encode("utf-8")),
+            read_options=pa_csv.ReadOptions(
+                column_names=read_names, skip_rows=1 if header else 0
+            ),
+            # Blank lines are rows of empty cells, as with the CSV reader
+            parse_options=pa_csv.ParseOptions(ignore_empty_lines=False),
+            # Read as strings: dtypes are inferred as with NumPy, not as pyarrow
+            # would (dates, booleans, "NA" as null)
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in read_names}
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+    return pa.table(
+        {
+            name: _arrow_column(column.combine_chunks())
+            for name, column in zip(names, table.columns)
+        }
+    )
+
+
+def _read_csv_numpy(text: str, header: bool) -> Optional[Dict[str, Any]]:
+    # Parse the whole CSV into a 2D array of cells with the C reader of
+    # `numpy.loadtxt`, or return None if it needs the CSV reader: blank lines
+    # (skipped by loadtxt), ragged rows or bare carriage returns
+    np = _import("numpy")
+
+    text = text.replace("\r\n", "\n")
+    if not text or "\r" in text or "\n\n" in text or text.startswith("\n"):
+        return None
+    try:
+        grid = np.loadtxt(
+            io.StringIO(text),
+            dtype=str,
+            delimiter=",",
+            comments=None,
+            quotechar='"',
+            ndmin=2,
+        )
+    except ValueError:
+        return None
+    width = grid.shape[1]
+
+    if header:
+        names = _column_names(grid[0].tolist(), width)
+        grid = grid[1:]
+    else:
+        names = [f"column_{i}" for i in range(width)]
+    return {name: _numpy_column(grid[:, i]) for i, name in enumerate(names)}
+
+
+def _column_names(row: Sequence[str], width: int) -> List[str]:
+    names = []
+    seen: Dict[str, int] = {}
+    for i in range(width):
+        name = row[i].strip() if i < len(row) else ""
+        name = name or f"column_{i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}_{seen[name]}"
+        seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _numpy_column(values: Sequence[str]) -> Any:
+    np = _import("numpy")
+    array = np.array(values, dtype=str)
+    stripped = np.char.strip(array)
+    missing = stripped == ""
+    if missing.all():
+        return array
+
+    if not missing.any():
+        try:
+            return stripped.astype(np.int64)
+        except (ValueError, OverflowError):
+            pass
+    try:
+        return np.where(missing, "nan", stripped).astype(np.float64)
+    except ValueError:
+        return array
+
+
+def _arrow_column(values: Sequence[str]) -> Any:
+    pa = _import("pyarrow")
+    import pyarrow.compute as pc
+
+    array = values if isinstance(values, pa.Array) else pa.array(values, pa.string())
+    stripped = pc.utf8_trim_whitespace(array)
+    nullable = pc.if_else(
+        pc.equal(stripped, ""), pa.scalar(None, type=pa.string()), stripped
+    )
+    if nullable.null_count == len(nullable):
+        return array
+
+    for data_type in (pa.int64(), pa.float64()):
+        try:
+            return pc.cast(nullable, data_type)
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            continue
+    return array
+
+
+def _import(name: str) -> Any:
+    try:
+        return __import__(name)
+    except ImportError:
+        raise ImportError(
+            f"`{name}` is required for columnar tables."
+            f" Please install it with `pip install {name}`."
+        )
@@ -0,0 +1,51 @@
+import zipfile
+from pathlib import PurePosixPath
+from typing import IO
+
+
+class ArchiveResource:
+    """
+    Resource file (e.g. an image) read lazily from a result archive.
+
+    Nothing is written to disk: the bytes are decompressed from the archive
+    each time the resource is read. The archive stays open as long as one of
+    its resources is referenced.
+    """
+
+    __slots__ = ("_zip_ref", "_info")
+
+    def __init__(self, zip_ref: zipfile.ZipFile, info: zipfile.ZipInfo):
+        self._zip_ref = zip_ref
+        self._info = info
+
+    @property
+    def name(self) -> str:
+        return PurePosixPath(self._info.filename).name
+
+    @property
+    def size(self) -> int:
+        return self._info.file_size
+
+    def open(self) -> IO[bytes]:
+        """
+        Open the resource as a binary file object.
+        """
+        return self._zip_ref.open(self._info)
+
+    def read(self) -> bytes:
+        """
+        Read the resource content.
+        """
+        return self._zip_ref.read(self._info)
+
+    def view(self) -> memoryview:
+        """
+        Read the resource content as a memoryview.
+        """
+        return memoryview(self.read())
+
+    def __bytes__(self) -> bytes:
+        return self.read()
+
+    def __repr__(self) -> str:
+        return f"ArchiveResource(name={self.name!r}, size={self.size})"
@@ -0,0 +1,85 @@
+"""
+Check the import time of a statement with `python -X importtime`.
+
+Fails if the statement loads one of the `--forbid` modules, or if its cumulative
+import time exceeds `--budget` milliseconds. The slowest imports are printed.
+
+    python scripts/check_import_time.py "import polaris_ai_datainsight" --budget 100
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_FORBIDDEN_MODULES = ["requests", "httpx", "pydantic", "langchain_core"]
+
+
+def measure_import_time(statement: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Run `statement` in a fresh interpreter.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Self and cumulative import time in
+        microseconds of each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def check_import_time(
+    statement: str, budget_ms: float, forbidden_modules: List[str], top: int = 10
+) -> List[str]:
+    timings = measure_import_time(statement)
+
+    # Only count the modules imported by the statement, not the interpreter startup
+    startup = measure_import_time("pass")
+    total_us = sum(
+        self_us for name, (self_us, _) in timings.items() if name not in startup
+    )
+
+    slowest = sorted(
+        (
+            (cumulative_us, name)
+            for name, (_, cumulative_us) in timings.items()
+            if name not in startup
+        ),
+        reverse=True,
+    )
+    print(f"{statement}: {total_us / 1000:.1f} ms")
+    for cumulative_us, name in slowest[:top]:
+        print(f"  {cumulative_us / 1000:8.1f} ms  {name}")
+
+    errors = []
+    if total_us / 1000 > budget_ms:
+        errors.append(f"Import time {total_us / 1000:.1f} ms exceeds {budget_ms} ms")
+    for module in forbidden_modules:
+        if module in timings and module not in startup:
+            errors.append(f"`{module}` is imported eagerly")
+    return errors
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("statement", nargs="+")
+    parser.add_argument("--budget", type=float, default=100.0)
+    parser.add_argument("--forbid", nargs="*", default=DEFAULT_FORBIDDEN_MODULES)
+    args = parser.parse_args()
+
+    errors = []
+    for statement in args.statement:
+        errors.extend(check_import_time(statement, args.budget, args.forbid))
+    for error in errors:
+        print(error, file=sys.stderr)
+    sys.exit(1 if errors else 0)
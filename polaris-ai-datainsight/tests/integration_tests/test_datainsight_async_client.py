@@ -0,0 +1,88 @@
+import asyncio
+import tempfile
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from polaris_ai_datainsight import AsyncDataInsightClient, PolarisAIDataInsightExtractor
+from polaris_ai_datainsight.utils.http_utils import Blob
+
+EXAMPLE_DOC_PATH: Path = Path(__file__).parent.parent / "examples" / "example.docx"
+MOCK_RESPONSE_ZIP_PATH: Path = Path(__file__).parent.parent / "examples" / "example.zip"
+
+
+@pytest.fixture
+def temp_resources_dir():
+    """Create a temporary directory."""
+    with tempfile.TemporaryDirectory(
+        prefix="example_", dir=Path(__file__).parent.parent / "examples"
+    ) as temp_resources_dir:
+        yield Path(temp_resources_dir)
+
+
+@pytest.fixture
+def mock_async_post():
+    # Make mock response for DataInsight API call, tracking requests in flight
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def aiter_bytes(chunk_size):
+        yield MOCK_RESPONSE_ZIP_PATH.read_bytes()
+
+    async def send(*args, **kwargs):
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        return MagicMock(
+            status_code=200,
+            is_error=False,
+            aiter_bytes=aiter_bytes,
+            aclose=AsyncMock(),
+        )
+
+    with patch("httpx.AsyncClient.send", side_effect=send):
+        yield state
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.asyncio
+async def test_aextract__bounded_concurrency(temp_resources_dir, mock_async_post):
+    blob = Blob.from_path(
+        EXAMPLE_DOC_PATH,
+        mime_type="application/octet-stream",
+        metadata={"filename": EXAMPLE_DOC_PATH.name},
+    )
+
+    async with AsyncDataInsightClient(
+        api_key="api_key", resources_dir=temp_resources_dir, max_concurrency=2
+    ) as client:
+        docs = await asyncio.gather(*(client.aextract(blob) for _ in range(6)))
+
+    assert len(docs) == 6
+    assert all("pages" in doc for doc in docs)
+    assert mock_async_post["max_in_flight"] == 2
+
+    # Every extraction should create its own resources directory
+    resources_dirs = [p for p in temp_resources_dir.iterdir() if p.is_dir()]
+    assert len(resources_dirs) == 6
+
+
+@pytest.mark.asyncio
+async def test_aextract__extractor(temp_resources_dir, mock_async_post):
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+    )
+
+    doc = await extractor.aextract()
+
+    for page in doc.get("pages"):
+        for element in page.get("elements"):
+            if element.get("type") != "text":
+                assert Path(element.get("content").get("src")).is_file()
@@ -0,0 +1,99 @@
+import tempfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polaris_ai_datainsight import ExtractionResult, extract_many
+
+EXAMPLE_DOC_PATH: Path = Path(__file__).parent.parent / "examples" / "example.docx"
+EXAMPLE_UNSUPPORTED_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.txt"
+EXAMPLE_NOT_EXIST_DOC_PATH = Path(__file__).parent.parent / "examples" / "no_file.docx"
+MOCK_RESPONSE_ZIP_PATH: Path = Path(__file__).parent.parent / "examples" / "example.zip"
+
+
+@pytest.fixture
+def temp_resources_dir():
+    """Create a temporary directory."""
+    with tempfile.TemporaryDirectory(
+        prefix="example_", dir=Path(__file__).parent.parent / "examples"
+    ) as temp_resources_dir:
+        yield Path(temp_resources_dir)
+
+
+@pytest.fixture
+def mock_response():
+    # Make mock response for DataInsight API call
+    patcher = patch("requests.Session.post")
+    mock_response = patcher.start()
+    mock_response.return_value = MagicMock(
+        status_code=200,
+        content=MOCK_RESPONSE_ZIP_PATH.read_bytes(),
+        iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+    )
+
+    yield mock_response
+
+    patcher.stop()
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.usefixtures("mock_response")
+@pytest.mark.parametrize("ordered", [True, False])
+def test_extract_many__capture_errors(temp_resources_dir, ordered):
+    sources = [
+        EXAMPLE_DOC_PATH,
+        EXAMPLE_NOT_EXIST_DOC_PATH,
+        EXAMPLE_DOC_PATH,
+        EXAMPLE_UNSUPPORTED_DOC_PATH,
+        EXAMPLE_DOC_PATH,
+    ]
+
+    results = list(
+        extract_many(
+            sources,
+            api_key="api_key",
+            resources_dir=temp_resources_dir,
+            max_workers=2,
+            ordered=ordered,
+        )
+    )
+
+    assert len(results) == len(sources)
+    assert all(isinstance(result, ExtractionResult) for result in results)
+    if ordered:
+        assert [result.index for result in results] == list(range(len(sources)))
+
+    results_by_index = {result.index: result for result in results}
+    for index in (0, 2, 4):
+        assert results_by_index[index].ok
+        assert "pages" in results_by_index[index].data
+    for index in (1, 3):
+        assert not results_by_index[index].ok
+        assert isinstance(results_by_index[index].error, ValueError)
+
+
+def test_extract_many__stream_lazy_input(temp_resources_dir, mock_response):
+    consumed = []
+
+    def sources():
+        for index in range(20):
+            consumed.append(index)
+            yield EXAMPLE_DOC_PATH
+
+    results = extract_many(
+        sources(),
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        max_workers=2,
+        ordered=True,
+    )
+
+    # The first result is available before the whole input is consumed
+    assert next(results).ok
+    assert len(consumed) < 20
+    results.close()
@@ -1,11 +1,19 @@
+import io
+import zipfile
 from pathlib import Path
 import tempfile
 from unittest.mock import MagicMock, patch
-from polaris_ai_datainsight import PolarisAIDataInsightExtractor
+from polaris_ai_datainsight import (
+    DiskExtractionCache,
+    MemoryExtractionCache,
+    PolarisAIDataInsightExtractor,
+)
+from polaris_ai_datainsight.utils.zip_utils import ArchiveResource
 import pytest
 
 EXAMPLE_DOC_PATH: Path = Path(__file__).parent.parent / "examples" / "example.docx"
 MOCK_RESPONSE_ZIP_PATH: Path = Path(__file__).parent.parent / "examples" / "example.zip"
+STREAM_JSON_MIN_SIZE = "polaris_ai_datainsight.datainsight_client.STREAM_JSON_MIN_SIZE"
 
 # -- For checking the test result -- #
 MOCK_RESPONSE_DATA_STRUCTURE = {
@@ -47,11 +55,12 @@ def mock_extractor(temp_resources_dir):
     )
 
     # Make mock response for DataInsight API call
-    patcher = patch("requests.post")
+    patcher = patch("requests.Session.post")
     mock_response = patcher.start()
     mock_response.return_value = MagicMock(
         status_code=200,
         content=MOCK_RESPONSE_ZIP_PATH.read_bytes(),
+        iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
     )
 
     # Return extrator instance
@@ -109,3 +118,245 @@ def test_extract__validate_resource_dir_and_files(
                 assert Path(image_path).exists()
                 assert Path(image_path).is_file()
                 assert Path(image_path).parent == resources_dir
+
+
+def test_extract__reuse_client_session(temp_resources_dir: Path, mock_extractor):
+    # Extract the same file several times through the same client
+    for _ in range(3):
+        mock_extractor.extract()
+
+    # Every extraction should create its own resources directory
+    resources_dirs = [p for p in temp_resources_dir.iterdir() if p.is_dir()]
+    assert len(resources_dirs) == 3
+
+    # All requests should go through the pooled session
+    assert mock_extractor.client.session.post.call_count == 3
+
+
+def test_extract__spool_response_to_disk(temp_resources_dir: Path, mock_extractor):
+    # Force the result archive to roll over to a temporary file
+    mock_extractor.client.spool_max_size = 1024
+
+    with patch(
+        "polaris_ai_datainsight.datainsight_client.SpooledTemporaryFile",
+        wraps=tempfile.SpooledTemporaryFile,
+    ) as spooled_file:
+        doc = mock_extractor.extract()
+
+    spooled_file.assert_called_once_with(max_size=1024)
+    assert len(doc.get("pages")) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+
+
+def test_extract__write_only_referenced_resources(
+    temp_resources_dir: Path, mock_extractor
+):
+    # Add an image that no element refers to
+    archive = io.BytesIO()
+    with (
+        zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as source,
+        zipfile.ZipFile(archive, "w") as target,
+    ):
+        for info in source.infolist():
+            target.writestr(info, source.read(info))
+        target.writestr("unused.png", b"unused")
+
+    mock_extractor.client.session.post.return_value = MagicMock(
+        status_code=200,
+        iter_content=lambda chunk_size: iter([archive.getvalue()]),
+    )
+    mock_extractor.extract()
+
+    resources_dir = next(p for p in temp_resources_dir.iterdir() if p.is_dir())
+    written_files = sorted(p.name for p in resources_dir.iterdir())
+    assert "unused.png" not in written_files
+    assert "example.json" not in written_files
+    assert len(written_files) == MOCK_RESPONSE_DATA_STRUCTURE["elements"]["image"]
+
+
+def test_extract__memory_resources_mode(temp_resources_dir: Path, mock_extractor):
+    resources_dir = temp_resources_dir / "memory"
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=resources_dir,
+        resources_mode="memory",
+    )
+
+    doc = extractor.extract()
+
+    # Nothing is written to the resources directory
+    assert not resources_dir.exists()
+
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as archive:
+        for page in doc.get("pages"):
+            for element in page.get("elements"):
+                if element.get("type") != "text":
+                    resource = element.get("content").get("src")
+                    assert isinstance(resource, ArchiveResource)
+                    assert resource.read() == archive.read(resource.name)
+                    assert bytes(resource.view()) == resource.read()
+
+
+@pytest.mark.parametrize("cache_type", ["memory", "disk"])
+def test_extract__reuse_cached_result(temp_resources_dir: Path, cache_type: str):
+    if cache_type == "memory":
+        cache = MemoryExtractionCache()
+    else:
+        cache = DiskExtractionCache(temp_resources_dir / "cache")
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+        )
+        docs = [
+            PolarisAIDataInsightExtractor(
+                file_path=EXAMPLE_DOC_PATH,
+                api_key="api_key",
+                resources_dir=temp_resources_dir / "resources",
+                cache=cache,
+            ).extract()
+            for _ in range(3)
+        ]
+
+    # Only the first extraction calls the API
+    assert mock_post.call_count == 1
+    for doc in docs:
+        assert len(doc.get("pages")) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+        for page in doc.get("pages"):
+            for element in page.get("elements"):
+                if element.get("type") != "text":
+                    assert Path(element.get("content").get("src")).is_file()
+
+
+@pytest.mark.parametrize("ijson_installed", [True, False])
+def test_iter_pages__match_extract(
+    temp_resources_dir: Path, mock_extractor, ijson_installed: bool
+):
+    doc = mock_extractor.extract()
+
+    # Stream even the small example result
+    with patch(STREAM_JSON_MIN_SIZE, 0):
+        if ijson_installed:
+            pages = list(mock_extractor.iter_pages())
+        else:
+            with patch.dict("sys.modules", {"ijson": None}):
+                pages = list(mock_extractor.iter_pages())
+
+    assert len(pages) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+    for page, doc_page in zip(pages, doc.get("pages")):
+        assert page.get("pageNum") == doc_page.get("pageNum")
+        assert len(page.get("elements")) == len(doc_page.get("elements"))
+        for element in page.get("elements"):
+            if element.get("type") != "text":
+                assert Path(element.get("content").get("src")).is_file()
+
+
+def test_iter_pages__resolve_resources_per_page(
+    temp_resources_dir: Path, mock_extractor
+):
+    pages = mock_extractor.iter_pages()
+
+    # Only the images of the first page are written before it is yielded
+    next(pages)
+    written_files = [p for p in temp_resources_dir.rglob("*") if p.is_file()]
+    assert len(written_files) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["1"]["image"]
+
+    pages.close()
+
+
+def test_iter_pages__decode_small_result_at_once(mock_extractor):
+    codec = mock_extractor.json_codec
+
+    with (
+        patch("ijson.items") as ijson_items,
+        patch.object(codec, "loads", wraps=codec.loads) as loads,
+    ):
+        pages = list(mock_extractor.iter_pages())
+
+    ijson_items.assert_not_called()
+    loads.assert_called_once()
+    assert len(pages) == MOCK_RESPONSE_DATA_STRUCTURE["pages"]["total"]
+
+
+def test_iter_pages__memory_resources_mode(temp_resources_dir: Path, mock_extractor):
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir / "memory",
+        resources_mode="memory",
+    )
+
+    # Stop after the first page: its resources stay readable
+    pages = extractor.iter_pages()
+    page = next(pages)
+    pages.close()
+
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as archive:
+        for element in page.get("elements"):
+            if element.get("type") != "text":
+                resource = element.get("content").get("src")
+                assert isinstance(resource, ArchiveResource)
+                assert resource.read() == archive.read(resource.name)
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+@pytest.mark.parametrize("ijson_installed", [True, False])
+def test_iter_pages__missing_pages(temp_resources_dir: Path, ijson_installed: bool):
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+    )
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_ref:
+        zip_ref.writestr("example.json", '{"docName": "example.docx"}')
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200, iter_content=lambda chunk_size: iter([archive.getvalue()])
+        )
+        with (
+            patch(STREAM_JSON_MIN_SIZE, 0),
+            patch.dict("sys.modules", {} if ijson_installed else {"ijson": None}),
+        ):
+            with pytest.raises(ValueError, match="Invalid JSON data structure"):
+                list(extractor.iter_pages())
+
+
+@pytest.mark.parametrize("method", ["extract", "iter_pages"])
+@pytest.mark.parametrize("cache_type", ["memory", "disk"])
+def test_extract__do_not_cache_invalid_result(
+    temp_resources_dir: Path, cache_type: str, method: str
+):
+    if cache_type == "memory":
+        cache = MemoryExtractionCache()
+    else:
+        cache = DiskExtractionCache(temp_resources_dir / "cache")
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zip_ref:
+        zip_ref.writestr("example.json", '{"docName": "example.docx"}')
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200, iter_content=lambda chunk_size: iter([archive.getvalue()])
+        )
+        for _ in range(2):
+            extractor = PolarisAIDataInsightExtractor(
+                file_path=EXAMPLE_DOC_PATH,
+                api_key="api_key",
+                resources_dir=temp_resources_dir / "resources",
+                cache=cache,
+            )
+            with pytest.raises(ValueError, match="Invalid JSON data structure"):
+                if method == "iter_pages":
+                    list(extractor.iter_pages())
+                else:
+                    extractor.extract()
+
+    # The broken result is not served from the cache
+    assert mock_post.call_count == 2
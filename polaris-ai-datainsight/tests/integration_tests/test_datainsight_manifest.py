@@ -0,0 +1,223 @@
+import os
+import shutil
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polaris_ai_datainsight import (
+    IngestionManifest,
+    MemoryExtractionCache,
+    extract_many,
+)
+
+EXAMPLE_DOC_PATH: Path = Path(__file__).parent.parent / "examples" / "example.docx"
+MOCK_RESPONSE_ZIP_PATH: Path = Path(__file__).parent.parent / "examples" / "example.zip"
+
+
+@pytest.fixture
+def mock_response():
+    # Make mock response for DataInsight API call
+    with patch("requests.Session.post") as mock_response:
+        mock_response.return_value = MagicMock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+        )
+        yield mock_response
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    corpus = tmp_path / "corpus"
+    corpus.mkdir()
+    for name in ["a.docx", "b.docx", "c.docx"]:
+        shutil.copy(EXAMPLE_DOC_PATH, corpus / name)
+    return corpus
+
+
+def run(corpus: Path, manifest: IngestionManifest, tmp_path: Path, **kwargs) -> dict:
+    results = extract_many(
+        sorted(corpus.glob("*.docx")),
+        api_key="api_key",
+        resources_dir=tmp_path / "resources",
+        max_workers=2,
+        manifest=manifest,
+        **kwargs,
+    )
+    return {Path(result.source).name: result for result in results}
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_manifest__skip_unchanged(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+
+    first = run(corpus, manifest, tmp_path)
+    assert {result.status for result in first.values()} == {"extracted"}
+    assert mock_response.call_count == 3
+    assert len(IngestionManifest(tmp_path / "manifest.json")) == 3
+
+    # Reloaded by the next nightly run
+    second = run(corpus, IngestionManifest(tmp_path / "manifest.json"), tmp_path)
+    assert {result.status for result in second.values()} == {"unchanged"}
+    assert all(result.ok and result.data is None for result in second.values())
+    assert mock_response.call_count == 3
+
+
+def test_manifest__serve_unchanged_from_cache(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    cache = MemoryExtractionCache()
+
+    first = run(corpus, manifest, tmp_path, cache=cache)
+    call_count = mock_response.call_count
+    second = run(corpus, manifest, tmp_path, cache=cache)
+
+    assert mock_response.call_count == call_count
+    assert {result.status for result in second.values()} == {"unchanged"}
+    assert len(second["a.docx"].data["pages"]) == len(first["a.docx"].data["pages"])
+    assert second["a.docx"].data["docName"] == first["a.docx"].data["docName"]
+
+
+def test_manifest__hash_files_once(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    cache = MemoryExtractionCache()
+    run(corpus, manifest, tmp_path, cache=cache)
+    with zipfile.ZipFile(corpus / "a.docx", "a") as zip_ref:
+        zip_ref.writestr("customXml/extra.xml", "<extra/>")
+    call_count = mock_response.call_count
+
+    # The hash computed for the manifest is reused by the cache lookup
+    with patch(
+        "polaris_ai_datainsight.datainsight_client.hash_blob"
+    ) as client_hash_blob:
+        results = run(corpus, manifest, tmp_path, cache=cache)
+
+    client_hash_blob.assert_not_called()
+    assert results["a.docx"].status == "extracted"
+    assert mock_response.call_count == call_count + 1
+
+
+def test_manifest__changed_touched_and_new_files(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    run(corpus, manifest, tmp_path)
+
+    with zipfile.ZipFile(corpus / "a.docx", "a") as zip_ref:
+        zip_ref.writestr("customXml/extra.xml", "<extra/>")
+    stat = (corpus / "b.docx").stat()
+    os.utime(corpus / "b.docx", ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    shutil.copy(EXAMPLE_DOC_PATH, corpus / "d.docx")
+    mock_response.reset_mock()
+
+    results = run(corpus, manifest, tmp_path)
+
+    assert {name: result.status for name, result in results.items()} == {
+        "a.docx": "extracted",
+        "b.docx": "unchanged",
+        "c.docx": "unchanged",
+        "d.docx": "extracted",
+    }
+    assert mock_response.call_count == 2
+    # The new modification time is recorded, so the file is not hashed again
+    assert manifest.get(corpus / "b.docx").mtime_ns == (
+        (corpus / "b.docx").stat().st_mtime_ns
+    )
+
+
+def test_manifest__report_deleted_files(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    run(corpus, manifest, tmp_path)
+
+    (corpus / "c.docx").unlink()
+    results = list(
+        extract_many(
+            sorted(corpus.glob("*.docx")),
+            api_key="api_key",
+            resources_dir=tmp_path / "resources",
+            manifest=manifest,
+            ordered=True,
+        )
+    )
+
+    statuses = [result.status for result in results]
+    assert statuses == ["unchanged", "unchanged", "deleted"]
+    assert results[-1].source == corpus / "c.docx"
+    assert results[-1].index == 2
+    assert corpus / "c.docx" not in IngestionManifest(tmp_path / "manifest.json")
+
+
+def test_manifest__keep_entries_on_early_stop(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    run(corpus, manifest, tmp_path)
+
+    results = extract_many(
+        [corpus / "a.docx"],
+        api_key="api_key",
+        resources_dir=tmp_path / "resources",
+        manifest=manifest,
+    )
+    next(results)
+    results.close()
+
+    # Files are only reported deleted by a complete run
+    assert len(IngestionManifest(tmp_path / "manifest.json")) == 3
+
+
+def test_manifest__record_delivered_results_only(tmp_path, corpus, mock_response):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+    results = extract_many(
+        sorted(corpus.glob("*.docx")),
+        api_key="api_key",
+        resources_dir=tmp_path / "resources",
+        max_workers=3,
+        manifest=manifest,
+        ordered=True,
+    )
+
+    # The workers extract ahead, but the caller stops while handling the
+    # second result
+    next(results)
+    next(results)
+    results.close()
+    call_count = mock_response.call_count
+
+    reloaded = IngestionManifest(tmp_path / "manifest.json")
+    assert corpus / "a.docx" in reloaded
+    assert corpus / "b.docx" not in reloaded
+    assert corpus / "c.docx" not in reloaded
+    statuses = run(corpus, reloaded, tmp_path)
+    assert {name: result.status for name, result in statuses.items()} == {
+        "a.docx": "unchanged",
+        "b.docx": "extracted",
+        "c.docx": "extracted",
+    }
+    assert mock_response.call_count == call_count + 2
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_manifest__retry_failed_files(tmp_path, corpus):
+    manifest = IngestionManifest(tmp_path / "manifest.json")
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200, iter_content=lambda chunk_size: iter([b"not a zip file"])
+        )
+        results = run(corpus, manifest, tmp_path)
+
+    assert not any(result.ok for result in results.values())
+    assert len(manifest) == 0
+
+
+def test_manifest__unsupported_version(tmp_path):
+    path = tmp_path / "manifest.json"
+    path.write_text('{"version": 99, "entries": {}}')
+
+    with pytest.raises(ValueError, match="Unsupported manifest version"):
+        IngestionManifest(path)
@@ -0,0 +1,108 @@
+import io
+import time
+from pathlib import Path
+
+import pytest
+
+from polaris_ai_datainsight import DiskExtractionCache, MemoryExtractionCache
+from polaris_ai_datainsight.datainsight_cache import ExtractionCache, hash_blob
+from polaris_ai_datainsight.utils.http_utils import Blob
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+
+
+@pytest.fixture(params=["memory", "disk"])
+def make_cache(request, tmp_path):
+    def make_cache(**kwargs):
+        if request.param == "memory":
+            return MemoryExtractionCache(**kwargs)
+        return DiskExtractionCache(tmp_path / "cache", **kwargs)
+
+    return make_cache
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_cache__get_and_set(make_cache):
+    cache = make_cache()
+
+    assert cache.get("key") is None
+    cache.set("key", io.BytesIO(b"archive"))
+
+    with cache.get("key") as zip_file:
+        assert zip_file.read() == b"archive"
+
+
+def test_cache__evict_least_recently_used(make_cache):
+    cache = make_cache(max_entries=2)
+
+    cache.set("a", io.BytesIO(b"a"))
+    time.sleep(0.01)
+    cache.set("b", io.BytesIO(b"b"))
+    time.sleep(0.01)
+
+    # "a" becomes the most recently used entry
+    cache.get("a").close()
+    time.sleep(0.01)
+    cache.set("c", io.BytesIO(b"c"))
+
+    assert cache.get("b") is None
+    cache.get("a").close()
+    cache.get("c").close()
+
+
+def test_cache__evict_over_max_size(make_cache):
+    cache = make_cache(max_size=10)
+
+    cache.set("a", io.BytesIO(b"x" * 6))
+    time.sleep(0.01)
+    cache.set("b", io.BytesIO(b"x" * 6))
+
+    assert cache.get("a") is None
+    cache.get("b").close()
+
+
+def test_cache__expire_after_max_age(make_cache):
+    cache = make_cache(max_age=0.05)
+
+    cache.set("key", io.BytesIO(b"archive"))
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+
+
+def test_hash_blob__same_content_same_key():
+    data = EXAMPLE_DOC_PATH.read_bytes()
+    mime_type = "application/octet-stream"
+
+    path_key = hash_blob(Blob.from_path(EXAMPLE_DOC_PATH, mime_type))
+    data_key = hash_blob(Blob.from_data(data, mime_type))
+    stream = io.BytesIO(data)
+    stream_key = hash_blob(Blob.from_stream(stream, mime_type))
+
+    assert path_key == data_key == stream_key
+    # The stream is rewound to be uploaded afterwards
+    assert stream.tell() == 0
+
+    # Chunk iterators can be read only once, so they are not cached
+    assert hash_blob(Blob.from_stream(iter([data]), mime_type)) is None
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_cache__incomplete_subclass():
+    class NoClearCache(ExtractionCache):
+        def get(self, key):
+            return None
+
+        def set(self, key, zip_file):
+            pass
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClearCache()
@@ -0,0 +1,64 @@
+import tempfile
+from pathlib import Path
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from polaris_ai_datainsight import DataInsightClient, PolarisAIDataInsightExtractor
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+
+
+@pytest.fixture
+def temp_resources_dir():
+    """Create a temporary directory."""
+    with tempfile.TemporaryDirectory(
+        prefix="example_", dir=Path(__file__).parent.parent / "examples"
+    ) as temp_resources_dir:
+        yield Path(temp_resources_dir)
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_init__pooled_session(temp_resources_dir):
+    client = DataInsightClient(
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+        pool_maxsize=32,
+        headers={"x-custom": "value"},
+    )
+
+    adapter = client.session.get_adapter("https://")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter._pool_maxsize == 32
+    assert client.session.headers["x-po-di-apikey"] == "api_key"
+    assert client.session.headers["x-custom"] == "value"
+    assert client.session.headers["Connection"] == "keep-alive"
+    client.close()
+
+
+def test_init__extractors_share_client(temp_resources_dir):
+    with DataInsightClient(
+        api_key="api_key", resources_dir=temp_resources_dir
+    ) as client:
+        extractors = [
+            PolarisAIDataInsightExtractor(file_path=EXAMPLE_DOC_PATH, client=client)
+            for _ in range(3)
+        ]
+
+    assert all(extractor.client is client for extractor in extractors)
+    assert all(extractor.api_key == "api_key" for extractor in extractors)
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_init__no_exist_api_key(temp_resources_dir, monkeypatch):
+    monkeypatch.delenv("POLARIS_AI_DATA_INSIGHT_API_KEY", raising=False)
+    with pytest.raises(ValueError):
+        DataInsightClient(api_key=None, resources_dir=temp_resources_dir)
@@ -1,7 +1,8 @@
 import mimetypes
 from pathlib import Path
 import tempfile
-from polaris_ai_datainsight import PolarisAIDataInsightExtractor
+from unittest.mock import patch
+from polaris_ai_datainsight import DataInsightClient, PolarisAIDataInsightExtractor
 import pytest
 
 # -- For Success Test -- #
@@ -38,7 +39,8 @@ def test_init__load_blob_from_file_path(temp_resources_dir, file_path):
 
     assert extractor.blob.mimetype == mimetypes.guess_type(file_path)[0]
     assert extractor.blob.metadata.get("filename") == file_path.name
-    assert extractor.blob.data == file_path.read_bytes()
+    assert extractor.blob.path == file_path
+    assert extractor.blob.read_bytes() == file_path.read_bytes()
 
 
 def test_init__load_blob_from_file_and_filename(temp_resources_dir):
@@ -58,6 +60,68 @@ def test_init__load_blob_from_file_and_filename(temp_resources_dir):
     assert extractor.blob.data == EXAMPLE_DOC_PATH.read_bytes()
 
 
+def test_init__load_blob_from_file_object(temp_resources_dir):
+    filename = EXAMPLE_DOC_PATH.name
+
+    with open(EXAMPLE_DOC_PATH, "rb") as file:
+        extractor = PolarisAIDataInsightExtractor(
+            file=file,
+            filename=filename,
+            api_key="api_key",
+            resources_dir=temp_resources_dir,
+        )
+
+        assert extractor.blob.data is None
+        assert extractor.blob.size == EXAMPLE_DOC_PATH.stat().st_size
+        assert extractor.blob.read_bytes() == EXAMPLE_DOC_PATH.read_bytes()
+
+
+def test_init__defer_client_creation(temp_resources_dir):
+    with patch(
+        "polaris_ai_datainsight.datainsight_extractor.DataInsightClient"
+    ) as client:
+        extractor = PolarisAIDataInsightExtractor(
+            file_path=EXAMPLE_DOC_PATH,
+            api_key="api_key",
+            resources_dir=temp_resources_dir,
+        )
+
+        # Neither the file nor a connection pool is touched before extraction
+        client.assert_not_called()
+        assert extractor.client is extractor.client
+        client.assert_called_once()
+
+
+def test_close__dedicated_client(temp_resources_dir):
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH,
+        api_key="api_key",
+        resources_dir=temp_resources_dir,
+    )
+    client = extractor.client
+
+    with patch.object(client, "close", wraps=client.close) as close:
+        with extractor:
+            pass
+
+    close.assert_called_once()
+    # A new client is opened if the extractor is used again
+    assert extractor.client is not client
+
+
+def test_close__keep_shared_client_open(temp_resources_dir):
+    with DataInsightClient(
+        api_key="api_key", resources_dir=temp_resources_dir
+    ) as client:
+        with patch.object(client, "close") as close:
+            with PolarisAIDataInsightExtractor(
+                file_path=EXAMPLE_DOC_PATH, client=client
+            ) as extractor:
+                assert extractor.client is client
+
+            close.assert_not_called()
+
+
 ######################
 # -- FAILURE TEST -- #
 ######################
@@ -0,0 +1,343 @@
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from polaris_ai_datainsight import (
+    ContentAddressedStore,
+    DataInsightClient,
+    ResourceStore,
+)
+from polaris_ai_datainsight.utils.http_utils import Blob
+
+MOCK_RESPONSE_ZIP_PATH = Path(__file__).parent.parent / "examples" / "example.zip"
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+
+
+def make_blob() -> Blob:
+    return Blob.from_data(
+        EXAMPLE_DOC_PATH.read_bytes(),
+        mime_type="application/octet-stream",
+        metadata={"filename": "a.docx"},
+    )
+
+
+def image_paths(doc) -> list:
+    return [
+        element["content"]["src"]
+        for page in doc["pages"]
+        for element in page["elements"]
+        if element["type"] != "text"
+    ]
+
+
+def write_file(dir_path: Path, size: int) -> None:
+    (dir_path / "image.png").write_bytes(b"\0" * size)
+
+
+@pytest.fixture
+def mock_post():
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+        )
+        yield mock_post
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_store__create_and_release(tmp_path):
+    store = ResourceStore(tmp_path)
+
+    path = store.create()
+    assert path.is_dir()
+    assert path.parent == tmp_path.absolute()
+    assert len(store) == 1
+
+    store.release(path)
+    assert not path.exists()
+    assert len(store) == 0
+
+
+def test_store__scope(tmp_path):
+    store = ResourceStore(tmp_path)
+
+    with store.scope():
+        inner = store.create()
+    outer = store.create()
+
+    assert not inner.exists()
+    assert outer.exists()
+
+
+def test_store__close(tmp_path):
+    with ResourceStore(tmp_path) as store:
+        paths = [store.create() for _ in range(3)]
+
+    assert not any(path.exists() for path in paths)
+
+
+def test_store__evict_oldest_beyond_max_entries(tmp_path):
+    store = ResourceStore(tmp_path, max_entries=2)
+
+    paths = []
+    for _ in range(3):
+        paths.append(store.create())
+        store.finish(paths[-1])
+
+    assert [path.exists() for path in paths] == [False, True, True]
+    assert len(store) == 2
+
+
+def test_store__evict_oldest_beyond_max_size(tmp_path):
+    store = ResourceStore(tmp_path, max_size=150)
+
+    first = store.create()
+    write_file(first, 100)
+    store.finish(first)
+    second = store.create()
+    write_file(second, 100)
+    store.finish(second)
+
+    assert not first.exists()
+    assert second.exists()
+    assert store.size == 100
+
+    store.release(second)
+    assert store.size == 0
+
+
+def test_store__keep_directories_in_flight(tmp_path):
+    store = ResourceStore(tmp_path, max_entries=1, max_size=50)
+
+    # Still being written: neither evicted nor counted
+    first = store.create()
+    write_file(first, 100)
+    second = store.create()
+    assert first.exists() and second.exists()
+    assert store.size == 0
+
+    # Evicted once finished and older than another finished directory
+    store.finish(first)
+    write_file(second, 10)
+    store.finish(second)
+    assert not first.exists()
+    assert second.exists()
+    assert store.size == 10
+
+
+def test_store__sweep_orphaned_directories(tmp_path):
+    # Directory of a live store, whatever process or host it runs in
+    alive_store = ResourceStore(tmp_path)
+    alive = alive_store.create()
+    # Directory of a store whose process has exited
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; from polaris_ai_datainsight import ResourceStore;"
+            " ResourceStore(sys.argv[1]).create()",
+            str(tmp_path),
+        ],
+        check=True,
+    )
+    orphans = [path for path in tmp_path.iterdir() if path.is_dir() and path != alive]
+    # Directory without a lock file, e.g. left by PID 1 of another container
+    orphans.append(tmp_path / "di-1-abc")
+    orphans[-1].mkdir()
+    # Unrelated files
+    (tmp_path / "user-data").mkdir()
+
+    store = ResourceStore(tmp_path)
+
+    assert len(orphans) == 2
+    assert not any(orphan.exists() for orphan in orphans)
+    assert alive.exists()
+    assert (tmp_path / "user-data").exists()
+    # Only the lock files of the live stores are left
+    assert len(list(tmp_path.glob("di-*.lock"))) == 2
+    assert len(alive_store) == len(store) + 1
+
+
+def test_client__release_result(tmp_path, mock_post):
+    store = ResourceStore(tmp_path)
+    client = DataInsightClient(api_key="api_key", resource_store=store)
+    blob = Blob.from_data(
+        EXAMPLE_DOC_PATH.read_bytes(),
+        mime_type="application/octet-stream",
+        metadata={"filename": "a.docx"},
+    )
+
+    doc = client.extract(blob)
+    images = [
+        element["content"]["src"]
+        for page in doc["pages"]
+        for element in page["elements"]
+        if element["type"] != "text"
+    ]
+    assert all(image.is_file() for image in images)
+    assert len(store) == 1
+
+    store.release_result(doc)
+    assert not any(image.exists() for image in images)
+    assert len(store) == 0
+
+
+def test_client__release_result_with_nested_entries(tmp_path):
+    # Resources stored under a folder of the archive
+    archive = tmp_path / "nested.zip"
+    with (
+        zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as source,
+        zipfile.ZipFile(archive, "w") as target,
+    ):
+        for info in source.infolist():
+            name = info.filename
+            if not name.endswith(".json"):
+                name = f"images/{name}"
+            target.writestr(name, source.read(info))
+
+    store = ResourceStore(tmp_path / "resources")
+    client = DataInsightClient(api_key="api_key", resource_store=store)
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200,
+            iter_content=lambda chunk_size: iter([archive.read_bytes()]),
+        )
+        doc = client.extract(make_blob())
+    images = image_paths(doc)
+    assert all(image.parent.name == "images" for image in images)
+
+    store.release_result(doc)
+    assert not any(image.exists() for image in images)
+    assert len(store) == 0
+    assert [path for path in store.resources_dir.iterdir() if path.is_dir()] == []
+
+
+def test_content_store__put_once(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as zip_ref:
+        info = zip_ref.getinfo("image9.png")
+        first = store.put(zip_ref, info)
+        second = store.put(zip_ref, info)
+        assert first.read_bytes() == zip_ref.read(info)
+
+    assert first == second
+    assert first.suffix == ".png"
+    assert len(list(tmp_path.glob("??/*"))) == 1
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_content_store__decompress_once(tmp_path):
+    store = ContentAddressedStore(tmp_path)
+
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as zip_ref:
+        with patch.object(zip_ref, "open", wraps=zip_ref.open) as open_entry:
+            path = store.put(zip_ref, zip_ref.getinfo("image9.png"))
+        assert path.read_bytes() == zip_ref.read("image9.png")
+
+    open_entry.assert_called_once()
+
+
+def test_content_store__link_pruned_file(tmp_path):
+    store = ContentAddressedStore(tmp_path / "objects")
+    dir_path = tmp_path / "extraction"
+    dir_path.mkdir()
+    put = store.put
+    pruned = []
+
+    def put_then_prune(zip_ref, info):
+        # The stored file is pruned before it is linked, the first time
+        path = put(zip_ref, info)
+        if not pruned:
+            path.unlink()
+            pruned.append(path)
+        return path
+
+    with zipfile.ZipFile(MOCK_RESPONSE_ZIP_PATH) as zip_ref:
+        info = zip_ref.getinfo("image9.png")
+        with patch.object(store, "put", side_effect=put_then_prune):
+            link_path = store.link(zip_ref, info, dir_path)
+
+        assert link_path.parent == dir_path.absolute()
+        assert link_path.read_bytes() == zip_ref.read(info)
+    assert pruned[0].is_file()
+
+
+def test_content_store__hardlink_and_prune(tmp_path, mock_post):
+    resource_store = ResourceStore(tmp_path / "extractions")
+    content_store = ContentAddressedStore(tmp_path / "objects")
+    client = DataInsightClient(
+        api_key="api_key", resource_store=resource_store, content_store=content_store
+    )
+
+    first = client.extract(make_blob())
+    second = client.extract(make_blob())
+    images = image_paths(first)
+
+    # Each image is stored once and linked into both extraction directories
+    stored = list((tmp_path / "objects").glob("??/*"))
+    assert len(stored) == len(images)
+    assert all(image.parent != content_store.store_dir for image in images)
+    assert all(path.stat().st_nlink == 3 for path in stored)
+
+    resource_store.release_result(first)
+    assert content_store.prune(grace_period=0) == 0
+    assert all(image.is_file() for image in image_paths(second))
+
+    resource_store.release_result(second)
+    # Recently used files are kept for extractions in flight
+    assert content_store.prune() == 0
+    assert content_store.prune(grace_period=0) == len(stored)
+    assert list((tmp_path / "objects").glob("??/*")) == []
+
+
+def test_content_store__path_mode(tmp_path, mock_post):
+    resource_store = ResourceStore(tmp_path / "extractions")
+    content_store = ContentAddressedStore(tmp_path / "objects", link_mode="path")
+    client = DataInsightClient(
+        api_key="api_key", resource_store=resource_store, content_store=content_store
+    )
+
+    images = image_paths(client.extract(make_blob()))
+
+    assert all(image.parent.parent == content_store.store_dir for image in images)
+    # No extraction directory is needed
+    assert len(resource_store) == 0
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_client__release_directory_on_failure(tmp_path):
+    store = ResourceStore(tmp_path)
+    client = DataInsightClient(api_key="api_key", resource_store=store)
+    blob = Blob.from_data(
+        EXAMPLE_DOC_PATH.read_bytes(),
+        mime_type="application/octet-stream",
+        metadata={"filename": "a.docx"},
+    )
+
+    with patch("requests.Session.post") as mock_post:
+        mock_post.return_value = MagicMock(
+            status_code=200, iter_content=lambda chunk_size: iter([b"not a zip file"])
+        )
+        with pytest.raises(zipfile.BadZipFile):
+            client.extract(blob)
+
+    assert len(store) == 0
+    assert [path for path in tmp_path.iterdir() if path.is_dir()] == []
+
+
+def test_content_store__invalid_link_mode(tmp_path):
+    with pytest.raises(ValueError, match="Invalid link_mode"):
+        ContentAddressedStore(tmp_path, link_mode="symlink")
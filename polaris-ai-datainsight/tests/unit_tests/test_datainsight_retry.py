@@ -0,0 +1,239 @@
+import asyncio
+import io
+import time
+from email.utils import formatdate
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from polaris_ai_datainsight import (
+    AdaptiveConcurrencyLimiter,
+    AsyncAdaptiveConcurrencyLimiter,
+    DataInsightClient,
+    RetryableError,
+    RetryPolicy,
+)
+from polaris_ai_datainsight.datainsight_retry import parse_retry_after
+from polaris_ai_datainsight.utils.http_utils import Blob
+
+MOCK_RESPONSE_ZIP_PATH = Path(__file__).parent.parent / "examples" / "example.zip"
+DOCUMENT = (Path(__file__).parent.parent / "examples" / "example.docx").read_bytes()
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock(
+        status_code=status_code,
+        text=f"status {status_code}",
+        headers=headers or {},
+        iter_content=lambda chunk_size: iter([MOCK_RESPONSE_ZIP_PATH.read_bytes()]),
+    )
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+def make_blob(**kwargs):
+    return Blob(
+        mimetype="application/octet-stream", metadata={"filename": "a.docx"}, **kwargs
+    )
+
+
+@pytest.fixture
+def client(tmp_path):
+    with DataInsightClient(
+        api_key="api_key",
+        resources_dir=tmp_path,
+        retry=RetryPolicy(max_retries=2, jitter=False),
+    ) as client:
+        yield client
+
+
+@pytest.fixture
+def mock_sleep():
+    with patch("polaris_ai_datainsight.datainsight_client.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_retry_policy__exponential_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+
+    assert [policy.compute_delay(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+
+def test_retry_policy__jitter_within_backoff():
+    policy = RetryPolicy(backoff_base=1)
+
+    assert all(0 <= policy.compute_delay(2) <= 4 for _ in range(100))
+
+
+def test_retry_policy__respect_retry_after():
+    policy = RetryPolicy(backoff_base=1, backoff_max=10, jitter=False)
+
+    assert policy.compute_delay(0, "7") == 7
+    # Honored beyond `backoff_max`
+    assert policy.compute_delay(0, "60") == 60
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after("invalid") == 0
+
+
+def test_limiter__multiplicative_decrease_once_per_round():
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    with limiter.slot() as first, limiter.slot() as second:
+        first.throttled = True
+        second.throttled = True
+
+    # Requests in flight during the first decrease do not shrink the limit again
+    assert limiter.limit == 4
+
+    with limiter.slot() as slot:
+        slot.throttled = True
+    assert limiter.limit == 2
+
+
+def test_limiter__additive_increase():
+    limiter = AdaptiveConcurrencyLimiter(8, initial_limit=2)
+
+    # About one step per round of `limit` successful requests
+    for _ in range(6):
+        with limiter.slot() as slot:
+            slot.succeeded = True
+
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter__bounded_concurrency():
+    limiter = AsyncAdaptiveConcurrencyLimiter(2)
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def task():
+        async with limiter.slot():
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+
+    await asyncio.gather(*(task() for _ in range(6)))
+
+    assert state["max_in_flight"] == 2
+
+
+def test_extract__retry_throttled_request(client, mock_sleep):
+    with patch(
+        "requests.Session.post",
+        side_effect=[make_response(429, {"Retry-After": "2"}), make_response(200)],
+    ) as mock_post:
+        doc = client.extract(make_blob(data=DOCUMENT))
+
+    assert "pages" in doc
+    assert mock_post.call_count == 2
+    mock_sleep.assert_called_once_with(2)
+
+
+def test_extract__rewind_seekable_stream(client, mock_sleep):
+    uploads = []
+
+    def post(url, data, **kwargs):
+        uploads.append(b"".join(data))
+        return make_response(503 if len(uploads) == 1 else 200)
+
+    with patch("requests.Session.post", side_effect=post):
+        client.extract(make_blob(stream=io.BytesIO(DOCUMENT)))
+
+    assert len(uploads) == 2
+    assert all(b"\r\n\r\n" + DOCUMENT + b"\r\n" in upload for upload in uploads)
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_extract__retries_exhausted(client, mock_sleep):
+    with patch(
+        "requests.Session.post", side_effect=lambda *args, **kwargs: make_response(500)
+    ) as mock_post:
+        with pytest.raises(RetryableError, match="HTTP error"):
+            client.extract(make_blob(data=DOCUMENT))
+
+    assert mock_post.call_count == 3
+
+
+def test_extract__client_error_not_retried(client, mock_sleep):
+    with patch("requests.Session.post", return_value=make_response(400)) as mock_post:
+        with pytest.raises(ValueError, match="HTTP error"):
+            client.extract(make_blob(data=DOCUMENT))
+
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_retry_policy__retry_after_beyond_max_wait():
+    policy = RetryPolicy(max_retry_after=60)
+
+    assert policy.compute_delay(0, "3600") is None
+
+
+def test_limiter__failures_do_not_increase():
+    limiter = AdaptiveConcurrencyLimiter(8, initial_limit=2)
+
+    for _ in range(6):
+        with limiter.slot():
+            pass
+
+    assert limiter.limit == 2
+
+
+def test_extract__client_error_keeps_limit(tmp_path):
+    limiter = AdaptiveConcurrencyLimiter(8, initial_limit=2)
+    client = DataInsightClient(
+        api_key="api_key", resources_dir=tmp_path, limiter=limiter
+    )
+
+    with patch("requests.Session.post", return_value=make_response(400)):
+        for _ in range(6):
+            with pytest.raises(ValueError, match="HTTP error"):
+                client.extract(make_blob(data=DOCUMENT))
+
+    assert limiter.limit == 2
+
+
+def test_extract__retry_after_beyond_max_wait(tmp_path, mock_sleep):
+    client = DataInsightClient(
+        api_key="api_key",
+        resources_dir=tmp_path,
+        retry=RetryPolicy(max_retry_after=60),
+    )
+
+    with patch(
+        "requests.Session.post",
+        return_value=make_response(429, {"Retry-After": "3600"}),
+    ) as mock_post:
+        with pytest.raises(RetryableError, match="HTTP error"):
+            client.extract(make_blob(data=DOCUMENT))
+
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_called()
+
+
+def test_extract__chunk_iterator_not_retried(client, mock_sleep):
+    with patch(
+        "requests.Session.post", side_effect=requests.ConnectionError("reset")
+    ) as mock_post:
+        with pytest.raises(RetryableError, match="Failed to send request"):
+            client.extract(make_blob(stream=iter([DOCUMENT])))
+
+    assert mock_post.call_count == 1
@@ -0,0 +1,340 @@
+import io
+import struct
+import threading
+import warnings
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from polaris_ai_datainsight import AsyncDataInsightClient, DataInsightClient
+from polaris_ai_datainsight.utils.format_utils import OLE2_SIGNATURE, check_document
+from polaris_ai_datainsight.utils.http_utils import Blob
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+TEXT_DOCUMENT = "Plain text saved with a .docx extension".encode("utf-8")
+
+SECTOR_SIZE = 512
+MINI_SECTOR_SIZE = 64
+MINI_STREAM_CUTOFF = 4096
+FREE = NO_STREAM = 0xFFFFFFFF
+END_OF_CHAIN = 0xFFFFFFFE
+FAT_SECTOR = 0xFFFFFFFD
+
+
+def make_ole2(streams: dict) -> bytes:
+    """
+    Build a minimal OLE2 container with 512-byte sectors and a single FAT sector.
+    Streams smaller than 4096 bytes are stored in the mini stream.
+    """
+
+    def pad(data: bytes, size: int) -> bytes:
+        return data + b"\0" * (-len(data) % size)
+
+    mini_stream = b""
+    mini_fat = []
+    entries = []
+    for name, data in streams.items():
+        if len(data) < MINI_STREAM_CUTOFF:
+            start = len(mini_stream) // MINI_SECTOR_SIZE
+            count = -(-len(data) // MINI_SECTOR_SIZE)
+            mini_fat += [start + i + 1 for i in range(count - 1)] + [END_OF_CHAIN]
+            mini_stream += pad(data, MINI_SECTOR_SIZE)
+            entries.append((name, 2, start, len(data), None))
+        else:
+            entries.append((name, 2, None, len(data), pad(data, SECTOR_SIZE)))
+
+    fat = [FAT_SECTOR]
+    sectors = [b""]
+
+    def allocate(data: bytes) -> int:
+        start = len(sectors)
+        count = len(data) // SECTOR_SIZE
+        for i in range(count):
+            sectors.append(data[i * SECTOR_SIZE : (i + 1) * SECTOR_SIZE])
+            fat.append(start + i + 1 if i < count - 1 else END_OF_CHAIN)
+        return start
+
+    def directory_entry(name, entry_type, start, size, right):
+        encoded = (name + "\0").encode("utf-16-le")
+        return (
+            encoded.ljust(64, b"\0")
+            + struct.pack("<HBB3I", len(encoded), entry_type, 1, NO_STREAM, right, 1)
+            + b"\0" * 36
+            + struct.pack("<IQ", start, size)
+        )
+
+    mini_fat_data = pad(struct.pack(f"<{len(mini_fat)}I", *mini_fat), SECTOR_SIZE)
+    mini_stream_data = pad(mini_stream, SECTOR_SIZE)
+    entries = [
+        (name, entry_type, allocate(data) if start is None else start, size)
+        for name, entry_type, start, size, data in entries
+    ]
+    directory = [
+        directory_entry(
+            "Root Entry", 5, allocate(mini_stream_data), len(mini_stream), NO_STREAM
+        )
+    ]
+    for i, (name, entry_type, start, size) in enumerate(entries):
+        right = i + 2 if i + 1 < len(entries) else NO_STREAM
+        directory.append(directory_entry(name, entry_type, start, size, right))
+    first_dir_sector = allocate(pad(b"".join(directory), SECTOR_SIZE))
+    first_mini_fat_sector = allocate(mini_fat_data)
+
+    fat += [FREE] * (SECTOR_SIZE // 4 - len(fat))
+    sectors[0] = struct.pack(f"<{SECTOR_SIZE // 4}I", *fat)
+    header = (
+        OLE2_SIGNATURE
+        + b"\0" * 16
+        # Version 3, little-endian, 512-byte sectors, 64-byte mini sectors
+        + struct.pack("<HHHHH", 0x3E, 3, 0xFFFE, 9, 6)
+        + b"\0" * 6
+        + struct.pack(
+            "<9I",
+            0,
+            1,
+            first_dir_sector,
+            0,
+            MINI_STREAM_CUTOFF,
+            first_mini_fat_sector,
+            1,
+            END_OF_CHAIN,
+            0,
+        )
+        + struct.pack("<109I", 0, *([FREE] * 108))
+    )
+    return header + b"".join(sectors)
+
+
+def make_blob(data: bytes, filename: str) -> Blob:
+    return Blob.from_data(
+        data, mime_type="application/octet-stream", metadata={"filename": filename}
+    )
+
+
+def word_document(encrypted: bool) -> bytes:
+    # FIB: wIdent, nFib, unused, lid, pnNext, then the flags
+    flags = 0x0100 if encrypted else 0
+    return struct.pack("<HHHHHH", 0xA5EC, 0xC1, 0, 0x409, 0, flags).ljust(4096, b"\0")
+
+
+def workbook(encrypted: bool) -> bytes:
+    bof = struct.pack("<HH", 0x0809, 16) + b"\0" * 16
+    record = struct.pack("<HH", 0x002F if encrypted else 0x0042, 2) + b"\0\0"
+    return bof + record
+
+
+def hwp_file_header(encrypted: bool) -> bytes:
+    properties = 0x1 | (0x2 if encrypted else 0)
+    return (
+        b"HWP Document File".ljust(32, b"\0")
+        + struct.pack("<II", 0x05000300, properties)
+    ).ljust(256, b"\0")
+
+
+@pytest.fixture
+def client(tmp_path):
+    with DataInsightClient(api_key="api_key", resources_dir=tmp_path) as client:
+        yield client
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.parametrize(
+    "make_example",
+    [
+        lambda: Blob.from_path(EXAMPLE_DOC_PATH, "application/octet-stream"),
+        lambda: Blob.from_data(
+            EXAMPLE_DOC_PATH.read_bytes(), "application/octet-stream"
+        ),
+        lambda: Blob.from_stream(
+            io.BytesIO(EXAMPLE_DOC_PATH.read_bytes()), "application/octet-stream"
+        ),
+        lambda: Blob.from_stream(
+            iter([EXAMPLE_DOC_PATH.read_bytes()]), "application/octet-stream"
+        ),
+    ],
+)
+def test_check_document__valid_docx(make_example):
+    blob = make_example()
+    blob.metadata["filename"] = "example.docx"
+
+    check_document(blob, ".docx")
+
+    # The content is left in place for the upload
+    assert blob.read_bytes() == EXAMPLE_DOC_PATH.read_bytes()
+
+
+@pytest.mark.parametrize(
+    "extension, streams",
+    [
+        (".doc", {"WordDocument": word_document(encrypted=False)}),
+        (".xls", {"Workbook": workbook(encrypted=False)}),
+        (".ppt", {"PowerPoint Document": b"\0" * 100}),
+        (".hwp", {"FileHeader": hwp_file_header(encrypted=False)}),
+    ],
+)
+def test_check_document__valid_legacy_documents(extension, streams):
+    check_document(make_blob(make_ole2(streams), f"a{extension}"), extension)
+
+
+def test_check_document__seekable_stream_position(tmp_path):
+    stream = io.BytesIO(b"prefix" + EXAMPLE_DOC_PATH.read_bytes())
+    stream.seek(6)
+    blob = Blob.from_stream(stream, "application/octet-stream", {"filename": "a.docx"})
+
+    check_document(blob, ".docx")
+
+    assert stream.tell() == 6
+
+
+@pytest.mark.parametrize(
+    "data, filename, match",
+    [
+        (TEXT_DOCUMENT, "a.docx", "does not match"),
+        (EXAMPLE_DOC_PATH.read_bytes()[:2000], "a.docx", "truncated"),
+        # HWP 3.x documents are not OLE2 containers
+        (
+            b"HWP Document File V3.00 \x1a\x01\x02\x03\x04\x05",
+            "a.hwp",
+            "does not match",
+        ),
+    ],
+)
+def test_check_document__mismatch_warning(data, filename, match):
+    with pytest.warns(UserWarning, match=match):
+        check_document(make_blob(data, filename), Path(filename).suffix)
+
+
+def test_check_document__ole2_stream():
+    data = make_ole2({"WordDocument": word_document(encrypted=False)})
+    blob = Blob.from_stream(iter([data]), "application/octet-stream")
+    blob.metadata["filename"] = "a.doc"
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        check_document(blob, ".doc", strict=True)
+
+
+def test_client__upload_mismatch_with_warning(client):
+    with patch.object(client, "_download_response", side_effect=RuntimeError("sent")):
+        with pytest.warns(UserWarning, match="does not match"):
+            with pytest.raises(RuntimeError, match="sent"):
+                client.extract(make_blob(TEXT_DOCUMENT, "a.docx"))
+
+
+def test_client__preflight_disabled(tmp_path):
+    client = DataInsightClient(
+        api_key="api_key", resources_dir=tmp_path, preflight=False
+    )
+
+    with patch.object(client, "_download_response", side_effect=RuntimeError("sent")):
+        with pytest.raises(RuntimeError, match="sent"):
+            client.extract(make_blob(b"not a document", "a.docx"))
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+@pytest.mark.parametrize(
+    "data, filename, match",
+    [
+        (b"", "a.docx", "empty"),
+        (TEXT_DOCUMENT, "a.docx", "does not match"),
+        (EXAMPLE_DOC_PATH.read_bytes(), "a.hwpx", "does not match"),
+        (EXAMPLE_DOC_PATH.read_bytes(), "a.doc", "does not match"),
+        (EXAMPLE_DOC_PATH.read_bytes()[:2000], "a.docx", "truncated"),
+        (make_ole2({"FileHeader": hwp_file_header(False)}), "a.doc", "does not match"),
+        (make_ole2({"WordDocument": word_document(False)}), "a.docx", "does not match"),
+    ],
+)
+def test_check_document__rejected(data, filename, match):
+    with pytest.raises(ValueError, match=match):
+        check_document(make_blob(data, filename), Path(filename).suffix, strict=True)
+
+
+def test_check_document__empty_not_strict():
+    with pytest.raises(ValueError, match="empty"):
+        check_document(make_blob(b"", "a.docx"), ".docx")
+
+
+@pytest.mark.parametrize(
+    "extension, streams",
+    [
+        (".docx", {"EncryptionInfo": b"\0" * 100, "EncryptedPackage": b"\0" * 5000}),
+        (".doc", {"WordDocument": word_document(encrypted=True)}),
+        (".xls", {"Workbook": workbook(encrypted=True)}),
+        (".ppt", {"PowerPoint Document": b"\0" * 100, "EncryptedSummary": b"\0"}),
+        (".hwp", {"FileHeader": hwp_file_header(encrypted=True)}),
+    ],
+)
+def test_check_document__password_protected(extension, streams):
+    with pytest.raises(ValueError, match="password-protected"):
+        check_document(make_blob(make_ole2(streams), f"a{extension}"), extension)
+
+
+def test_check_document__password_protected_stream():
+    data = make_ole2({"EncryptionInfo": b"\0" * 100, "EncryptedPackage": b"\0" * 5000})
+    blob = Blob.from_stream(iter([data]), "application/octet-stream")
+    blob.metadata["filename"] = "a.docx"
+
+    with pytest.raises(ValueError, match="password-protected"):
+        check_document(blob, ".docx")
+
+
+def test_check_document__encrypted_zip_entry():
+    data = bytearray(EXAMPLE_DOC_PATH.read_bytes())
+    # Set the encryption bit of the first entry
+    data[6] |= 0x1
+
+    with pytest.raises(ValueError, match="password-protected"):
+        check_document(make_blob(bytes(data), "a.docx"), ".docx")
+
+
+def test_check_document__max_file_size():
+    blob = make_blob(EXAMPLE_DOC_PATH.read_bytes(), "a.docx")
+
+    with pytest.raises(ValueError, match="too large"):
+        check_document(blob, ".docx", max_file_size=100)
+
+
+def test_client__rejected_before_upload(tmp_path):
+    with DataInsightClient(
+        api_key="api_key", resources_dir=tmp_path, preflight="strict"
+    ) as client:
+        with patch("requests.Session.post") as mock_post:
+            with pytest.raises(ValueError, match="does not match"):
+                client.extract(make_blob(TEXT_DOCUMENT, "a.docx"))
+
+    mock_post.assert_not_called()
+
+
+def test_client__invalid_preflight(tmp_path):
+    with pytest.raises(ValueError, match="Invalid preflight"):
+        DataInsightClient(api_key="api_key", resources_dir=tmp_path, preflight="on")
+
+
+@pytest.mark.asyncio
+async def test_async_client__preflight_off_event_loop(tmp_path):
+    threads = []
+
+    def check_document_in_thread(*args, **kwargs):
+        threads.append(threading.current_thread())
+        raise ValueError("does not match")
+
+    async with AsyncDataInsightClient(
+        api_key="api_key", resources_dir=tmp_path
+    ) as client:
+        with patch(
+            "polaris_ai_datainsight.datainsight_client.check_document",
+            side_effect=check_document_in_thread,
+        ):
+            with pytest.raises(ValueError, match="does not match"):
+                await client.aextract(make_blob(TEXT_DOCUMENT, "a.docx"))
+
+    assert threads and threads[0] is not threading.main_thread()
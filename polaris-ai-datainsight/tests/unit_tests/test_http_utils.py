@@ -0,0 +1,143 @@
+import io
+import mmap
+from email.parser import BytesParser
+from pathlib import Path
+
+import pytest
+
+from polaris_ai_datainsight.utils.http_utils import (
+    Blob,
+    MultipartBody,
+    encode_multipart,
+)
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+EXAMPLE_DOC_MIME_TYPE = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+
+
+def _parse_file_field(body: bytes, content_type: str):
+    message = BytesParser().parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    (part,) = message.get_payload()
+    return part.get_filename(), part.get_content_type(), part.get_payload(decode=True)
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.parametrize(
+    "make_blob",
+    [
+        lambda metadata: Blob.from_path(
+            EXAMPLE_DOC_PATH, EXAMPLE_DOC_MIME_TYPE, metadata
+        ),
+        lambda metadata: Blob.from_data(
+            EXAMPLE_DOC_PATH.read_bytes(), EXAMPLE_DOC_MIME_TYPE, metadata
+        ),
+        lambda metadata: Blob.from_stream(
+            io.BytesIO(EXAMPLE_DOC_PATH.read_bytes()), EXAMPLE_DOC_MIME_TYPE, metadata
+        ),
+        lambda metadata: Blob.from_data(
+            memoryview(EXAMPLE_DOC_PATH.read_bytes()), EXAMPLE_DOC_MIME_TYPE, metadata
+        ),
+    ],
+)
+def test_encode_multipart__sized_body(make_blob):
+    blob = make_blob({"filename": EXAMPLE_DOC_PATH.name})
+
+    body, content_type = encode_multipart(blob, chunk_size=1024)
+
+    # Body size is known up front, so it can be sent with Content-Length
+    assert isinstance(body, MultipartBody)
+    chunks = list(body)
+    assert len(body) == sum(len(chunk) for chunk in chunks)
+
+    filename, mime_type, payload = _parse_file_field(b"".join(chunks), content_type)
+    assert filename == EXAMPLE_DOC_PATH.name
+    assert mime_type == EXAMPLE_DOC_MIME_TYPE
+    assert payload == EXAMPLE_DOC_PATH.read_bytes()
+
+
+def test_encode_multipart__chunk_iterator():
+    data = EXAMPLE_DOC_PATH.read_bytes()
+    chunks = (data[i : i + 1000] for i in range(0, len(data), 1000))
+    blob = Blob.from_stream(
+        chunks, EXAMPLE_DOC_MIME_TYPE, {"filename": EXAMPLE_DOC_PATH.name}
+    )
+
+    body, content_type = encode_multipart(blob)
+
+    # Size is unknown, so the body is sent with chunked transfer encoding
+    assert blob.size is None
+    assert not isinstance(body, MultipartBody)
+    _, _, payload = _parse_file_field(b"".join(body), content_type)
+    assert payload == data
+
+
+def test_from_path__lazy_read(tmp_path: Path):
+    path = tmp_path / "example.docx"
+    path.write_bytes(b"before")
+
+    blob = Blob.from_path(path, EXAMPLE_DOC_MIME_TYPE)
+    path.write_bytes(b"after")
+
+    # The file is only read when the blob is consumed
+    assert blob.read_bytes() == b"after"
+
+
+def test_from_path__map_data_on_access():
+    blob = Blob.from_path(EXAMPLE_DOC_PATH, EXAMPLE_DOC_MIME_TYPE)
+
+    # The file is mapped, not copied, on first access
+    assert isinstance(blob.data, mmap.mmap)
+    assert blob.data is blob.data
+    assert blob.data[:] == EXAMPLE_DOC_PATH.read_bytes()
+    assert blob.size == EXAMPLE_DOC_PATH.stat().st_size
+
+    blob.close()
+    assert blob.read_bytes() == EXAMPLE_DOC_PATH.read_bytes()
+
+
+def test_from_data__zero_copy_memoryview():
+    data = bytearray(b"0123456789")
+    blob = Blob.from_data(memoryview(data)[2:8], EXAMPLE_DOC_MIME_TYPE)
+
+    assert blob.size == 6
+    assert list(blob.iter_chunks(chunk_size=4)) == [b"2345", b"67"]
+
+    # The blob shares the buffer of the caller
+    data[2:4] = b"ab"
+    assert blob.read_bytes() == b"ab4567"
+
+
+def test_replayable():
+    assert Blob.from_data(b"data", EXAMPLE_DOC_MIME_TYPE).replayable
+    assert Blob.from_path(EXAMPLE_DOC_PATH, EXAMPLE_DOC_MIME_TYPE).replayable
+    assert Blob.from_stream(io.BytesIO(b"data"), EXAMPLE_DOC_MIME_TYPE).replayable
+    assert not Blob.from_stream(iter([b"data"]), EXAMPLE_DOC_MIME_TYPE).replayable
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_blob__several_sources():
+    with pytest.raises(ValueError):
+        Blob(data=b"data", path=EXAMPLE_DOC_PATH, mimetype=EXAMPLE_DOC_MIME_TYPE)
+
+
+def test_from_data__invalid_data():
+    with pytest.raises(ValueError):
+        Blob.from_data("text", EXAMPLE_DOC_MIME_TYPE)
+
+
+@pytest.mark.parametrize("stream", [None, b"bytes", "text", 1])
+def test_from_stream__invalid_stream(stream):
+    with pytest.raises(ValueError):
+        Blob.from_stream(stream, EXAMPLE_DOC_MIME_TYPE)
@@ -0,0 +1,55 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["requests", "httpx", "pydantic", "langchain_core"]
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import polaris_ai_datainsight",
+        "from polaris_ai_datainsight import PolarisAIDataInsightExtractor",
+    ],
+)
+def test_import__no_heavy_dependencies(statement):
+    # Import time itself is checked by `make import_time`, not by the unit tests
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys; {statement};"
+            f" print(sorted(set({HEAVY_MODULES!r}) & set(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert result.stdout.strip() == "[]"
+
+
+def test_import__lazy_public_names():
+    import polaris_ai_datainsight
+
+    for name in polaris_ai_datainsight.__all__:
+        assert getattr(polaris_ai_datainsight, name) is not None
+    assert set(polaris_ai_datainsight.__all__) <= set(dir(polaris_ai_datainsight))
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_import__unknown_name():
+    import polaris_ai_datainsight
+
+    with pytest.raises(AttributeError):
+        _ = polaris_ai_datainsight.NoSuchName
@@ -0,0 +1,105 @@
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from polaris_ai_datainsight.utils.json_utils import (
+    JSON_CODECS,
+    JSONCodec,
+    get_json_codec,
+    iter_json_array,
+)
+
+INSTALLED_CODECS = []
+for name, codec_class in JSON_CODECS.items():
+    try:
+        INSTALLED_CODECS.append(codec_class())
+    except ImportError:
+        pass
+
+
+@pytest.fixture(params=[True, False], ids=["ijson", "json"])
+def ijson_installed(request):
+    if request.param:
+        yield
+    else:
+        with patch.dict("sys.modules", {"ijson": None}):
+            yield
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_iter_json_array(ijson_installed):
+    f = io.BytesIO(b'{"docName": "a", "pages": [{"n": 1, "w": 1.5}, {"n": 2}]}')
+
+    assert list(iter_json_array(f, "pages")) == [{"n": 1, "w": 1.5}, {"n": 2}]
+
+
+def test_iter_json_array__empty_array(ijson_installed):
+    f = io.BytesIO(b'{"pages": [], "docName": "a"}')
+
+    assert list(iter_json_array(f, "pages")) == []
+
+
+@pytest.mark.parametrize("codec", INSTALLED_CODECS, ids=lambda codec: codec.name)
+def test_json_codec__round_trip(codec):
+    data = {"text": "문서", "pages": [{"n": 1, "w": 1.5, "ok": True, "src": None}]}
+
+    assert codec.loads(codec.dumps(data)) == data
+    assert codec.loads(codec.dumps(data).encode("utf-8")) == data
+
+
+@pytest.mark.parametrize("codec", INSTALLED_CODECS, ids=lambda codec: codec.name)
+def test_json_codec__dumps_default(codec):
+    assert codec.loads(codec.dumps({"src": Path("a.png")}, default=str)) == {
+        "src": "a.png"
+    }
+
+
+def test_get_json_codec__fallback_to_stdlib():
+    with patch.dict("sys.modules", {"orjson": None, "msgspec": None}):
+        assert type(get_json_codec()) is JSONCodec
+
+
+def test_get_json_codec__instance():
+    codec = JSONCodec()
+
+    assert get_json_codec(codec) is codec
+    assert get_json_codec("json").name == "json"
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+@pytest.mark.parametrize("codec", INSTALLED_CODECS, ids=lambda codec: codec.name)
+def test_json_codec__invalid_json(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b'{"pages": ')
+
+
+def test_get_json_codec__unknown_codec():
+    with pytest.raises(ValueError, match="Invalid json_codec"):
+        get_json_codec("simplejson")
+
+
+def test_iter_json_array__invalid_json(ijson_installed):
+    f = io.BytesIO(b'{"pages": [{"n": 1}, ')
+
+    with pytest.raises(ValueError, match="Failed to decode JSON response"):
+        list(iter_json_array(f, "pages"))
+
+
+@pytest.mark.parametrize(
+    "document", [b'{"docName": "a"}', b'{"pages": {"n": 1}}', b'[{"n": 1}]']
+)
+def test_iter_json_array__missing_key(ijson_installed, document):
+    f = io.BytesIO(document)
+
+    with pytest.raises(ValueError, match="Invalid JSON data structure"):
+        list(iter_json_array(f, "pages"))
@@ -0,0 +1,186 @@
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from polaris_ai_datainsight import PolarisAIDataInsightExtractor
+from polaris_ai_datainsight.utils.table_utils import table_rows, to_columnar
+
+EXAMPLE_DOC_PATH = Path(__file__).parent.parent / "examples" / "example.docx"
+
+CSV_TABLE = "name,count,price,note\na,1,1.5,\nb,2,,x\nc,3,2.5,y\n"
+
+
+def make_cell(row: int, column: int, text: str, rowspan: int = 1, colspan: int = 1):
+    return {
+        "metrics": {
+            "rowaddr": row,
+            "coladdr": column,
+            "rowspan": rowspan,
+            "colspan": colspan,
+        },
+        "para": [{"content": [{"text": text}]}] if text else [],
+    }
+
+
+JSON_TABLE = [
+    make_cell(0, 0, "region"),
+    make_cell(0, 1, "sales"),
+    make_cell(1, 0, "north", rowspan=2),
+    make_cell(1, 1, "10"),
+    make_cell(2, 1, "20"),
+]
+
+
+######################
+# -- SUCCESS TEST -- #
+######################
+
+
+def test_table_rows__json_cells():
+    assert table_rows({"json": JSON_TABLE}) == [
+        ["region", "sales"],
+        ["north", "10"],
+        ["", "20"],
+    ]
+
+
+def test_to_columnar__numpy_dtypes():
+    columns = to_columnar({"csv": CSV_TABLE}, backend="numpy")
+
+    assert list(columns) == ["name", "count", "price", "note"]
+    assert columns["count"].dtype == np.int64
+    assert columns["count"].sum() == 6
+    assert columns["price"].dtype == np.float64
+    assert np.isnan(columns["price"][1])
+    assert np.nansum(columns["price"]) == 4.0
+    assert columns["name"].tolist() == ["a", "b", "c"]
+    assert columns["note"].tolist() == ["", "x", "y"]
+
+
+def test_to_columnar__arrow_dtypes():
+    table = to_columnar({"csv": CSV_TABLE}, backend="arrow")
+
+    assert isinstance(table, pa.Table)
+    assert table.column_names == ["name", "count", "price", "note"]
+    assert table.schema.field("count").type == pa.int64()
+    assert table.schema.field("price").type == pa.float64()
+    assert table.column("price").null_count == 1
+    assert table.schema.field("name").type == pa.string()
+
+
+def test_to_columnar__without_header():
+    columns = to_columnar("1,2\n3,4", header=False)
+
+    assert list(columns) == ["column_0", "column_1"]
+    assert columns["column_1"].tolist() == [2, 4]
+
+
+def test_to_columnar__column_names():
+    # Missing and repeated names, ragged rows
+    columns = to_columnar("a,,a\n1,2,3,4\n5")
+
+    assert list(columns) == ["a", "column_1", "a_1", "column_3"]
+    assert columns["a"].tolist() == [1, 5]
+    assert columns["column_3"].dtype == np.float64
+
+
+def test_to_columnar__chart_content():
+    table = to_columnar({"src": "chart.png", "csv": "x,y\n1,0.5\n2,1.5"}, "arrow")
+
+    assert table.column("y").to_pylist() == [0.5, 1.5]
+
+
+def test_to_columnar__large_sheet():
+    rows = "\n".join(f"{i},{i * 0.5},label {i}" for i in range(100_000))
+    columns = to_columnar("id,value,label\n" + rows)
+
+    assert columns["id"].dtype == np.int64
+    assert columns["value"].sum() == sum(i * 0.5 for i in range(100_000))
+
+
+@pytest.mark.parametrize("backend", ["numpy", "arrow"])
+def test_to_columnar__quoted_fields(backend):
+    columns = to_columnar('city,count\n"Seoul, KR",1\n"a ""b""",2\n', backend)
+    if backend == "arrow":
+        columns = columns.to_pydict()
+
+    assert list(columns["city"]) == ["Seoul, KR", 'a "b"']
+    assert list(columns["count"]) == [1, 2]
+
+
+def test_to_columnar__blank_lines():
+    # A blank line is a row of empty cells
+    columns = to_columnar("x,y\r\n\r\n1,2\r\n")
+    table = to_columnar("x,y\r\n\r\n1,2\r\n", backend="arrow")
+
+    assert np.isnan(columns["x"][0]) and columns["x"][1] == 1
+    assert table.column("x").to_pylist() == [None, 1]
+
+
+def test_to_columnar__numpy_csv_reader():
+    with patch("numpy.loadtxt", wraps=np.loadtxt) as loadtxt:
+        columns = to_columnar('city,count\n"Seoul, KR",1\nBusan,2\n')
+
+    loadtxt.assert_called_once()
+    assert columns["city"].tolist() == ["Seoul, KR", "Busan"]
+    assert columns["count"].tolist() == [1, 2]
+
+
+def test_to_columnar__arrow_csv_reader():
+    import pyarrow.csv
+
+    with patch("pyarrow.csv.read_csv", wraps=pyarrow.csv.read_csv) as read_csv:
+        table = to_columnar({"csv": CSV_TABLE}, backend="arrow")
+
+    read_csv.assert_called_once()
+    # Dates and booleans are left as strings, like with NumPy
+    assert to_columnar("d,b\n2024-01-01,true", "arrow").schema.types == [
+        pa.string(),
+        pa.string(),
+    ]
+    assert table.column("count").to_pylist() == [1, 2, 3]
+
+
+def test_extractor__extract_tables():
+    extractor = PolarisAIDataInsightExtractor(
+        file_path=EXAMPLE_DOC_PATH, api_key="api_key"
+    )
+    pages = [
+        {
+            "elements": [
+                {"id": 0, "type": "text", "content": {"text": "Title"}},
+                {"id": 1, "type": "table", "content": {"json": JSON_TABLE}},
+            ]
+        },
+        {"elements": [{"id": 2, "type": "chart", "content": {"csv": "x,y\n1,2"}}]},
+    ]
+
+    with patch.object(extractor, "iter_pages", return_value=iter(pages)):
+        tables = extractor.extract_tables(backend="arrow")
+
+    assert list(tables) == ["di.table.1", "di.chart.2"]
+    assert tables["di.table.1"].column("sales").to_pylist() == [10, 20]
+
+
+######################
+# -- FAILURE TEST -- #
+######################
+
+
+def test_to_columnar__invalid_backend():
+    with pytest.raises(ValueError, match="Invalid backend"):
+        to_columnar(CSV_TABLE, backend="pandas")
+
+
+def test_to_columnar__missing_content():
+    with pytest.raises(ValueError, match="Table content not found"):
+        to_columnar({"src": "table.png"})
+
+
+def test_to_columnar__backend_not_installed():
+    with patch.dict("sys.modules", {"pyarrow": None}):
+        with pytest.raises(ImportError, match="pip install pyarrow"):
+            to_columnar(CSV_TABLE, backend="arrow")